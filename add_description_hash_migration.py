@@ -0,0 +1,137 @@
+"""
+Migration: Add description_sha1 Column to job_listings for Content Dedup
+
+Purpose:
+- Add description_sha1 column (SHA-1 hex of description, 40 chars)
+- Backfill hashes for existing jobs
+- Create btree index so content duplicate checks compare a fixed-width
+  hash instead of the full TEXT description
+
+This script is idempotent - safe to run multiple times.
+"""
+
+import asyncio
+from sqlalchemy import text
+from core.database import AsyncSessionLocal
+from infrastructure.persistence.repositories.job_listing import hash_description
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+async def add_description_hash_column():
+    """Add description_sha1 column to job_listings table"""
+
+    async_session = AsyncSessionLocal()
+    try:
+        print("Adding description_sha1 column to job_listings table...")
+
+        alter_table_query = text("""
+            ALTER TABLE job_listings
+            ADD COLUMN IF NOT EXISTS description_sha1 VARCHAR(40);
+        """)
+
+        await async_session.execute(alter_table_query)
+        await async_session.commit()
+        print("✅ Column added successfully")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error adding column: {e}")
+        await async_session.rollback()
+        return False
+
+    finally:
+        await async_session.close()
+
+
+async def backfill_description_hashes():
+    """Compute description_sha1 for jobs that don't have one yet"""
+
+    async_session = AsyncSessionLocal()
+    try:
+        print("Backfilling description hashes...")
+        total = 0
+
+        while True:
+            result = await async_session.execute(
+                text("""
+                    SELECT id, description
+                    FROM job_listings
+                    WHERE description_sha1 IS NULL
+                    LIMIT :limit;
+                """),
+                {"limit": BACKFILL_BATCH_SIZE}
+            )
+            rows = result.fetchall()
+            if not rows:
+                break
+
+            await async_session.execute(
+                text("UPDATE job_listings SET description_sha1 = :hash WHERE id = :id;"),
+                [{"id": job_id, "hash": hash_description(description)} for job_id, description in rows]
+            )
+            await async_session.commit()
+
+            total += len(rows)
+            print(f"  • {total} jobs hashed")
+
+        print(f"✅ Backfilled {total} jobs")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error backfilling hashes: {e}")
+        await async_session.rollback()
+        return False
+
+    finally:
+        await async_session.close()
+
+
+async def add_description_hash_index():
+    """Add btree index on job_listings.description_sha1 if it doesn't exist"""
+
+    async_session = AsyncSessionLocal()
+    try:
+        create_index_query = text("""
+            CREATE INDEX IF NOT EXISTS ix_job_listings_description_sha1
+            ON job_listings(description_sha1);
+        """)
+
+        await async_session.execute(create_index_query)
+        await async_session.commit()
+        print("✅ Index created successfully on job_listings.description_sha1")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error creating index: {e}")
+        return False
+
+    finally:
+        await async_session.close()
+
+
+async def main():
+    """Run migration"""
+    print("=" * 60)
+    print("Migration: Add description_sha1 to job_listings")
+    print("=" * 60)
+    print()
+
+    success = (
+        await add_description_hash_column()
+        and await backfill_description_hashes()
+        and await add_description_hash_index()
+    )
+
+    print()
+    print("=" * 60)
+    if success:
+        print("✅ Migration Complete - Content dedup uses description hashes")
+    else:
+        print("❌ Migration Failed")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
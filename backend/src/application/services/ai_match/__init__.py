@@ -3,7 +3,7 @@ AI Match Service Interface
 Calculates AI-powered job match scores using embeddings
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 from uuid import UUID
 
 from domain.entities import JobListing
@@ -37,7 +37,8 @@ class IAIMatchService(ABC):
     async def batch_calculate_scores(
         self,
         resume_text: str,
-        jobs: List[JobListing]
+        jobs: List[JobListing],
+        user_id: Optional[UUID] = None
     ) -> Dict[UUID, MatchScore]:
         """
         Calculate match scores for multiple jobs (optimized)
@@ -45,6 +46,7 @@ class IAIMatchService(ABC):
         Args:
             resume_text: Parsed resume text
             jobs: List of Job entities
+            user_id: Optional user ID whose cached resume embedding can be reused
             
         Returns:
             Dict mapping job_id to MatchScore
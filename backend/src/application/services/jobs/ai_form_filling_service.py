@@ -3,16 +3,39 @@ AI Form Filling Service
 Generates intelligent answers for Easy Apply form fields using resume data and AI
 """
 import json
-from typing import Optional, Dict, List, Any
+import re
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, AsyncIterator, Tuple
 from uuid import UUID
 from dataclasses import dataclass
 from loguru import logger
 
-from application.services.jobs.form_answer_generator import FormAnswerContext, FormAnswerGenerator
+from application.services.jobs.form_answer_generator import (
+    FormAnswerContext,
+    FormAnswerGenerator,
+    detect_field_type,
+)
 from application.services.jobs.resume_context_manager import ResumeContextManager
 from domain.entities import User
 
 
+# Collapses runs of whitespace in form labels
+_WS = re.compile(r"\s+")
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+# Prompt input ceilings - keep TTFT and token cost bounded regardless of JD length
+MAX_PROMPT_CHARS = 2000       # job description window sent to the LLM
+MAX_SUMMARY_CHARS = 500
+MAX_RESUME_ENTRIES = 3        # experience / education entries
+
+
+@lru_cache(maxsize=8192)
+def _norm_label(label: str) -> str:
+    """Normalize a form label once (lowercase, trimmed, single-spaced)"""
+    return _WS.sub(" ", label.strip().lower())
+
+
 @dataclass
 class FormField:
     """Represents a form field that needs to be filled"""
@@ -40,6 +63,8 @@ class AIFormFillingService:
         """Initialize AI form filling service"""
         self.form_generator = FormAnswerGenerator()
         self.resume_manager: Optional[ResumeContextManager] = None
+        # (job_description, lowercased, line offsets) - indexed once per form
+        self._jd_index: Optional[Tuple[str, str, List[int]]] = None
     
     def prepare_resume_context(self, user: User) -> ResumeContextManager:
         """
@@ -57,7 +82,7 @@ class AIFormFillingService:
         if isinstance(resume_data, str):
             try:
                 resume_data = json.loads(resume_data)
-            except (json.JSONDecodeError, Exception) as e:
+            except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse resume JSON: {e}")
                 resume_data = {}
         
@@ -85,23 +110,47 @@ class AIFormFillingService:
         logger.debug("Form field extraction would use selenium/vision extractor")
         return []
     
-    async def generate_answer_for_field(
+    async def prepare_job_context(
         self,
-        field: FormField,
         user: User,
         job_title: str,
         job_description: str,
-        job_company: str
-    ) -> str:
+        job_company: str,
+        focus: Optional[str] = None
+    ) -> FormAnswerContext:
         """
-        Generate intelligent answer for a single form field.
+        Build the per-job answer context once for reuse across all fields.
         
         Args:
-            field: Form field to fill
             user: User entity with resume data
             job_title: Job title being applied for
             job_description: Job description text
             job_company: Company name
+            focus: Optional field label used to pick the most relevant JD window
+            
+        Returns:
+            FormAnswerContext shared by every field of the form
+        """
+        if not self.resume_manager:
+            self.prepare_resume_context(user)
+        
+        return self._build_form_context(
+            user, job_title, job_description, job_company, focus=focus
+        )
+    
+    async def generate_answer_with_context(
+        self,
+        field: FormField,
+        context: FormAnswerContext,
+        user: User
+    ) -> str:
+        """
+        Generate intelligent answer for a single form field.
+        
+        Args:
+            field: Form field to fill
+            context: Job context from prepare_job_context
+            user: User entity with resume data
             
         Returns:
             Generated answer for the field
@@ -109,17 +158,16 @@ class AIFormFillingService:
         if not self.resume_manager:
             self.prepare_resume_context(user)
         
-        logger.debug(f"Generating answer for field: {field.label}")
+        logger.debug("Generating answer for field: {}", field.label)
         
-        # Try to identify field type from label
-        from application.services.jobs.form_answer_generator import detect_field_type
-        field_category = detect_field_type(field.label)
+        # Normalize label once - reused for type detection and context routing
+        label = _norm_label(field.label)
         
-        # Build context for AI
-        context = self._build_form_context(user, job_title, job_description, job_company)
+        # Try to identify field type from label
+        field_category = detect_field_type(label)
         
         # Get relevant resume context
-        resume_context = self.resume_manager.get_relevant_context(field.label)
+        resume_context = self.resume_manager.get_relevant_context(label)
         
         # Generate answer based on field type
         if field_category == "cover_letter":
@@ -143,21 +191,54 @@ class AIFormFillingService:
             # Generic question answering
             answer = await self.form_generator.answer_custom_question(field.label, context)
         
-        logger.debug(f"Generated answer ({len(answer)} chars) for: {field.label}")
+        logger.debug("Generated answer ({} chars) for: {}", len(answer), field.label)
         return answer
     
-    async def generate_answers_batch(
+    async def generate_answer_for_field(
+        self,
+        field: FormField,
+        user: User,
+        job_title: str,
+        job_description: str,
+        job_company: str
+    ) -> str:
+        """
+        Generate intelligent answer for a single form field.
+        
+        Deprecated convenience wrapper - rebuilds the job context on every
+        call. When filling several fields, call prepare_job_context once and
+        use generate_answer_with_context instead.
+        
+        Args:
+            field: Form field to fill
+            user: User entity with resume data
+            job_title: Job title being applied for
+            job_description: Job description text
+            job_company: Company name
+            
+        Returns:
+            Generated answer for the field
+        """
+        context = await self.prepare_job_context(
+            user, job_title, job_description, job_company,
+            focus=_norm_label(field.label)
+        )
+        return await self.generate_answer_with_context(field, context, user)
+    
+    async def generate_answers_stream(
         self,
         fields: List[FormField],
         user: User,
         job_title: str,
         job_description: str,
         job_company: str
-    ) -> Dict[str, str]:
+    ) -> AsyncIterator[Tuple[str, str]]:
         """
-        Generate answers for multiple form fields efficiently.
+        Generate answers for form fields, yielding each as soon as it is ready.
         
-        Uses batch LLM calls to reduce API costs (80% reduction vs per-field).
+        Predefined answers are yielded immediately; LLM answers are produced in
+        small concurrent batches so callers can start filling the form before
+        the last question has been answered.
         
         Args:
             fields: List of form fields to fill
@@ -166,52 +247,77 @@ class AIFormFillingService:
             job_description: Job description
             job_company: Company name
             
-        Returns:
-            Dictionary mapping field_id to answer
+        Yields:
+            (field_id, answer) tuples in completion order
         """
         if not fields:
-            return {}
+            return
         
         if not self.resume_manager:
             self.prepare_resume_context(user)
         
-        logger.info(f"Generating answers for {len(fields)} form fields")
+        logger.info("Generating answers for {} form fields", len(fields))
         
         # Separate fields by category for efficient processing
         form_questions = []
-        field_map = {}
         
         for field in fields:
-            from application.services.jobs.form_answer_generator import detect_field_type
-            category = detect_field_type(field.label)
+            category = detect_field_type(_norm_label(field.label))
             
             # Skip fields with predefined answers
             if category in ["salary", "availability", "sponsorship", "relocation", "remote"]:
-                field_map[field.field_id] = self.resume_manager.get_default_answer(category)
+                yield field.field_id, self.resume_manager.get_default_answer(category)
             else:
                 form_questions.append((field.field_id, field.label))
         
-        # Generate answers for remaining questions using batch LLM
+        # Generate answers for remaining questions using batched LLM calls
         if form_questions:
-            context = self._build_form_context(user, job_title, job_description, job_company)
             resume_context = self._compress_resume_for_batch(user)
             
-            # Batch call to LLM
             question_texts = [label for _, label in form_questions]
-            batch_answers = await self.form_generator.batch_answer_questions(
+            async for idx, answer in self.form_generator.batch_answer_questions_stream(
                 questions=question_texts,
                 resume_context=resume_context,
                 job_title=job_title,
                 job_company=job_company
-            )
-            
-            # Map answers back to field IDs
-            for idx, (field_id, _) in enumerate(form_questions):
-                answer_key = str(idx + 1)
-                if answer_key in batch_answers:
-                    field_map[field_id] = batch_answers[answer_key]
+            ):
+                yield form_questions[idx][0], answer
+    
+    async def generate_answers_batch(
+        self,
+        fields: List[FormField],
+        user: User,
+        job_title: str,
+        job_description: str,
+        job_company: str
+    ) -> Dict[str, str]:
+        """
+        Generate answers for multiple form fields efficiently.
+        
+        Collects the output of generate_answers_stream into a dict for
+        callers that need every answer before proceeding.
         
-        logger.info(f"Generated {len(field_map)} answers for form fields")
+        Args:
+            fields: List of form fields to fill
+            user: User entity with resume data
+            job_title: Job title
+            job_description: Job description
+            job_company: Company name
+            
+        Returns:
+            Dictionary mapping field_id to answer (unanswered fields are absent)
+        """
+        # Preallocate in form order; answers arrive in completion order
+        field_map = dict.fromkeys((f.field_id for f in fields), "")
+        async for field_id, answer in self.generate_answers_stream(
+            fields, user, job_title, job_description, job_company
+        ):
+            field_map[field_id] = answer
+        
+        # Drop fields nothing was generated for, keeping form order
+        field_map = {field_id: answer for field_id, answer in field_map.items() if answer}
+        if field_map:
+            logger.info("Generated {} answers for form fields", len(field_map))
         return field_map
     
     def _build_form_context(
@@ -219,16 +325,20 @@ class AIFormFillingService:
         user: User,
         job_title: str,
         job_description: str,
-        job_company: str
+        job_company: str,
+        focus: Optional[str] = None
     ) -> FormAnswerContext:
         """
         Build FormAnswerContext from user and job data.
         
+        Oversize inputs are clipped so prompt size stays bounded.
+        
         Args:
             user: User entity
             job_title: Job title
             job_description: Job description
             job_company: Company name
+            focus: Optional field label used to pick the most relevant JD window
             
         Returns:
             FormAnswerContext for AI generation
@@ -237,21 +347,64 @@ class AIFormFillingService:
         if isinstance(resume_data, str):
             try:
                 resume_data = json.loads(resume_data)
-            except:
+            except json.JSONDecodeError:
                 resume_data = {}
         
+        summary = resume_data.get("summary", "") or ""
+        if isinstance(summary, str):
+            summary = summary[:MAX_SUMMARY_CHARS]
+        
         return FormAnswerContext(
             job_title=job_title,
             company=job_company,
-            job_description=job_description,
+            job_description=self._clip_job_description(job_description or "", focus),
             user_name=user.full_name,
             user_email=str(user.email),
-            resume_summary=resume_data.get("summary", ""),
+            resume_summary=summary,
             skills=resume_data.get("skills", []),
-            experience=resume_data.get("experience", []),
-            education=resume_data.get("education", [])
+            experience=(resume_data.get("experience") or [])[:MAX_RESUME_ENTRIES],
+            education=(resume_data.get("education") or [])[:MAX_RESUME_ENTRIES]
         )
     
+    def _clip_job_description(self, job_description: str, focus: Optional[str] = None) -> str:
+        """
+        Clip job description to MAX_PROMPT_CHARS.
+        
+        When a focus label is given, the window with the highest keyword
+        overlap with the label is chosen; otherwise the head of the JD is kept.
+        
+        Args:
+            job_description: Full job description
+            focus: Optional field label
+            
+        Returns:
+            Job description window of at most MAX_PROMPT_CHARS characters
+        """
+        if len(job_description) <= MAX_PROMPT_CHARS:
+            return job_description
+        
+        keywords = {w for w in _WORD.findall(focus.lower()) if len(w) > 3} if focus else set()
+        if not keywords:
+            return job_description[:MAX_PROMPT_CHARS]
+        
+        # Index the JD once per form - every field of the form shares it
+        if self._jd_index is None or self._jd_index[0] is not job_description:
+            offsets = [0]
+            offsets.extend(m.end() for m in re.finditer(r"\n+", job_description))
+            self._jd_index = (job_description, job_description.lower(), offsets)
+        _, jd_lower, offsets = self._jd_index
+        
+        best_start, best_score = 0, 0
+        for start in offsets:
+            window = jd_lower[start:start + MAX_PROMPT_CHARS]
+            score = sum(1 for kw in keywords if kw in window)
+            if score > best_score:
+                best_start, best_score = start, score
+            if start + MAX_PROMPT_CHARS >= len(jd_lower):
+                break
+        
+        return job_description[best_start:best_start + MAX_PROMPT_CHARS]
+    
     def _extract_from_resume(self, field_type: str, user: User) -> str:
         """
         Extract specific information from resume.
@@ -267,7 +420,7 @@ class AIFormFillingService:
         if isinstance(resume_data, str):
             try:
                 resume_data = json.loads(resume_data)
-            except:
+            except json.JSONDecodeError:
                 resume_data = {}
         
         if field_type == "years_experience":
@@ -309,7 +462,7 @@ class AIFormFillingService:
         if isinstance(resume_data, str):
             try:
                 resume_data = json.loads(resume_data)
-            except:
+            except json.JSONDecodeError:
                 resume_data = {}
         
         parts = []
@@ -369,7 +522,7 @@ class AIFormFillingService:
         
         try:
             return json.loads(ai_response)
-        except (json.JSONDecodeError, Exception) as e:
+        except json.JSONDecodeError as e:
             logger.warning(f"Failed to deserialize AI responses: {e}")
             return {}
     
@@ -408,13 +561,16 @@ class AIFormFillingService:
         return False
 
 
-# Global service instance
-_service: Optional[AIFormFillingService] = None
+# Context-scoped service instance - each asyncio task (e.g. one worker job)
+# gets its own service, so resume/answer state never leaks across users
+_service_cv: ContextVar[AIFormFillingService] = ContextVar("ai_form_filling_service")
 
 
 def get_ai_form_filling_service() -> AIFormFillingService:
-    """Get or create the global AI form filling service"""
-    global _service
-    if _service is None:
-        _service = AIFormFillingService()
-    return _service
+    """Get or create the AI form filling service for the current context"""
+    try:
+        return _service_cv.get()
+    except LookupError:
+        service = AIFormFillingService()
+        _service_cv.set(service)
+        return service
@@ -5,12 +5,17 @@ Handles background job discovery without blocking the HTTP request
 import asyncio
 import json
 import random
+import re
+import time
 from uuid import uuid4, UUID
-from datetime import datetime
-from typing import Optional, Set, List
-from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timezone
+from typing import Optional, Set, FrozenSet, List
+from loguru import logger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from infrastructure.persistence.repositories.job_listing import JobListingRepository
+from infrastructure.persistence.models.job_listing import JobListingModel
+from infrastructure.persistence.models.user_job import UserJobModel
+from infrastructure.persistence.repositories.job_listing import JobListingRepository, hash_description
 from infrastructure.persistence.repositories.user_job import UserJobRepository
 from infrastructure.persistence.repositories.job_filter import JobFilterRepository
 from infrastructure.services.ai_match_service import AIMatchService
@@ -21,11 +26,20 @@ from infrastructure.services.job_stream_manager import (
 )
 from application.services.jobs.job_scraper_service import JobScraperService
 from domain.entities.job_listing import JobListing
-from domain.entities.user_job import UserJob
 from domain.enums import ApplicationStatus, WorkType
 from core.database import AsyncSessionLocal
 
 
+# scheme://netloc/path - everything before the query string / fragment
+_URL_STRIP_QUERY = re.compile(r"^([^?#]+)")
+
+# Scraped work_type string -> WorkType (unknown values map to None)
+_WORK_TYPE_BY_VALUE = {work_type.value: work_type for work_type in WorkType}
+
+# Matches rate limit errors (429, rate limit, too many requests) in one pass
+_RATE_LIMIT_RE = re.compile(r"429|rate|too many", re.IGNORECASE)
+
+
 class AsyncJobDiscoveryTask:
     """
     Background task for discovering jobs asynchronously.
@@ -33,6 +47,13 @@ class AsyncJobDiscoveryTask:
     Publishes newly discovered jobs via SSE stream manager.
     """
     
+    # New jobs are buffered and written in one transaction per batch
+    BATCH_SIZE = 20
+    # SSE job events are sent in groups of up to EVENT_BATCH_SIZE, or after
+    # EVENT_FLUSH_INTERVAL seconds, whichever comes first
+    EVENT_BATCH_SIZE = 10
+    EVENT_FLUSH_INTERVAL = 0.5
+    
     def __init__(
         self,
         user_id,
@@ -64,12 +85,29 @@ class AsyncJobDiscoveryTask:
         self.task_id = task_id
         self.stream_manager = get_stream_manager()
         self.scraper = JobScraperService()
-        self.filter_repo = JobFilterRepository(session)
         
         # Stats tracking
         self.scraped_count = 0
         self.published_count = 0
         self.skipped_count = 0
+        
+        # New jobs waiting for the next bulk insert
+        self._pending_jobs: List[JobListing] = []
+        self._ai_match_service: Optional[AIMatchService] = None
+        
+        # Immutable per-run settings, read once instead of per job / batch
+        self._resume_text: str = user_data.get("resume_text", "")
+        self._strict_content_dedup: bool = user_data.get("strict_content_dedup", False)
+        
+        # Background filter audit writes, awaited at the end of run()
+        self._audit_tasks: List[asyncio.Task] = []
+        
+        # Job events for jobs flushed but not yet committed
+        self._uncommitted_events: List[JobDiscoveryEvent] = []
+        
+        # Job events waiting for the next SSE batch
+        self._pending_events: List[JobDiscoveryEvent] = []
+        self._last_event_flush = time.monotonic()
     
     async def run(self):
         """
@@ -77,7 +115,8 @@ class AsyncJobDiscoveryTask:
         Scrapes jobs, saves to DB, streams new ones to client.
         
         Uses pre-generated LinkedIn URLs from task data (built from user preferences).
-        ANTI-429: Staggered job title scraping with 90s gaps minimum.
+        Job titles are scraped concurrently (user_data["concurrency"], default 3).
+        ANTI-429: Shared circuit breaker stops all titles after repeated rate limits.
         """
         try:
             logger.info(f"🚀 Starting async job discovery for user {self.user_id}, session {self.session_id}")
@@ -88,7 +127,7 @@ class AsyncJobDiscoveryTask:
             session_id = self.user_data.get("session_id")  # Active Selenium session (if available)
             experience_level = self.user_data.get("experience_level")
             work_type = self.user_data.get("work_type")
-            resume_text = self.user_data.get("resume_text", "")
+            resume_text = self._resume_text
             search_urls = self.user_data.get("search_urls", [])  # Pre-generated URLs
             
             # Log which authentication method is being used
@@ -100,6 +139,12 @@ class AsyncJobDiscoveryTask:
                 logger.error("❌ No session or cookies available for scraping")
                 return
             
+            # Title -> pre-generated URL (first entry wins, as before)
+            url_by_title = {
+                url_data.get("job_title"): url_data.get("url")
+                for url_data in reversed(search_urls)
+            }
+            
             # Log if pre-generated URLs are available
             if search_urls:
                 logger.info(f"✅ Using {len(search_urls)} pre-generated LinkedIn URLs")
@@ -111,8 +156,11 @@ class AsyncJobDiscoveryTask:
             if resume_text:
                 try:
                     ai_match_service = AIMatchService()
+                    # Embed the resume once for every batch in this run
+                    await asyncio.to_thread(ai_match_service.cache_resume_embedding, self.user_id, resume_text)
                 except Exception as e:
                     logger.warning(f"Failed to initialize AI Match Service: {e}")
+            self._ai_match_service = ai_match_service
             
             # OPTIMIZATION: Pre-load ALL existing external IDs from database
             # This prevents duplicate scraping and expensive DB queries later
@@ -121,164 +169,207 @@ class AsyncJobDiscoveryTask:
             
             processed_external_ids: Set[str] = set()
             
-            # Anti-429: Track consecutive rate limits
+            # Anti-429: Track consecutive rate limits (shared across concurrent titles)
             consecutive_rate_limits = 0
             rate_limit_threshold = 3
+            rate_limit_lock = asyncio.Lock()
+            circuit_open = asyncio.Event()
             
-            # Scrape for each job title
-            for idx, title in enumerate(job_titles, 1):
-                logger.info(f"[{idx}/{len(job_titles)}] Scraping '{title}'...")
-                
-                # Get pre-generated URL for this job title (if available)
-                search_url = None
-                if search_urls:
-                    for url_data in search_urls:
-                        if url_data.get("job_title") == title:
-                            search_url = url_data.get("url")
-                            logger.info(f"✅ Using pre-generated URL: {search_url}")
-                            break
+            # Titles are scraped concurrently; DB work shares one session, so
+            # persisting results is serialized
+            semaphore = asyncio.Semaphore(self.user_data.get("concurrency", 3))
+            db_lock = asyncio.Lock()
+            live_session_lock = asyncio.Lock()
+            
+            async def _scrape_one_title(idx: int, title: str) -> None:
+                nonlocal consecutive_rate_limits
                 
-                try:
-                    # Scrape jobs with pre-generated URL (or fallback to parameters)
-                    if search_url:
-                        # Use pre-generated URL
-                        jobs_data, fresh_cookies, filter_verification = self.scraper.scrape_jobs_by_url(
-                            search_url=search_url,
-                            cookies=cookies
-                        )
-                    else:
-                        # Fallback: Build URL dynamically in scraper using session_id
-                        jobs_data = self.scraper.scrape_jobs(
-                            job_title=title,
-                            location=location,
-                            # Use the Selenium session_id from user_data, not the SSE stream session_id
-                            session_id=self.user_data.get("session_id"),
-                            experience_level=experience_level,
-                            work_type=work_type,
-                            easy_apply=True,
-                            current_job_id=None
-                        )
-                        fresh_cookies = cookies  # Keep for backward compat
-                        filter_verification = {}  # No filter verification from direct scrape
+                async with semaphore:
+                    # Circuit breaker tripped by another title - don't scrape
+                    if circuit_open.is_set():
+                        return
                     
-                    # Store applied filters in audit trail
-                    await self._store_filter_audit(
-                        job_title=title,
-                        search_url=search_url,
-                        filter_verification=filter_verification
-                    )
+                    logger.info(f"[{idx}/{len(job_titles)}] Scraping '{title}'...")
                     
-                    self.scraped_count += len(jobs_data)
+                    # Get pre-generated URL for this job title (if available)
+                    search_url = url_by_title.get(title)
+                    if search_url:
+                        logger.info(f"✅ Using pre-generated URL: {search_url}")
                     
-                    # Check if no jobs were found (empty list returned)
-                    if len(jobs_data) == 0:
-                        logger.warning(f"⚠ No matching jobs found for '{title}' in '{location}'")
+                    try:
+                        # Scrape jobs with pre-generated URL (or fallback to parameters)
+                        if search_url:
+                            # Use pre-generated URL - Selenium runs in a worker thread
+                            # so the event loop keeps serving SSE and other titles
+                            jobs_data, fresh_cookies, filter_verification = await asyncio.to_thread(
+                                self.scraper.scrape_jobs_by_url,
+                                search_url=search_url,
+                                cookies=cookies
+                            )
+                        else:
+                            # Fallback: Build URL dynamically in scraper using session_id.
+                            # All titles drive the same live browser, so one at a time.
+                            async with live_session_lock:
+                                jobs_data = await asyncio.to_thread(
+                                    self.scraper.scrape_jobs,
+                                    job_title=title,
+                                    location=location,
+                                    # Use the Selenium session_id from user_data, not the SSE stream session_id
+                                    session_id=session_id,
+                                    experience_level=experience_level,
+                                    work_type=work_type,
+                                    easy_apply=True,
+                                    current_job_id=None
+                                )
+                            fresh_cookies = cookies  # Keep for backward compat
+                            filter_verification = {}  # No filter verification from direct scrape
                         
-                        # Send notification to user via SSE stream
-                        await self.stream_manager.send_event(
-                            self.session_id,
-                            StreamStatusEvent(
-                                type="no_jobs",
-                                message=f"No matching jobs found for role: {title}",
-                                data={
-                                    "job_title": title,
-                                    "location": location,
-                                    "reason": "no_matching_jobs"
-                                }
+                        # Store applied filters in audit trail (background, own session)
+                        self._audit_tasks.append(asyncio.create_task(
+                            self._store_filter_audit(
+                                job_title=title,
+                                search_url=search_url,
+                                filter_verification=filter_verification
                             )
-                        )
+                        ))
                         
-                        # Update cookies if available
-                        if fresh_cookies:
-                            self.user_data["cookies"] = fresh_cookies
+                        self.scraped_count += len(jobs_data)
                         
-                        # Continue to next title
-                        continue
-                    
-                    logger.info(f"Scraped {len(jobs_data)} jobs for '{title}'")
-                    
-                    # Update cookies if fresh ones received
-                    if fresh_cookies:
-                        self.user_data["cookies"] = fresh_cookies
-                    
-                    # Reset rate limit counter on successful scrape
-                    consecutive_rate_limits = 0
-                    
-                    # Process each job (with existing_external_ids for fast duplicate check)
-                    for job_data in jobs_data:
-                        # Extract page number from job data (set by scraper)
-                        page_number = job_data.get("page_number", 1)
-                        await self._process_and_publish_job(
-                            job_data,
-                            processed_external_ids,
-                            existing_external_ids,
-                            ai_match_service,
-                            page_number=page_number  # Pass page number from scraper
-                        )
-                
-                except Exception as e:
-                    error_str = str(e).lower()
-                    
-                    # Detect rate limit errors (429, rate limit, too many requests)
-                    if "429" in error_str or "rate" in error_str or "too many" in error_str:
-                        consecutive_rate_limits += 1
-                        logger.error(
-                            f"❌ Rate limit detected for '{title}' "
-                            f"(consecutive: {consecutive_rate_limits}/{rate_limit_threshold})"
-                        )
-                        
-                        if consecutive_rate_limits >= rate_limit_threshold:
-                            logger.critical(
-                                f"🚫 CIRCUIT BREAKER: {consecutive_rate_limits} consecutive rate limits! "
-                                f"Stopping job discovery. Please try again in 1+ hours."
-                            )
+                        # Check if no jobs were found (empty list returned)
+                        if len(jobs_data) == 0:
+                            logger.warning(f"⚠ No matching jobs found for '{title}' in '{location}'")
+                            
+                            # Send notification to user via SSE stream
                             await self.stream_manager.send_event(
                                 self.session_id,
                                 StreamStatusEvent(
-                                    type="error",
-                                    message=f"Rate limited after {consecutive_rate_limits} attempts. Stopping.",
-                                    data={"error_type": "rate_limit"}
+                                    type="no_jobs",
+                                    message=f"No matching jobs found for role: {title}",
+                                    data={
+                                        "job_title": title,
+                                        "location": location,
+                                        "reason": "no_matching_jobs"
+                                    }
                                 )
                             )
-                            break
+                            
+                            # Update cookies if available
+                            if fresh_cookies:
+                                self.user_data["cookies"] = fresh_cookies
+                            
+                            # Continue to next title
+                            return
                         
-                        # Wait exponentially before next title
-                        backoff_time = 2 ** consecutive_rate_limits  # 2s, 4s, 8s
-                        backoff_time = min(backoff_time, 300)  # Cap at 5 minutes
-                        logger.warning(
-                            f"Waiting {backoff_time:.0f}s before next title due to rate limit..."
-                        )
-                        await asyncio.sleep(backoff_time)
-                    else:
-                        # Non-rate-limit error
-                        consecutive_rate_limits = 0
-                        logger.error(f"Error scraping jobs for '{title}': {e}")
+                        logger.info(f"Scraped {len(jobs_data)} jobs for '{title}'")
+                        
+                        # Update cookies if fresh ones received
+                        if fresh_cookies:
+                            self.user_data["cookies"] = fresh_cookies
+                        
+                        # Reset rate limit counter on successful scrape
+                        async with rate_limit_lock:
+                            consecutive_rate_limits = 0
+                        
+                        async with db_lock:
+                            # One timestamp for every job from this scrape
+                            now = datetime.now(timezone.utc)
+                            
+                            # Process each job (with existing_external_ids for fast duplicate check)
+                            for job_data in jobs_data:
+                                # Extract page number from job data (set by scraper)
+                                page_number = job_data.get("page_number", 1)
+                                await self._process_and_publish_job(
+                                    job_data,
+                                    processed_external_ids,
+                                    existing_external_ids,
+                                    ai_match_service,
+                                    page_number=page_number,  # Pass page number from scraper
+                                    now=now
+                                )
+                            
+                            # Persist whatever is left for this title, commit once
+                            # and publish the committed jobs
+                            await self._flush_batch()
+                            await self._commit()
+                            await self._flush_events()
                     
-                    # Continue with next title
-                    continue
+                    except Exception as e:
+                        # Detect rate limit errors (429, rate limit, too many requests)
+                        if _RATE_LIMIT_RE.search(str(e)):
+                            async with rate_limit_lock:
+                                consecutive_rate_limits += 1
+                                current_rate_limits = consecutive_rate_limits
+                            logger.error(
+                                f"❌ Rate limit detected for '{title}' "
+                                f"(consecutive: {current_rate_limits}/{rate_limit_threshold})"
+                            )
+                            
+                            if current_rate_limits >= rate_limit_threshold:
+                                if circuit_open.is_set():
+                                    return
+                                circuit_open.set()
+                                logger.critical(
+                                    f"🚫 CIRCUIT BREAKER: {current_rate_limits} consecutive rate limits! "
+                                    f"Stopping job discovery. Please try again in 1+ hours."
+                                )
+                                await self.stream_manager.send_event(
+                                    self.session_id,
+                                    StreamStatusEvent(
+                                        type="error",
+                                        message=f"Rate limited after {current_rate_limits} attempts. Stopping.",
+                                        data={"error_type": "rate_limit"}
+                                    )
+                                )
+                                return
+                            
+                            # Wait exponentially before releasing this slot to the next title
+                            backoff_time = 2 ** current_rate_limits  # 2s, 4s, 8s
+                            backoff_time = min(backoff_time, 300)  # Cap at 5 minutes
+                            logger.warning(
+                                f"Waiting {backoff_time:.0f}s before next title due to rate limit..."
+                            )
+                            await asyncio.sleep(backoff_time)
+                        else:
+                            # Non-rate-limit error
+                            async with rate_limit_lock:
+                                consecutive_rate_limits = 0
+                            logger.error(f"Error scraping jobs for '{title}': {e}")
+            
+            # Scrape job titles concurrently (bounded by the semaphore)
+            await asyncio.gather(
+                *[_scrape_one_title(idx, title) for idx, title in enumerate(job_titles, 1)],
+                return_exceptions=True
+            )
+            
+            # Let pending filter audit writes finish
+            await asyncio.gather(*self._audit_tasks, return_exceptions=True)
             
-            # Complete the stream
+            # Persist and publish anything still buffered, then complete the stream
+            await self._flush_batch()
+            await self._commit()
+            await self._flush_events()
             await self.stream_manager.complete_stream(self.session_id)
             
             logger.info(
                 f"✅ Job discovery complete for session {self.session_id}\n"
                 f"  Scraped: {self.scraped_count}\n"
                 f"  Published: {self.published_count}\n"
-                f"  Skipped: {self.skipped_count}"
+                f"  Skipped: {self.skipped_count}\n"
+                f"  Dropped (slow client): {self.stream_manager.get_dropped_count(self.session_id)}"
             )
             
         except Exception as e:
             logger.error(f"💥 Fatal error in async job discovery: {e}")
             await self.stream_manager.complete_stream(self.session_id)
     
-    async def _get_existing_external_ids(self) -> Set[str]:
+    async def _get_existing_external_ids(self) -> FrozenSet[str]:
         """
         Pre-load all existing LinkedIn job external IDs from database.
         This allows fast in-memory duplicate checking without DB queries.
         Uses a fresh session to avoid interfering with the main transaction.
         
         Returns:
-            Set of external IDs already in database
+            Read-only set of external IDs already in database
         """
         fresh_session = None
         try:
@@ -289,7 +380,7 @@ class AsyncJobDiscoveryTask:
             return existing_ids
         except Exception as e:
             logger.warning(f"Failed to pre-load existing job IDs: {e}")
-            return set()
+            return frozenset()
         finally:
             # Always close the fresh session
             if fresh_session:
@@ -305,18 +396,20 @@ class AsyncJobDiscoveryTask:
         filter_verification: dict
     ) -> None:
         """
-        Store filter verification results in job_filters table for auditing
+        Store filter verification results in job_filters table for auditing.
+        Runs as a background task, so it uses a fresh session instead of the
+        main one.
         
         Args:
             job_title: Job title that was searched
             search_url: LinkedIn search URL used
             filter_verification: Dictionary with verification results from _verify_filters_applied
         """
+        if not filter_verification:
+            logger.debug("No filter verification results to store")
+            return
+        
         try:
-            if not filter_verification:
-                logger.debug("No filter verification results to store")
-                return
-            
             # Create filter records for each verified filter
             filters_to_store = []
             
@@ -338,38 +431,36 @@ class AsyncJobDiscoveryTask:
             
             # Store all filters in bulk
             if filters_to_store:
-                await self.filter_repo.create_bulk(
-                    user_id=self.user_id,
-                    filters=filters_to_store,
-                    task_id=self.task_id,
-                    search_url=search_url,
-                    job_title=job_title
-                )
+                # Dedicated session: a failed audit write never rolls back job inserts
+                async with AsyncSessionLocal() as audit_session:
+                    await JobFilterRepository(audit_session).insert_bulk(
+                        user_id=self.user_id,
+                        filters=filters_to_store,
+                        task_id=self.task_id,
+                        search_url=search_url,
+                        job_title=job_title
+                    )
+                    await audit_session.commit()
                 
                 verified_count = sum(1 for f in filters_to_store if f.get("verified") == "verified")
                 logger.info(f"✅ Stored {len(filters_to_store)} filter audit records ({verified_count} verified)")
-                
-                # Commit filter audit records
-                await self.session.commit()
             
         except Exception as e:
+            # Don't fail the whole task if filter audit fails (the session
+            # context manager rolls back the uncommitted audit rows)
             logger.error(f"Error storing filter audit: {e}")
-            # Don't fail the whole task if filter audit fails
-            try:
-                await self.session.rollback()
-            except:
-                pass
     
     async def _process_and_publish_job(
         self,
         job_data: dict,
         processed_ids: Set[str],
-        existing_ids: Set[str],
+        existing_ids: FrozenSet[str],
         ai_match_service: Optional[AIMatchService],
-        page_number: int = 1
+        page_number: int = 1,
+        now: Optional[datetime] = None
     ):
         """
-        Process a single job and publish it if new.
+        Process a single job and queue it for bulk insert + publishing if new.
         
         Job data expected fields (from structured parsing):
         - title: Job title
@@ -382,15 +473,18 @@ class AsyncJobDiscoveryTask:
         
         Duplicate Detection Strategy:
         1. Session check: processed_ids (fast memory check)
-        2. DB check via index: exists_by_external_id() (O(1) via external_id index)
-        3. Skip if either check passes
+        2. Snapshot check: existing_ids pre-loaded from database (no query)
+        3. DB check: check_duplicate() - external_id and URL in one query
+           (plus title/company/description when strict_content_dedup is set)
+        4. Skip if any check passes
         
         Args:
             job_data: Raw job data from scraper
             processed_ids: Set of already processed external IDs in this session
-            existing_ids: Set of IDs pre-loaded from database (optional fallback)
+            existing_ids: Set of IDs pre-loaded from database (primary filter)
             ai_match_service: AI service for match scoring
             page_number: Which page this job was found on (for audit trail)
+            now: Shared timestamp for the scrape batch (defaults to current UTC time)
         """
         try:
             # Use job_id from structured parsing (data-job-id attribute)
@@ -408,35 +502,37 @@ class AsyncJobDiscoveryTask:
             
             processed_ids.add(external_id)
             
-            # Check 2: Check database for duplicate via indexed external_id (O(1) lookup)
-            # This is the authoritative check - database is source of truth
-            if await self.job_repo.exists_by_external_id(external_id, platform="linkedin"):
+            # Check 2: Skip if in the pre-loaded DB snapshot (O(1), no query).
+            # Jobs created during this run are already covered by processed_ids.
+            if external_id in existing_ids:
                 self.skipped_count += 1
                 logger.debug(f"Skipping duplicate job {external_id} (already exists in database)")
                 return
             
-            # Check 2.5: Check database for duplicate via URL
-            apply_url = job_data.get("apply_url", "").strip()
-            if apply_url and await self.job_repo.exists_by_url(apply_url, platform="linkedin"):
-                self.skipped_count += 1
-                logger.debug(f"Skipping duplicate job {external_id} (URL already exists in database)")
-                return
-            
-            # Check 3: Check for content duplicate (same title, company, description)
-            # This catches jobs that may have different external_ids but are the same job
             title = job_data.get("title", "").strip()
             company = job_data.get("company", "").strip()
             description = job_data.get("description", "").strip()
             
-            existing_duplicate = await self.job_repo.find_duplicate_by_content(
-                title=title,
-                company=company, 
-                description=description,
+            # Normalize URL by removing query parameters and fragment
+            apply_url = job_data.get("apply_url", "")
+            url_match = _URL_STRIP_QUERY.match(apply_url)
+            normalized_url = url_match.group(1) if url_match else apply_url
+            
+            # Check 3: Database duplicate by external_id or URL - catches jobs
+            # inserted since the pre-load. Content matching (same title, company,
+            # description) for reposts under a new ID is opt-in, since
+            # external_id already identifies almost every LinkedIn posting
+            strict_content_dedup = self._strict_content_dedup
+            if await self.job_repo.check_duplicate(
+                external_id=external_id,
+                url=normalized_url if apply_url.strip() else None,
+                title=title if strict_content_dedup else None,
+                company=company if strict_content_dedup else None,
+                description_hash=hash_description(description) if strict_content_dedup else None,
                 platform="linkedin"
-            )
-            if existing_duplicate:
+            ):
                 self.skipped_count += 1
-                logger.debug(f"Skipping content duplicate job {external_id} (matches existing job {existing_duplicate.id})")
+                logger.debug(f"Skipping duplicate job {external_id} (already exists in database)")
                 return
             
             # Apply filters: Easy Apply required
@@ -464,18 +560,9 @@ class AsyncJobDiscoveryTask:
                 return
             
             # At this point, it's a NEW job - create it
-            wt = None
-            if job_data.get("work_type"):
-                try:
-                    wt = WorkType(job_data.get("work_type"))
-                except:
-                    pass
-            
-            # Normalize URL by removing query parameters
-            from urllib.parse import urlparse
-            apply_url = job_data.get("apply_url", "")
-            parsed = urlparse(apply_url)
-            normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+            wt = _WORK_TYPE_BY_VALUE.get(job_data.get("work_type"))
+            if now is None:
+                now = datetime.now(timezone.utc)
             
             new_job = JobListing(
                 id=uuid4(),
@@ -489,86 +576,183 @@ class AsyncJobDiscoveryTask:
                 apply_link=apply_url,  # Keep original apply link
                 easy_apply=True,
                 salary_range=None,
+                salary_min=job_data.get("salary_min"),
+                salary_max=job_data.get("salary_max"),
                 work_type=wt,
                 posted_date=None,
                 page_number=job_data.get("page_number", page_number),  # Prefer data from scraper
-                scraped_at=job_data.get("scraped_at") or datetime.utcnow(),  # Prefer scraper timestamp
-                last_seen_at=datetime.utcnow()
+                scraped_at=job_data.get("scraped_at") or now,  # Prefer scraper timestamp
+                last_seen_at=now
             )
             
-            created_job = await self.job_repo.create(new_job)
-            job_id = created_job.id
-            
-            # Update in-memory set if using fallback strategy
-            if external_id in existing_ids:
-                existing_ids.add(external_id)
-            
-            logger.info(f"Created new job {external_id}: {job_data.get('title')}")
+            # Buffer for bulk insert - persisted and published by _flush_batch
+            self._pending_jobs.append(new_job)
+            if len(self._pending_jobs) >= self.BATCH_SIZE:
+                await self._flush_batch()
+        
+        except Exception as e:
+            logger.error(f"Error processing job {job_data.get('job_id')}: {e}")
+            self.skipped_count += 1
+    
+    async def _flush_batch(self) -> None:
+        """
+        Bulk insert buffered jobs and their user-job links inside a savepoint.
+        
+        Job listings use INSERT ... ON CONFLICT DO NOTHING on (platform, external_id),
+        so jobs inserted concurrently by another task are skipped rather than
+        failing the batch. The batch is only flushed - _commit() commits once per
+        title and queues the persisted jobs for the SSE stream. A failing batch
+        rolls back to its savepoint without losing earlier batches.
+        """
+        if not self._pending_jobs:
+            return
+        
+        batch, self._pending_jobs = self._pending_jobs, []
+        savepoint = None
+        
+        # Score the whole batch while the job listings are being inserted -
+        # the embedding runs in a worker thread, overlapping the DB round-trip
+        scoring_task = None
+        if self._ai_match_service and self._resume_text:
+            scoring_task = asyncio.create_task(
+                self._ai_match_service.batch_calculate_scores(
+                    self._resume_text,
+                    batch,
+                    user_id=self.user_id
+                )
+            )
+        
+        try:
+            savepoint = await self.session.begin_nested()
+            result = await self.session.execute(
+                pg_insert(JobListingModel)
+                .values([
+                    {
+                        "id": job.id,
+                        "external_id": job.external_id,
+                        "platform": job.platform,
+                        "title": job.title,
+                        "company": job.company,
+                        "location": job.location,
+                        "description": job.description,
+                        "description_sha1": hash_description(job.description),
+                        "url": job.url,
+                        "apply_link": job.apply_link,
+                        "easy_apply": job.easy_apply,
+                        "salary_min": job.salary_min,
+                        "salary_max": job.salary_max,
+                        "work_type": job.work_type.value if job.work_type else None,
+                        "page_number": job.page_number,
+                        "scraped_at": job.scraped_at,
+                        "last_seen_at": job.last_seen_at,
+                    }
+                    for job in batch
+                ])
+                .on_conflict_do_nothing(constraint="uq_job_listing_platform_external_id")
+                .returning(JobListingModel.id)
+            )
+            inserted_ids = set(result.scalars().all())
+            created = [job for job in batch if job.id in inserted_ids]
             
-            # Calculate match score
-            match_score = None
-            if ai_match_service and self.user_data.get("resume_text"):
+            # Collect the match scores computed alongside the insert
+            match_scores = {}
+            if scoring_task:
                 try:
-                    # Need to fetch the job for AI scoring
-                    job = await self.job_repo.get_by_id(job_id)
-                    match_score_result = await ai_match_service.calculate_match_score(
-                        self.user_data["resume_text"],
-                        job
-                    )
-                    match_score = match_score_result.value
+                    scores = await scoring_task
+                    match_scores = {job_id: score.value for job_id, score in scores.items()}
                 except Exception as e:
-                    logger.warning(f"Failed to calculate match score: {e}")
+                    logger.warning(f"Failed to calculate match scores: {e}")
+            
+            # Create user-job links with status=PENDING (skip links that already exist)
+            if created:
+                await self.session.execute(
+                    pg_insert(UserJobModel)
+                    .values([
+                        {
+                            "id": uuid4(),
+                            "user_id": self.user_id,
+                            "job_id": job.id,
+                            "match_score": int(match_scores.get(job.id) or 0),
+                            "status": ApplicationStatus.PENDING.value,
+                        }
+                        for job in created
+                    ])
+                    .on_conflict_do_nothing()
+                )
             
-            # Create user-job link if doesn't exist with status=PENDING
-            try:
-                existing_user_job = await self.user_job_repo.get_by_user_and_job(self.user_id, job_id)
-                
-                if not existing_user_job:
-                    user_job = UserJob(
-                        id=uuid4(),
-                        user_id=self.user_id,
-                        job_id=job_id,
-                        match_score=match_score or 0,
-                        status=ApplicationStatus.PENDING  # Status is PENDING for newly discovered jobs
-                    )
-                    await self.user_job_repo.create(user_job)
-                    logger.debug(f"Created user-job link for {job_id} with status=PENDING")
-                else:
-                    logger.debug(f"User-job link already exists for {job_id}")
-            except IntegrityError as e:
-                if "uq_user_jobs_user_id_job_id" in str(e):
-                    logger.debug(f"User-job link already exists for {job_id} (caught duplicate)")
-                else:
-                    logger.warning(f"Integrity error creating user-job link for {job_id}: {e}")
-                    raise
-            except Exception as e:
-                logger.warning(f"Error creating user-job link for {job_id}: {e}")
-                raise
-            
-            # Publish to stream
+            await savepoint.commit()
+        
+        except Exception as e:
+            logger.error(f"Error persisting batch of {len(batch)} jobs: {e}")
+            self.skipped_count += len(batch)
+            if scoring_task:
+                # Cancel if still running, and retrieve a result/exception either way
+                scoring_task.cancel()
+                await asyncio.gather(scoring_task, return_exceptions=True)
+            if savepoint is not None:
+                try:
+                    await savepoint.rollback()
+                except Exception as rollback_error:
+                    logger.debug(f"Savepoint rollback failed: {rollback_error}")
+            return
+        
+        self.skipped_count += len(batch) - len(created)
+        logger.info(f"💾 Flushed {len(created)}/{len(batch)} new jobs")
+        
+        # Hold events until the title's transaction commits
+        for job in created:
             event = JobDiscoveryEvent(
-                job_id=str(job_id),
-                title=job_data.get("title", ""),
-                company=job_data.get("company", ""),
-                location=job_data.get("location", ""),
-                description=description,
-                url=job_data.get("apply_url", ""),
-                work_type=job_data.get("work_type"),
-                salary_min=job_data.get("salary_min"),
-                salary_max=job_data.get("salary_max"),
-                match_score=match_score
+                job_id=str(job.id),
+                title=job.title,
+                company=job.company,
+                location=job.location,
+                description=job.description,
+                url=job.apply_link or "",
+                work_type=job.work_type.value if job.work_type else None,
+                salary_min=job.salary_min,
+                salary_max=job.salary_max,
+                match_score=match_scores.get(job.id)
             )
-            
-            await self.stream_manager.publish_job(self.session_id, event)
+            self._uncommitted_events.append(event)
+    
+    async def _commit(self) -> None:
+        """
+        Commit all batches flushed since the last commit (one commit per title),
+        then queue their jobs for the SSE stream.
+        """
+        events, self._uncommitted_events = self._uncommitted_events, []
+        
+        try:
+            await self.session.commit()
+        except Exception as e:
+            logger.error(f"Error committing {len(events)} jobs: {e}")
+            self.skipped_count += len(events)
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass
+            return
+        
+        # Publish persisted jobs to stream
+        for event in events:
+            self._pending_events.append(event)
             self.published_count += 1
-            logger.info(f"Published job to stream: {job_data.get('title')}")
+            logger.info(f"Queued job for stream: {event.title}")
             
-            # Commit after each job
-            await self.session.commit()
+            if (
+                len(self._pending_events) >= self.EVENT_BATCH_SIZE
+                or time.monotonic() - self._last_event_flush > self.EVENT_FLUSH_INTERVAL
+            ):
+                await self._flush_events()
+    
+    async def _flush_events(self) -> None:
+        """Send buffered job events to the client as a single SSE event"""
+        self._last_event_flush = time.monotonic()
+        if not self._pending_events:
+            return
         
-        except Exception as e:
-            logger.error(f"Error processing job {job_data.get('job_id')}: {e}")
-            self.skipped_count += 1
+        events, self._pending_events = self._pending_events, []
+        await self.stream_manager.publish_jobs(self.session_id, events)
 
 
 def create_async_job_discovery_task(
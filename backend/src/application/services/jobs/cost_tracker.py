@@ -2,13 +2,16 @@
 Cost Tracker
 Track API costs per application for budget management.
 """
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import sys
+import time
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class APICall:
     """Record of a single API call"""
     model: str
@@ -19,7 +22,7 @@ class APICall:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCostReport:
     """Cost report for a single job application"""
     job_id: str
@@ -31,9 +34,12 @@ class JobCostReport:
     success: bool
     start_time: datetime
     end_time: Optional[datetime] = None
+    elapsed_seconds: Optional[float] = None  # Monotonic-clock duration
     
     @property
     def duration_seconds(self) -> float:
+        if self.elapsed_seconds is not None:
+            return self.elapsed_seconds
         if self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return 0
@@ -62,36 +68,72 @@ class CostTracker:
         "default": {"input": 0.001, "output": 0.002}
     }
     
-    def __init__(self, budget_per_job: float = 0.10, daily_budget: float = 10.0):
+    def __init__(
+        self,
+        budget_per_job: float = 0.10,
+        daily_budget: float = 10.0,
+        max_history: int = 10_000,
+        max_job_reports: int = 1000
+    ):
         """
         Initialize cost tracker.
         
         Args:
             budget_per_job: Alert if single job exceeds this cost
             daily_budget: Alert if daily spend exceeds this
+            max_history: Number of most recent API calls kept in memory
+            max_job_reports: Number of most recent job reports kept in memory
         """
         self.budget_per_job = budget_per_job
         self.daily_budget = daily_budget
         
+        # model -> (input cost per token, output cost per token)
+        self._rate_table = {
+            model: (rates["input"] / 1000.0, rates["output"] / 1000.0)
+            for model, rates in self.COSTS_PER_1K_TOKENS.items()
+        }
+        self._default_rate = self._rate_table["default"]
+        
         # Current job tracking
         self._current_job_id: Optional[str] = None
         self._current_calls: List[APICall] = []
         self._current_start: Optional[datetime] = None
+        self._current_start_mono: Optional[float] = None
+        
+        self._current_job_cost = 0.0
+        self._current_vision_calls = 0
         
-        # Session totals
-        self._all_calls: List[APICall] = []
-        self._job_reports: List[JobCostReport] = []
+        # Session history (bounded - totals live in the running aggregates below)
+        self._all_calls: Deque[APICall] = deque(maxlen=max_history)
+        self._job_reports: Deque[JobCostReport] = deque(maxlen=max_job_reports)
         self._session_start = datetime.utcnow()
+        self._session_start_mono = time.monotonic()
+        
+        # Running aggregates, updated on every log_call / finish_job so that
+        # budget checks and stats never rescan the call history
+        self._session_cost = 0.0
+        self._call_count = 0
+        self._vision_count = 0
+        self._batch_count = 0
+        self._token_sum = 0
+        self._today = self._session_start.date()
+        self._daily_spend = 0.0
+        self._jobs_successful = 0
+        self._jobs_failed = 0
+        self._success_cost = 0.0
     
     def start_job(self, job_id: str, job_title: str = "", company: str = "") -> None:
         """Start tracking a new job application"""
         self._current_job_id = job_id
         self._current_calls = []
         self._current_start = datetime.utcnow()
+        self._current_start_mono = time.monotonic()
+        self._current_job_cost = 0.0
+        self._current_vision_calls = 0
         self._current_title = job_title
         self._current_company = company
         
-        logger.debug(f"Cost tracking started for job: {job_title} at {company}")
+        logger.debug("Cost tracking started for job: {} at {}", job_title, company)
     
     def log_call(
         self,
@@ -112,6 +154,10 @@ class CostTracker:
         Returns:
             Cost of this call
         """
+        # Few distinct models/purposes - share one string object per value
+        model = sys.intern(model)
+        purpose = sys.intern(purpose)
+        
         cost = self._calculate_cost(model, input_tokens, output_tokens)
         
         call = APICall(
@@ -125,28 +171,43 @@ class CostTracker:
         self._current_calls.append(call)
         self._all_calls.append(call)
         
-        # Log with cost
+        # Update running aggregates
+        self._current_job_cost += cost
+        self._session_cost += cost
+        self._call_count += 1
+        self._token_sum += input_tokens + output_tokens
+        if purpose == "vision":
+            self._current_vision_calls += 1
+            self._vision_count += 1
+        elif purpose == "batch":
+            self._batch_count += 1
+        
+        call_date = call.timestamp.date()
+        if call_date == self._today:
+            self._daily_spend += cost
+        else:
+            self._today = call_date
+            self._daily_spend = cost
+        
+        # Log with cost (loguru formats the arguments only if a sink accepts the record)
         logger.info(
-            f"API: {model} | {input_tokens}+{output_tokens} tokens | "
-            f"${cost:.4f} | Job total: ${self.current_job_cost:.4f}"
+            "API: {} | {}+{} tokens | ${:.4f} | Job total: ${:.4f}",
+            model, input_tokens, output_tokens, cost, self._current_job_cost
         )
         
         # Budget warnings
-        if self.current_job_cost > self.budget_per_job:
+        if self._current_job_cost > self.budget_per_job:
             logger.warning(
-                f"⚠️ Job cost ${self.current_job_cost:.4f} exceeds budget ${self.budget_per_job:.2f}"
+                "⚠️ Job cost ${:.4f} exceeds budget ${:.2f}",
+                self._current_job_cost, self.budget_per_job
             )
         
         return cost
     
     def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost for an API call"""
-        rates = self.COSTS_PER_1K_TOKENS.get(model, self.COSTS_PER_1K_TOKENS["default"])
-        
-        input_cost = (input_tokens / 1000) * rates["input"]
-        output_cost = (output_tokens / 1000) * rates["output"]
-        
-        return input_cost + output_cost
+        input_rate, output_rate = self._rate_table.get(model, self._default_rate)
+        return input_tokens * input_rate + output_tokens * output_rate
     
     def finish_job(self, success: bool) -> JobCostReport:
         """
@@ -164,88 +225,109 @@ class CostTracker:
             company=getattr(self, '_current_company', ''),
             total_cost=self.current_job_cost,
             api_calls=len(self._current_calls),
-            vision_calls=sum(1 for c in self._current_calls if c.purpose == "vision"),
+            vision_calls=self._current_vision_calls,
             success=success,
             start_time=self._current_start or datetime.utcnow(),
-            end_time=datetime.utcnow()
+            end_time=datetime.utcnow(),
+            elapsed_seconds=(
+                time.monotonic() - self._current_start_mono
+                if self._current_start_mono is not None else None
+            )
         )
         
         self._job_reports.append(report)
+        if success:
+            self._jobs_successful += 1
+            self._success_cost += report.total_cost
+        else:
+            self._jobs_failed += 1
         
-        status = "✅ SUCCESS" if success else "❌ FAILED"
         logger.info(
-            f"{status} | Cost: ${report.total_cost:.4f} | "
-            f"API calls: {report.api_calls} | "
-            f"Duration: {report.duration_seconds:.1f}s"
+            "{} | Cost: ${:.4f} | API calls: {} | Duration: {:.1f}s",
+            "✅ SUCCESS" if success else "❌ FAILED",
+            report.total_cost, report.api_calls, report.duration_seconds
         )
         
         # Reset current job
         self._current_job_id = None
         self._current_calls = []
         self._current_start = None
+        self._current_start_mono = None
+        self._current_job_cost = 0.0
+        self._current_vision_calls = 0
         
         return report
     
     @property
     def current_job_cost(self) -> float:
         """Total cost for current job"""
-        return sum(c.cost for c in self._current_calls)
+        return self._current_job_cost
     
     @property
     def session_cost(self) -> float:
         """Total cost for this session"""
-        return sum(c.cost for c in self._all_calls)
+        return self._session_cost
     
     @property
     def daily_spend(self) -> float:
         """Total spend today"""
-        today = datetime.utcnow().date()
-        return sum(
-            c.cost for c in self._all_calls
-            if c.timestamp.date() == today
-        )
+        if datetime.utcnow().date() != self._today:
+            return 0.0
+        return self._daily_spend
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics"""
-        successful = [r for r in self._job_reports if r.success]
-        failed = [r for r in self._job_reports if not r.success]
+        jobs_attempted = self._jobs_successful + self._jobs_failed
+        daily_spend = self.daily_spend
         
         return {
             "session": {
-                "total_cost": self.session_cost,
-                "jobs_attempted": len(self._job_reports),
-                "jobs_successful": len(successful),
-                "jobs_failed": len(failed),
-                "success_rate": len(successful) / max(len(self._job_reports), 1),
-                "api_calls": len(self._all_calls),
-                "duration_minutes": (datetime.utcnow() - self._session_start).total_seconds() / 60
+                "total_cost": self._session_cost,
+                "jobs_attempted": jobs_attempted,
+                "jobs_successful": self._jobs_successful,
+                "jobs_failed": self._jobs_failed,
+                "success_rate": self._jobs_successful / max(jobs_attempted, 1),
+                "api_calls": self._call_count,
+                "duration_minutes": (time.monotonic() - self._session_start_mono) / 60
             },
             "costs": {
-                "avg_cost_per_job": self.session_cost / max(len(self._job_reports), 1),
-                "avg_cost_per_success": sum(r.total_cost for r in successful) / max(len(successful), 1),
-                "daily_spend": self.daily_spend,
+                "avg_cost_per_job": self._session_cost / max(jobs_attempted, 1),
+                "avg_cost_per_success": self._success_cost / max(self._jobs_successful, 1),
+                "daily_spend": daily_spend,
                 "daily_budget": self.daily_budget,
-                "budget_remaining": self.daily_budget - self.daily_spend
+                "budget_remaining": self.daily_budget - daily_spend
             },
             "efficiency": {
-                "vision_calls": sum(1 for c in self._all_calls if c.purpose == "vision"),
-                "batch_calls": sum(1 for c in self._all_calls if c.purpose == "batch"),
-                "avg_tokens_per_call": sum(c.input_tokens + c.output_tokens for c in self._all_calls) / max(len(self._all_calls), 1)
+                "vision_calls": self._vision_count,
+                "batch_calls": self._batch_count,
+                "avg_tokens_per_call": self._token_sum / max(self._call_count, 1)
             }
         }
     
+    def _basic_summary(self) -> Dict[str, Any]:
+        """Only the scalars print_summary needs (no nested stats dicts)"""
+        jobs_attempted = self._jobs_successful + self._jobs_failed
+        return {
+            "jobs_successful": self._jobs_successful,
+            "jobs_attempted": jobs_attempted,
+            "total_cost": self._session_cost,
+            "avg_cost_per_job": self._session_cost / max(jobs_attempted, 1),
+            "avg_cost_per_success": self._success_cost / max(self._jobs_successful, 1),
+            "daily_spend": self.daily_spend,
+        }
+    
     def print_summary(self) -> None:
         """Print formatted summary to logger"""
-        stats = self.get_stats()
+        summary = self._basic_summary()
         
         logger.info("=" * 50)
         logger.info("COST TRACKING SUMMARY")
         logger.info("=" * 50)
-        logger.info(f"Jobs: {stats['session']['jobs_successful']}/{stats['session']['jobs_attempted']} successful")
-        logger.info(f"Total Cost: ${stats['session']['total_cost']:.4f}")
-        logger.info(f"Avg Cost/Job: ${stats['costs']['avg_cost_per_job']:.4f}")
-        logger.info(f"Avg Cost/Success: ${stats['costs']['avg_cost_per_success']:.4f}")
-        logger.info(f"Daily Spend: ${stats['costs']['daily_spend']:.4f} / ${stats['costs']['daily_budget']:.2f}")
+        logger.info("Jobs: {}/{} successful", summary["jobs_successful"], summary["jobs_attempted"])
+        logger.info("Total Cost: ${:.4f}", summary["total_cost"])
+        logger.info("Avg Cost/Job: ${:.4f}", summary["avg_cost_per_job"])
+        logger.info("Avg Cost/Success: ${:.4f}", summary["avg_cost_per_success"])
+        logger.info("Daily Spend: ${:.4f} / ${:.2f}", summary["daily_spend"], self.daily_budget)
         logger.info("=" * 50)
 
 
@@ -3,7 +3,8 @@ DOM Field Extractor
 Extract form fields directly from DOM - fast, free, no API cost
 """
 import hashlib
-import json
+import re
+import sys
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -20,6 +21,140 @@ except ImportError:
     SELENIUM_AVAILABLE = False
 
 
+# Walks the form in the browser and returns one descriptor per form group, so
+# extraction costs a single WebDriver round-trip. Mirrors the Selenium-based
+# helpers below (label, input, required, value and option lookup).
+_EXTRACT_FIELDS_JS = """
+const cfg = arguments[0];
+
+function isDisplayed(el) {
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' ||
+        style.visibility === 'collapse' || style.opacity === '0') {
+        return false;
+    }
+    return el.getClientRects().length > 0;
+}
+
+function text(el) {
+    return (el.innerText || '').trim();
+}
+
+function findGroups(selectorUnion) {
+    try {
+        return Array.from(document.querySelectorAll(selectorUnion));
+    } catch (e) {
+        return [];
+    }
+}
+
+function extractLabel(group) {
+    for (const selector of cfg.labels) {
+        const label = group.querySelector(selector);
+        if (!label) continue;
+        const value = text(label);
+        if (value && value.length > 1) return value.replace(/\*/g, '').trim();
+    }
+    for (const input of group.querySelectorAll('input')) {
+        const aria = input.getAttribute('aria-label');
+        if (aria) return aria.trim();
+    }
+    return '';
+}
+
+function findInput(group) {
+    for (const [fieldType, selectors] of cfg.inputs) {
+        for (const selector of selectors) {
+            const el = group.querySelector(selector);
+            if (el && isDisplayed(el)) return [fieldType, el];
+        }
+    }
+    return [null, null];
+}
+
+function xpathFor(el) {
+    const tag = el.tagName.toLowerCase();
+    if (el.id) return "//*[@id='" + el.id + "']";
+    const name = el.getAttribute('name');
+    if (name) return '//' + tag + "[@name='" + name + "']";
+    const placeholder = el.getAttribute('placeholder');
+    if (placeholder) return '//' + tag + "[@placeholder='" + placeholder + "']";
+    return '//' + tag;
+}
+
+function isRequired(group, el) {
+    if (el.hasAttribute('required')) return true;
+    if (el.getAttribute('aria-required') === 'true') return true;
+    if (text(group).includes('*')) return true;
+    return (group.getAttribute('class') || '').toLowerCase().includes('required');
+}
+
+function currentValue(el, fieldType) {
+    if (fieldType === 'checkbox') return el.checked ? 'checked' : '';
+    if (fieldType === 'select') {
+        const option = el.selectedOptions && el.selectedOptions[0];
+        return option ? option.text.trim() : '';
+    }
+    return el.value || '';
+}
+
+function radioOptions(group) {
+    const options = [];
+    for (const radio of group.querySelectorAll("input[type='radio']")) {
+        let label = null;
+        if (radio.parentElement && radio.parentElement.tagName === 'LABEL') {
+            label = radio.parentElement;
+        } else {
+            for (let sib = radio.nextElementSibling; sib; sib = sib.nextElementSibling) {
+                if (sib.tagName === 'LABEL') { label = sib; break; }
+            }
+        }
+        if (!label) return [];
+        options.push(text(label));
+    }
+    return options;
+}
+
+let groups = findGroups(cfg.linkedin);
+if (!groups.length) groups = findGroups(cfg.generic);
+
+const fields = [];
+const seenInputs = new Set();
+for (const group of groups) {
+    try {
+        const [fieldType, el] = findInput(group);
+        if (!el || seenInputs.has(el)) continue;
+        const label = extractLabel(group);
+        if (!label) continue;
+        let options = [];
+        if (fieldType === 'select') {
+            options = Array.from(el.options).map(o => o.text).filter(t => t.trim());
+        } else if (fieldType === 'radio') {
+            options = radioOptions(group);
+        }
+        fields.push({
+            label: label,
+            type: fieldType,
+            id: el.id || null,
+            xpath: el.id ? null : xpathFor(el),
+            required: isRequired(group, el),
+            value: currentValue(el, fieldType),
+            options: options
+        });
+        seenInputs.add(el);
+    } catch (e) {}
+}
+return fields;
+"""
+
+
+# Labels of fields that are file uploads, not questions (substring match)
+_NO_ANSWER_LABEL_RE = re.compile(r"upload|attach|resume|cv", re.IGNORECASE)
+
+# Form group class names marking a required field
+_REQUIRED_CLASS_RE = re.compile(r"required", re.IGNORECASE)
+
+
 class FieldType(str, Enum):
     TEXT = "text"
     TEXTAREA = "textarea"
@@ -30,7 +165,7 @@ class FieldType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class FormField:
     """Represents a form field extracted from DOM"""
     label_text: str
@@ -52,7 +187,7 @@ class FormField:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSchema:
     """Schema of a form page"""
     fields: List[FormField]
@@ -70,44 +205,77 @@ class DOMFieldExtractor:
     """
     
     # LinkedIn-specific selectors (most reliable)
-    LINKEDIN_FORM_SELECTORS = [
+    LINKEDIN_FORM_SELECTORS = (
         ".jobs-easy-apply-form-section__grouping",
         ".fb-dash-form-element",
         "[data-test-form-builder-radio-button-form-component]",
         "[data-test-text-entity-list-form-component]",
         ".jobs-easy-apply-form-element",
-    ]
+    )
     
     # Generic form field selectors (fallback)
-    GENERIC_FIELD_SELECTORS = [
+    GENERIC_FIELD_SELECTORS = (
         ".form-group",
         ".field-group",
         "[class*='form-field']",
         "[class*='input-group']",
-    ]
+    )
     
-    # Input element selectors
-    INPUT_SELECTORS = {
-        FieldType.TEXT: ["input[type='text']", "input[type='email']", "input[type='tel']", "input[type='number']", "input:not([type])"],
-        FieldType.TEXTAREA: ["textarea"],
-        FieldType.SELECT: ["select"],
-        FieldType.CHECKBOX: ["input[type='checkbox']"],
-        FieldType.RADIO: ["input[type='radio']"],
-        FieldType.FILE: ["input[type='file']"],
-    }
+    # Input element selectors (priority order)
+    INPUT_SELECTORS = (
+        (FieldType.TEXT, ("input[type='text']", "input[type='email']", "input[type='tel']", "input[type='number']", "input:not([type])")),
+        (FieldType.TEXTAREA, ("textarea",)),
+        (FieldType.SELECT, ("select",)),
+        (FieldType.CHECKBOX, ("input[type='checkbox']",)),
+        (FieldType.RADIO, ("input[type='radio']",)),
+        (FieldType.FILE, ("input[type='file']",)),
+    )
     
     # Label selectors (priority order)
-    LABEL_SELECTORS = [
+    LABEL_SELECTORS = (
         "label",
         "legend",
         ".fb-dash-form-element__label",
         "[class*='label']",
         "span.t-bold",
         ".artdeco-text-input--label",
-    ]
+    )
+    
+    # Button texts (case-insensitive substring match)
+    NEXT_BUTTON_TEXTS = ("Next", "Continue", "Review")
+    SUBMIT_BUTTON_TEXTS = ("Submit", "Apply", "Send")
+    
+    # <input type=...> -> field type (a missing type reads back as "text")
+    INPUT_TYPE_MAP = {
+        "text": FieldType.TEXT,
+        "email": FieldType.TEXT,
+        "tel": FieldType.TEXT,
+        "number": FieldType.TEXT,
+        "checkbox": FieldType.CHECKBOX,
+        "radio": FieldType.RADIO,
+        "file": FieldType.FILE,
+    }
     
     def __init__(self):
         self._field_cache: Dict[str, FormField] = {}
+        
+        # Comma-joined selector unions - one find_elements call per lookup
+        self._linkedin_union = ",".join(self.LINKEDIN_FORM_SELECTORS)
+        self._generic_union = ",".join(self.GENERIC_FIELD_SELECTORS)
+        self._input_union = "input,textarea,select"
+        # Field type -> priority (INPUT_SELECTORS order) when a group has several inputs
+        self._input_priority = {t: rank for rank, (t, _) in enumerate(self.INPUT_SELECTORS)}
+        # One XPath per button purpose, matching any of its texts
+        self._next_button_xpath = self._button_xpath(self.NEXT_BUTTON_TEXTS)
+        self._submit_button_xpath = self._button_xpath(self.SUBMIT_BUTTON_TEXTS)
+        
+        # Argument for the injected extraction script (built once)
+        self._js_config = {
+            "linkedin": self._linkedin_union,
+            "generic": self._generic_union,
+            "labels": self.LABEL_SELECTORS,
+            "inputs": [[t.value, selectors] for t, selectors in self.INPUT_SELECTORS],
+        }
     
     def extract_fields(self, driver: WebDriver) -> List[FormField]:
         """
@@ -120,58 +288,97 @@ class DOMFieldExtractor:
             logger.warning("Selenium not available")
             return []
         
+        try:
+            fields = self._extract_fields_js(driver)
+        except Exception as e:
+            logger.debug(f"JS field extraction failed, using Selenium: {e}")
+            fields = self._extract_fields_selenium(driver)
+        
+        # Deduplicate by label (first field wins)
+        by_label: Dict[str, FormField] = {}
+        for f in fields:
+            by_label.setdefault(f.label_text.lower(), f)
+        unique_fields = list(by_label.values())
+        
+        logger.info(f"DOM extracted {len(unique_fields)} fields")
+        return unique_fields
+    
+    def _extract_fields_js(self, driver: WebDriver) -> List[FormField]:
+        """Extract all form fields with one injected script (single round-trip)"""
+        descriptors = driver.execute_script(_EXTRACT_FIELDS_JS, self._js_config)
+        if not isinstance(descriptors, list):
+            raise ValueError(f"unexpected script result: {type(descriptors).__name__}")
+        
+        fields = []
+        for d in descriptors:
+            field_type = FieldType(d["type"])
+            label_text = sys.intern(d["label"].strip())  # Labels repeat across pages/jobs
+            current_value = d.get("value") or ""
+            fields.append(FormField(
+                label_text=label_text,
+                field_type=field_type,
+                element_id=d.get("id"),
+                element_xpath=d.get("xpath"),
+                is_required=bool(d.get("required")),
+                current_value=current_value,
+                options=d.get("options") or [],
+                needs_answer=self._needs_answer(field_type, current_value, label_text)
+            ))
+        return fields
+    
+    def _extract_fields_selenium(self, driver: WebDriver) -> List[FormField]:
+        """Extract all form fields element by element (fallback, one round-trip per lookup)"""
         fields = []
         
         # Try LinkedIn selectors first
-        form_groups = self._find_form_groups(driver, self.LINKEDIN_FORM_SELECTORS)
+        form_groups = self._find_form_groups(driver, self._linkedin_union)
         
         # Fallback to generic selectors
         if not form_groups:
-            form_groups = self._find_form_groups(driver, self.GENERIC_FIELD_SELECTORS)
+            form_groups = self._find_form_groups(driver, self._generic_union)
         
+        # Nested groups (e.g. .fb-dash-form-element inside a grouping) wrap the
+        # same input - skip inputs that already produced a field
+        seen_inputs = set()
         for group in form_groups:
             try:
-                field = self._extract_field_from_group(group)
+                field = self._extract_field_from_group(group, seen_inputs)
                 if field and field.label_text:
                     fields.append(field)
             except Exception as e:
                 logger.debug(f"Error extracting field: {e}")
                 continue
         
-        # Deduplicate by label
-        seen_labels = set()
-        unique_fields = []
-        for f in fields:
-            if f.label_text.lower() not in seen_labels:
-                seen_labels.add(f.label_text.lower())
-                unique_fields.append(f)
-        
-        logger.info(f"DOM extracted {len(unique_fields)} fields")
-        return unique_fields
+        return fields
     
-    def _find_form_groups(self, driver: WebDriver, selectors: List[str]) -> List[WebElement]:
-        """Find form groups using multiple selectors"""
-        groups = []
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                groups.extend(elements)
-            except Exception:
-                continue
-        return groups
+    def _find_form_groups(self, driver: WebDriver, selector_union: str) -> List[WebElement]:
+        """Find form groups matching a comma-joined selector union (document order)"""
+        try:
+            return driver.find_elements(By.CSS_SELECTOR, selector_union)
+        except Exception:
+            return []
     
-    def _extract_field_from_group(self, group: WebElement) -> Optional[FormField]:
-        """Extract field info from a form group element"""
+    def _extract_field_from_group(self, group: WebElement, seen_inputs: Optional[set] = None) -> Optional[FormField]:
+        """
+        Extract field info from a form group element
         
-        # Get label text
-        label_text = self._extract_label(group)
-        if not label_text:
-            return None
+        Args:
+            group: Form group element
+            seen_inputs: WebElement ids of inputs already extracted; the group is
+                skipped if its input is in the set, and added once extracted
+        """
         
         # Find input element and determine type
         field_type, input_elem = self._find_input_element(group)
         if not input_elem:
             return None
+        if seen_inputs is not None and input_elem.id in seen_inputs:
+            return None
+        
+        # Get label text
+        label_text = self._extract_label(group)
+        if not label_text:
+            return None
         
         # Get element identifier
         element_id = input_elem.get_attribute("id")
@@ -199,8 +406,11 @@ class DOMFieldExtractor:
         # Determine if needs answer
         needs_answer = self._needs_answer(field_type, current_value, label_text)
         
+        if seen_inputs is not None:
+            seen_inputs.add(input_elem.id)
+        
         return FormField(
-            label_text=label_text.strip(),
+            label_text=sys.intern(label_text.strip()),  # Labels repeat across pages/jobs
             field_type=field_type,
             element_id=element_id,
             element_xpath=element_xpath,
@@ -212,15 +422,19 @@ class DOMFieldExtractor:
     
     def _extract_label(self, group: WebElement) -> str:
         """Extract label text from group"""
+        # find_elements returns [] on a miss instead of raising NoSuchElementException
+        find_elements = group.find_elements
         for selector in self.LABEL_SELECTORS:
             try:
-                label = group.find_element(By.CSS_SELECTOR, selector)
-                text = label.text.strip()
+                matches = find_elements(By.CSS_SELECTOR, selector)
+                if not matches:
+                    continue
+                text = matches[0].text.strip()
                 if text and len(text) > 1:
                     # Clean up asterisks and extra whitespace
                     text = text.replace("*", "").strip()
                     return text
-            except:
+            except Exception:
                 continue
         
         # Try aria-label on input
@@ -236,17 +450,40 @@ class DOMFieldExtractor:
         return ""
     
     def _find_input_element(self, group: WebElement) -> tuple:
-        """Find the input element and its type"""
-        for field_type, selectors in self.INPUT_SELECTORS.items():
-            for selector in selectors:
-                try:
-                    elem = group.find_element(By.CSS_SELECTOR, selector)
-                    if elem.is_displayed():
-                        return (field_type, elem)
-                except:
-                    continue
+        """
+        Find the input element and its type.
+        
+        Fetches all inputs in one call, classifies them locally and returns the
+        first displayed one in INPUT_SELECTORS priority order.
+        """
+        candidates = []
+        try:
+            for elem in group.find_elements(By.CSS_SELECTOR, self._input_union):
+                field_type = self._classify_input(elem)
+                if field_type is not None:
+                    candidates.append((self._input_priority[field_type], field_type, elem))
+        except Exception:
+            return (FieldType.UNKNOWN, None)
+        
+        # Stable sort keeps document order within the same field type
+        candidates.sort(key=lambda c: c[0])
+        for _, field_type, elem in candidates:
+            try:
+                if elem.is_displayed():
+                    return (field_type, elem)
+            except Exception:
+                continue
         return (FieldType.UNKNOWN, None)
     
+    def _classify_input(self, elem: WebElement) -> Optional[FieldType]:
+        """Map an input/textarea/select element to its field type (None if unsupported)"""
+        tag = elem.tag_name.lower()
+        if tag == "textarea":
+            return FieldType.TEXTAREA
+        if tag == "select":
+            return FieldType.SELECT
+        return self.INPUT_TYPE_MAP.get((elem.get_attribute("type") or "text").lower())
+    
     def _is_field_required(self, group: WebElement, input_elem: WebElement) -> bool:
         """Check if field is required"""
         try:
@@ -261,8 +498,7 @@ class DOMFieldExtractor:
                 return True
             
             # Check for required class
-            classes = group.get_attribute("class") or ""
-            if "required" in classes.lower():
+            if _REQUIRED_CLASS_RE.search(group.get_attribute("class") or ""):
                 return True
                 
         except:
@@ -275,9 +511,8 @@ class DOMFieldExtractor:
             if field_type == FieldType.CHECKBOX:
                 return "checked" if input_elem.is_selected() else ""
             elif field_type == FieldType.SELECT:
-                from selenium.webdriver.support.ui import Select
-                select = Select(input_elem)
-                return select.first_selected_option.text if select.first_selected_option else ""
+                selected = input_elem.find_elements(By.CSS_SELECTOR, "option:checked")
+                return selected[0].text if selected else ""
             else:
                 return input_elem.get_attribute("value") or ""
         except:
@@ -298,9 +533,10 @@ class DOMFieldExtractor:
             radios = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
             options = []
             for radio in radios:
-                label = radio.find_element(By.XPATH, "./following-sibling::label | ./parent::label")
-                if label:
-                    options.append(label.text.strip())
+                labels = radio.find_elements(By.XPATH, "./following-sibling::label | ./parent::label")
+                if not labels:
+                    return []  # Unlabeled radio - options can't be trusted
+                options.append(labels[0].text.strip())
             return options
         except:
             return []
@@ -316,8 +552,7 @@ class DOMFieldExtractor:
             return False
         
         # Auto-filled fields (name, email often pre-filled)
-        label_lower = label.lower()
-        if any(w in label_lower for w in ["upload", "attach", "resume", "cv"]):
+        if _NO_ANSWER_LABEL_RE.search(label):
             return False  # File upload
         
         return True
@@ -349,19 +584,24 @@ class DOMFieldExtractor:
         Hash is based on field labels only, not values.
         Same form structure = same hash.
         """
-        fields = self.extract_fields(driver)
-        labels = sorted([f.label_text.lower() for f in fields])
-        content = json.dumps(labels, sort_keys=True)
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        return self._hash_from_fields(self.extract_fields(driver))
+    
+    def _hash_from_fields(self, fields: List[FormField]) -> str:
+        """Hash already-extracted fields (same result as get_page_hash, no DOM access)"""
+        h = hashlib.blake2b(digest_size=8)
+        for label in sorted([f.label_text.lower() for f in fields]):
+            h.update(label.encode())
+            h.update(b"\x00")
+        return h.hexdigest()
     
     def get_form_schema(self, driver: WebDriver) -> FormSchema:
         """Get complete form schema including buttons"""
         fields = self.extract_fields(driver)
-        page_hash = self.get_page_hash(driver)
+        page_hash = self._hash_from_fields(fields)
         
         # Check for buttons
-        has_next = self._has_button(driver, ["Next", "Continue", "Review"])
-        has_submit = self._has_button(driver, ["Submit", "Apply", "Send"])
+        has_next = self._has_button(driver, self._next_button_xpath)
+        has_submit = self._has_button(driver, self._submit_button_xpath)
         
         return FormSchema(
             fields=fields,
@@ -370,16 +610,17 @@ class DOMFieldExtractor:
             has_submit_button=has_submit
         )
     
-    def _has_button(self, driver: WebDriver, texts: List[str]) -> bool:
-        """Check if page has button with given text"""
-        for text in texts:
-            try:
-                buttons = driver.find_elements(
-                    By.XPATH, 
-                    f"//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]"
-                )
-                if any(b.is_displayed() for b in buttons):
-                    return True
-            except:
-                continue
-        return False
+    @staticmethod
+    def _button_xpath(texts: tuple) -> str:
+        """XPath matching buttons whose text contains any of `texts` (case-insensitive)"""
+        lowered = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+        return "//button[" + " or ".join(
+            f"contains({lowered}, '{text.lower()}')" for text in texts
+        ) + "]"
+    
+    def _has_button(self, driver: WebDriver, xpath: str) -> bool:
+        """Check if page has a displayed button matching the precomputed XPath"""
+        try:
+            return any(b.is_displayed() for b in driver.find_elements(By.XPATH, xpath))
+        except Exception:
+            return False
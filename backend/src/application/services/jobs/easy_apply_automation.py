@@ -2,13 +2,19 @@
 Easy Apply Automation - FIXED VERSION
 Selenium-based LinkedIn Easy Apply form automation
 """
+import asyncio
+import atexit
 import time
 import json
 import tempfile
 import base64
+import hashlib
 import os
 import random
-from typing import Optional, Dict, Any, List, Tuple
+import re
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from dataclasses import dataclass
 from loguru import logger
 
@@ -24,7 +30,6 @@ try:
     from selenium.common.exceptions import (
         TimeoutException, 
         NoSuchElementException,
-        ElementClickInterceptedException,
         StaleElementReferenceException
     )
     SELENIUM_AVAILABLE = True
@@ -32,6 +37,430 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     logger.warning("Selenium not available - Easy Apply will be simulated")
 
+# Form answer helpers (optional - need httpx and app settings)
+try:
+    from .form_answer_generator import detect_field_type
+    FORM_GENERATOR_AVAILABLE = True
+except ImportError:
+    FORM_GENERATOR_AVAILABLE = False
+    logger.warning("Form answer generator not available - only mapped fields will be filled")
+
+    def detect_field_type(label: str) -> Optional[str]:
+        return None
+
+# Faster JSON decoding for script payloads (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Anything outside printable ASCII plus \n\r\t. This already covers zero-width
+# characters and lone surrogates (emoji halves), so one pass is enough
+_NON_PRINTABLE_RE = re.compile(r"[^\n\r\t\x20-\x7E]")
+_CURRENT_JOB_ID_RE = re.compile(r"currentJobId=(\d+)")
+
+
+@lru_cache(maxsize=256)
+def _sanitize_cached(text: str, max_len: int) -> str:
+    """Strip non-printables and trim; memoized since question labels repeat across forms."""
+    return _NON_PRINTABLE_RE.sub("", text).strip()[:max_len]
+
+
+# Returns the first visible Easy Apply anchor/button (or null) in one round-trip
+_FIND_EASY_APPLY_JS = """
+const candidates = document.querySelectorAll(
+    "a.jobs-apply-button, button.jobs-apply-button, " +
+    "a[data-control-name='jobdetails_topcard_inapply'], " +
+    "button[data-control-name='jobdetails_topcard_inapply'], " +
+    "button[aria-label*='Easy Apply']"
+);
+for (const el of candidates) {
+    const text = (el.innerText || '') + ' ' + (el.getAttribute('aria-label') || '');
+    if (/easy apply/i.test(text) && el.offsetParent !== null && !el.disabled) {
+        return el;
+    }
+}
+return null;
+"""
+
+
+# Every visible, enabled <a>/<button> whose text mentions Easy Apply, filtered
+# in-browser instead of reading text/displayed/enabled per element over the wire
+_EASY_APPLY_TEXT_SEARCH_JS = """
+return Array.from(document.querySelectorAll('a, button')).filter(el =>
+    /easy apply/i.test(el.innerText || '') && el.offsetParent !== null && !el.disabled
+);
+"""
+
+
+# Reports LinkedIn's error banners and whether an Easy Apply control exists,
+# so navigate_to_job never has to pull page_source over the wire
+_PAGE_STATUS_JS = """
+const text = (document.body ? document.body.innerText : '').toLowerCase();
+const hasError = text.includes('no matching jobs found') || text.includes('problem loading');
+const hasEasyApply = !!document.querySelector('a.jobs-apply-button, button.jobs-apply-button') ||
+    Array.from(document.querySelectorAll('a, button')).some(el => (el.textContent || '').includes('Easy Apply'));
+return {has_error: hasError, has_easy_apply: hasEasyApply};
+"""
+
+
+# Post-submit state in one round-trip: the first success phrase matched by the
+# alternation regex source in arguments[0] (one case-insensitive pass over the
+# page text), and whether the modal / Easy Apply button are 'none', 'hidden'
+# or shown ('visible' / 'disabled' / 'enabled')
+_SUBMISSION_STATE_JS = """
+const match = new RegExp(arguments[0], 'i').exec(document.body ? document.body.innerText : '');
+const isShown = el => el.offsetParent !== null;
+const modal = document.querySelector("[role='dialog'], .artdeco-modal");
+const button = document.querySelector('button.jobs-apply-button') ||
+    Array.from(document.querySelectorAll('button')).find(b => (b.textContent || '').includes('Easy Apply'));
+return {
+    indicator: match ? match[0].toLowerCase() : null,
+    modal: !modal ? 'none' : (isShown(modal) ? 'visible' : 'hidden'),
+    button: !button ? 'none' : !isShown(button) ? 'hidden'
+        : (button.getAttribute('aria-disabled') === 'true' ? 'disabled' : 'enabled'),
+};
+"""
+
+
+# Sets an input/textarea value through the native setter (so framework-managed
+# inputs see the change) and dispatches input + change events
+_SET_FIELD_VALUE_JS = """
+const el = arguments[0];
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+setter.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+# Selects the first <option> whose text contains arguments[1] (else the first
+# non-placeholder option) and fires change. Returns whether the text matched
+_SELECT_OPTION_JS = """
+const sel = arguments[0], want = (arguments[1] || '').toLowerCase();
+const fire = () => {
+    sel.dispatchEvent(new Event('input', {bubbles: true}));
+    sel.dispatchEvent(new Event('change', {bubbles: true}));
+};
+for (const o of sel.options) {
+    if (o.text.toLowerCase().includes(want)) {
+        sel.value = o.value;
+        fire();
+        return true;
+    }
+}
+if (sel.options.length > 1) {
+    sel.selectedIndex = 1;
+    fire();
+}
+return false;
+"""
+
+
+# Walks every form group in-browser and returns [{key, question, type, options, required}, ...]
+# as a JSON string (decoded in one pass instead of Selenium unwrapping each value).
+# Each control is tagged with data-autopass-field (its group with
+# data-autopass-group) so the fill pass can find it again without a lookup ladder
+_FORM_INVENTORY_JS = """
+document.querySelectorAll('[data-autopass-field], [data-autopass-group]').forEach(el => {
+    el.removeAttribute('data-autopass-field');
+    el.removeAttribute('data-autopass-group');
+});
+const LADDER = [
+    ["input[type='text'], input[type='email'], input[type='tel'], input[type='number'], input[type='url']", 'text'],
+    ['textarea', 'textarea'],
+    ['select', 'dropdown'],
+    ["input[type='checkbox']", 'checkbox'],
+    ["input[type='file']", 'file'],
+    ["input[type='radio']", 'radio'],
+];
+const fields = [];
+const seen = new Set();
+for (const group of document.querySelectorAll(arguments[0])) {
+    const labelEl = group.querySelector('label, legend, span.t-bold');
+    const question = labelEl ? (labelEl.innerText || '').trim() : '';
+    if (!question) continue;
+    let el = null, type = null;
+    for (const [css, t] of LADDER) {
+        el = group.querySelector(css);
+        if (el) { type = t; break; }
+    }
+    if (!el || seen.has(el)) continue;
+    seen.add(el);
+    const key = String(fields.length);
+    el.setAttribute('data-autopass-field', key);
+    group.setAttribute('data-autopass-group', key);
+    let options = [];
+    if (type === 'dropdown') {
+        options = Array.from(el.options).map(o => o.text.trim()).filter(t => t && !/^select an option$/i.test(t));
+    } else if (type === 'radio') {
+        options = Array.from(group.querySelectorAll("input[type='radio']"))
+            .map(r => (r.nextElementSibling ? r.nextElementSibling.innerText || '' : r.value || '').trim())
+            .filter(Boolean);
+    }
+    const required = !!group.querySelector("[required], [aria-required='true']");
+    fields.push({key: key, question: question, type: type, options: options, required: required});
+}
+return JSON.stringify(fields);
+"""
+
+
+# Visible, enabled footer buttons for [[action, xpath], ...] in priority order,
+# deduplicated, as [{element, text, action}] - one call per click attempt
+_FOOTER_CANDIDATES_JS = """
+const seen = new Set();
+const out = [];
+for (const [action, xpath] of arguments[0]) {
+    const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const button = result.snapshotItem(i);
+        if (seen.has(button)) continue;
+        seen.add(button);
+        if (button.offsetParent === null || button.disabled) continue;
+        out.push({element: button, text: (button.innerText || '').trim(), action: action});
+    }
+}
+return out;
+"""
+
+
+# Maps [[key, isGroup], ...] to the tagged control (or its group) or null
+_RESOLVE_FIELDS_JS = """
+return arguments[0].map(([key, isGroup]) =>
+    document.querySelector(`[data-autopass-${isGroup ? 'group' : 'field'}="${key}"]`));
+"""
+
+
+# Picks the option whose label best matches the answer: exact, then label
+# containing the answer, then answer starting with the label ("Yes, I am
+# authorized" -> "Yes"). Returns null when nothing matches
+_BEST_OPTION_JS = """
+const bestOption = (items, labelOf, want) => {
+    if (!want) return null;
+    let best = null, bestRank = 0;
+    for (const item of items) {
+        const label = (labelOf(item) || '').trim().toLowerCase();
+        if (!label) continue;
+        const rank = label === want ? 3 : label.includes(want) ? 2 : want.startsWith(label) ? 1 : 0;
+        if (rank > bestRank) {
+            best = item;
+            bestRank = rank;
+            if (rank === 3) break;
+        }
+    }
+    return best;
+};
+"""
+
+
+# Fills [[key, type, value], ...] from _FORM_INVENTORY_JS in one round-trip.
+# Returns {failed, unmatched}: keys it could not handle (for the Selenium
+# fallback) and required choice fields where no option matches the answer
+_FILL_FIELDS_JS = _BEST_OPTION_JS + """
+const fire = el => {
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+};
+const isRequired = key => {
+    const group = document.querySelector(`[data-autopass-group="${key}"]`);
+    return !!(group && group.querySelector("[required], [aria-required='true']"));
+};
+const failed = [];
+const unmatched = [];
+for (const [key, type, value] of arguments[0]) {
+    const el = document.querySelector(`[data-autopass-field="${key}"]`);
+    const want = (value || '').trim().toLowerCase();
+    try {
+        if (!el) {
+            failed.push(key);
+        } else if (type === 'text' || type === 'textarea') {
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+            setter.call(el, value);
+            fire(el);
+        } else if (type === 'dropdown') {
+            const opt = bestOption(Array.from(el.options), o => o.text, want);
+            if (opt) {
+                el.value = opt.value;
+                fire(el);
+            } else if (isRequired(key)) {
+                unmatched.push(key);
+            }
+        } else if (type === 'checkbox') {
+            if (!el.checked) el.click();
+        } else if (type === 'radio') {
+            const group = document.querySelector(`[data-autopass-group="${key}"]`);
+            const radios = Array.from(group.querySelectorAll("input[type='radio']")).filter(r => !r.disabled);
+            const labelOf = r => r.nextElementSibling ? r.nextElementSibling.innerText || '' : '';
+            const pick = bestOption(radios, labelOf, want) || bestOption(radios, r => r.value, want);
+            if (pick) pick.click(); else if (isRequired(key)) unmatched.push(key);
+        } else {
+            failed.push(key);
+        }
+    } catch (e) {
+        failed.push(key);
+    }
+}
+return {failed: failed, unmatched: unmatched};
+"""
+
+
+# Chrome drivers kept alive between automation runs as (headless, driver), so
+# a new batch skips the Chrome cold start. Drivers are reset, not quit, on release
+_DRIVER_POOL: List[Tuple[bool, Any]] = []
+_DRIVER_POOL_LOCK = threading.Lock()
+MAX_DRIVER_POOL_SIZE = 2
+
+
+def _quit_quietly(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _driver_is_healthy(driver) -> bool:
+    """A pooled driver is reusable only while its session still answers a trivial script."""
+    try:
+        return bool(driver.session_id) and driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+
+def acquire_driver(headless: bool) -> Optional[Any]:
+    """
+    Take a live pooled driver started with the same headless flag.
+    
+    Drivers whose session was lost are quit and skipped.
+    
+    Args:
+        headless: Headless flag the driver must have been started with
+        
+    Returns:
+        A reusable driver, or None if the pool has none
+    """
+    while True:
+        with _DRIVER_POOL_LOCK:
+            index = next((i for i, (pooled_headless, _) in enumerate(_DRIVER_POOL) if pooled_headless == headless), None)
+            if index is None:
+                return None
+            _, driver = _DRIVER_POOL.pop(index)
+        if _driver_is_healthy(driver):
+            return driver
+        _quit_quietly(driver)
+
+
+def release_driver(driver, headless: bool) -> bool:
+    """
+    Clear a driver's session state and park it in the pool.
+    
+    Args:
+        driver: Driver to release
+        headless: Headless flag it was started with
+        
+    Returns:
+        True if pooled; False if the pool is full or the reset failed (caller should quit it)
+    """
+    try:
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": "https://www.linkedin.com",
+            "storageTypes": "all",
+        })
+        driver.get("about:blank")
+    except Exception as e:
+        logger.debug(f"Driver reset failed, not pooling it: {e}")
+        return False
+    
+    with _DRIVER_POOL_LOCK:
+        if len(_DRIVER_POOL) >= MAX_DRIVER_POOL_SIZE:
+            return False
+        _DRIVER_POOL.append((headless, driver))
+    return True
+
+
+def close_driver_pool() -> None:
+    """Quit every pooled driver (application shutdown)."""
+    with _DRIVER_POOL_LOCK:
+        drivers = [driver for _, driver in _DRIVER_POOL]
+        _DRIVER_POOL.clear()
+    for driver in drivers:
+        _quit_quietly(driver)
+    if drivers:
+        logger.info(f"🧹 Closed {len(drivers)} pooled Chrome driver(s)")
+
+
+# Decoded resume PDFs on disk, keyed by a hash of their base64 payload, so a
+# batch applying with the same resume decodes and writes it only once
+_RESUME_FILES: Dict[str, str] = {}
+
+# Write resumes to tmpfs when available so Chrome reads uploads from memory;
+# None falls back to the default temp directory
+_RESUME_DIR: Optional[str] = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+@atexit.register
+def _remove_resume_files() -> None:
+    for path in _RESUME_FILES.values():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _RESUME_FILES.clear()
+
+
+def _latest_experience(user_data: Dict[str, Any]) -> Dict[str, Any]:
+    exp = user_data.get("resume_parsed_data", {}).get("experience", [])
+    return exp[0] if exp else {}
+
+
+def _total_experience_years(user_data: Dict[str, Any]) -> str:
+    total = sum([
+        user_data.get("exp_years_internship", 0) or 0,
+        user_data.get("exp_years_entry_level", 0) or 0,
+        user_data.get("exp_years_associate", 0) or 0,
+        user_data.get("exp_years_mid_senior_level", 0) or 0,
+        user_data.get("exp_years_director", 0) or 0,
+        user_data.get("exp_years_executive", 0) or 0,
+    ])
+    return str(max(total, 2))
+
+
+_WHY_INTERESTED = "I am interested in this opportunity because it aligns with my skills and career goals."
+
+# field_type -> (user_data, job_data, context) -> value, built once at import
+_FIELD_HANDLERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], Any], str]] = {
+    # Direct mappings
+    "name": lambda u, j, c: u.get("full_name", ""),
+    "email": lambda u, j, c: u.get("email", ""),
+    "phone": lambda u, j, c: u.get("phone", u.get("resume_parsed_data", {}).get("contact", {}).get("phone", "")),
+    "linkedin": lambda u, j, c: u.get("linkedin_url", ""),
+    "years_experience": lambda u, j, c: _total_experience_years(u),
+    "current_title": lambda u, j, c: (
+        _latest_experience(u).get("title", "")
+        if u.get("resume_parsed_data", {}).get("experience") else u.get("target_job_title", "")
+    ),
+    "current_company": lambda u, j, c: _latest_experience(u).get("company", ""),
+    "salary": lambda u, j, c: "Open to discussion based on total compensation",
+    "sponsorship": lambda u, j, c: "Yes",  # Authorized to work
+    "start_date": lambda u, j, c: "Available within 2 weeks",
+    "relocation": lambda u, j, c: "Yes",
+    # AI-generated fields: empty unless pre-generated, so the async path asks the LLM
+    "cover_letter": lambda u, j, c: u.get("generated_cover_letter", ""),
+    "summary": lambda u, j, c: u.get("resume_summary", ""),
+    "headline": lambda u, j, c: u.get("generated_headline", ""),
+    "why_interested": lambda u, j, c: _WHY_INTERESTED,
+}
+
+# Placeholder text for the synchronous paths, which have no LLM to fall back on
+_FIELD_FALLBACKS: Dict[str, str] = {
+    "cover_letter": "I am excited to apply for this position...",
+    "summary": "Experienced professional seeking new opportunities...",
+    "headline": "Experienced Professional",
+}
+
 
 @dataclass
 class ApplicationResult:
@@ -51,6 +480,92 @@ class EasyApplyAutomation:
     
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
+    # DOM signals waited on instead of fixed sleeps
+    JOB_CARD_SELECTOR = ".jobs-unified-top-card, .job-details-jobs-unified-top-card"
+    MODAL_SELECTOR = "[role='dialog'], .artdeco-modal, .jobs-easy-apply-modal"
+    
+    # Control tag/type -> fill strategy, and which one wins when a group has several
+    CONTROL_INPUT_TYPES = {
+        "text": "text", "email": "text", "tel": "text", "number": "text", "url": "text",
+        "textarea": "textarea",
+        "select": "dropdown",
+        "checkbox": "checkbox",
+        "file": "file",
+        "radio": "radio",
+    }
+    CONTROL_PRIORITY = ("text", "textarea", "dropdown", "checkbox", "file", "radio")
+    
+    # Footer button XPaths, most specific first
+    SUBMIT_SELECTORS = (
+        "//button[contains(@aria-label, 'Submit application')]",
+        "//button[contains(@aria-label, 'Submit your application')]",
+        "//button[contains(., 'Submit application')]",
+        "//button[contains(., 'Submit') and not(contains(., 'Cancel'))]",
+        "//button[@type='submit' and not(contains(., 'Cancel'))]",
+        "//div[contains(@class,'artdeco-modal')]//footer//button[contains(@class,'artdeco-button--primary')]",
+    )
+    NEXT_SELECTORS = (
+        "//button[contains(@aria-label, 'Continue')]",
+        "//button[contains(@aria-label, 'Next')]",
+        "//button[contains(., 'Next') and not(contains(., 'Cancel'))]",
+        "//button[contains(., 'Continue') and not(contains(., 'Cancel'))]",
+        "//button[contains(., 'Review')]",
+        "//button[@type='submit']",
+        "//div[@role='dialog']//button[@type='button' and not(contains(., 'Cancel')) and contains(@class, 'artdeco-button')]",
+        "//div[contains(@class,'artdeco-modal')]//footer//button[contains(@class,'artdeco-button--primary') and not(contains(., 'Cancel'))]",
+    )
+    # [action, xpath] pairs in click priority order
+    FOOTER_SELECTORS = [["submit", xpath] for xpath in SUBMIT_SELECTORS] + [
+        ["next", xpath] for xpath in NEXT_SELECTORS
+    ]
+    
+    # Page text that confirms an application went through
+    SUCCESS_INDICATORS = (
+        "application submitted",
+        "your application was sent",
+        "application sent",
+        "successfully applied",
+        "application complete",
+        "application received",
+        "you've been added",
+        "thank you for applying",
+        "submitted an application",
+        "sent you an application",
+    )
+    SUCCESS_RE = re.compile("|".join(map(re.escape, SUCCESS_INDICATORS)), re.IGNORECASE)
+    
+    # Pause after filling a text field, in seconds
+    FIELD_PAUSE_RANGE = (0.15, 0.35)
+    
+    # LLM answers to profile questions, persisted per user across sessions.
+    # Holds personal data, so it lives in a private (0o700) app data dir
+    ANSWER_CACHE_DIR = os.path.join(
+        os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share"),
+        "autopass",
+        "answers",
+    )
+    
+    # Field types whose answers depend only on the candidate, not the job -
+    # the only LLM answers worth reusing on later applications
+    CACHEABLE_ANSWER_TYPES = frozenset({
+        "name", "email", "phone", "linkedin",
+        "years_experience", "current_title", "current_company",
+        "degree", "school", "gpa",
+        "salary", "start_date", "relocation", "remote", "sponsorship",
+    })
+    
+    # Form group containers on an Easy Apply page
+    FORM_GROUP_SELECTOR = (
+        ".jobs-easy-apply-form-section__grouping, "
+        ".fb-form-element, "
+        "[data-test-form-builder-text-input-form-component], "
+        "[data-test-form-builder-text-area-form-component], "
+        "[data-test-form-builder-dropdown-form-component], "
+        "[data-test-form-builder-radio-button-form-component], "
+        "[data-test-form-builder-checkbox-form-component], "
+        "[data-test-form-builder-file-upload-form-component]"
+    )
+    
     def __init__(self, form_answer_generator=None):
         """
         Initialize Easy Apply automation.
@@ -59,16 +574,44 @@ class EasyApplyAutomation:
             form_answer_generator: Optional FormAnswerGenerator for AI answers
         """
         self.driver = None
+        self._headless = True
         self.form_generator = form_answer_generator
         self.temp_resume_path = None
         self.answered_questions = {}  # Cache of questions already answered
+        self._answer_cache_path = None
+        self._experience_years: Optional[str] = None
+    
+    def _wait_for(self, css: str, timeout: float = 10, visible: bool = False):
+        """
+        Poll until an element matching `css` is present (or visible).
+        
+        Returns:
+            The element, or None on timeout
+        """
+        condition = EC.visibility_of_element_located if visible else EC.presence_of_element_located
+        try:
+            return WebDriverWait(self.driver, timeout).until(condition((By.CSS_SELECTOR, css)))
+        except TimeoutException:
+            return None
+    
+    def _wait_for_modal(self, timeout: float = 15) -> bool:
+        """Wait until the Easy Apply modal is visible (i.e. rendered)"""
+        logger.info("Waiting for Easy Apply modal to load...")
+        return self._wait_for(self.MODAL_SELECTOR, timeout=timeout, visible=True) is not None
     
     def setup_driver(self, headless: bool = True) -> Optional[Any]:
-        """Initialize Chrome driver with stealth settings"""
+        """Initialize Chrome driver with stealth settings, reusing a pooled one if available"""
         if not SELENIUM_AVAILABLE:
             logger.warning("Selenium not available")
             return None
         
+        self._headless = headless
+        pooled = acquire_driver(headless)
+        if pooled:
+            logger.info("♻️ Reusing pooled Chrome driver")
+            self.driver = pooled
+            return self.driver
+        
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -77,11 +620,20 @@ class EasyApplyAutomation:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument(f"user-agent={self.USER_AGENT}")
         
+        # Return from driver.get at DOMContentLoaded; later steps wait for
+        # their own elements. Skip work that never affects the Easy Apply form
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-logging")
+        
         if headless:
             chrome_options.add_argument("--headless=new")
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = webdriver.Chrome(options=chrome_options, keep_alive=True)
             
             # Mask webdriver detection
             self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
@@ -104,11 +656,9 @@ class EasyApplyAutomation:
             return
         
         try:
-            self.driver.get("https://www.linkedin.com")
-            time.sleep(2)
-            
             min_expiry = int(time.time()) + 172800  # 48 hours
             
+            cookie_dicts = []
             for cookie in cookies:
                 cookie_dict = {
                     'name': cookie['name'],
@@ -127,14 +677,26 @@ class EasyApplyAutomation:
                 if 'httpOnly' in cookie:
                     cookie_dict['httpOnly'] = cookie['httpOnly']
                 
-                try:
-                    self.driver.add_cookie(cookie_dict)
-                except Exception as e:
-                    logger.debug(f"Failed to add cookie {cookie.get('name')}: {e}")
+                cookie_dicts.append(cookie_dict)
             
-            # Navigate to feed to verify login
+            # Set every cookie in one CDP call; no need to load the domain first
+            try:
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+                    {**{k: v for k, v in c.items() if k != 'expiry'}, 'expires': c['expiry']}
+                    for c in cookie_dicts
+                ]})
+            except Exception as e:
+                logger.debug(f"CDP cookie batch failed, adding cookies one by one: {e}")
+                self.driver.get("https://www.linkedin.com")
+                for cookie_dict in cookie_dicts:
+                    try:
+                        self.driver.add_cookie(cookie_dict)
+                    except Exception as e:
+                        logger.debug(f"Failed to add cookie {cookie_dict.get('name')}: {e}")
+            
+            # Navigate to feed and wait for the nav bar as the login signal
             self.driver.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
+            self._wait_for("#global-nav", timeout=10)
         except Exception as e:
             logger.error(f"Failed to inject cookies: {e}")
     
@@ -174,17 +736,20 @@ class EasyApplyAutomation:
             Path to temporary resume file
         """
         try:
-            resume_bytes = base64.b64decode(resume_base64)
+            digest = hashlib.blake2b(resume_base64.encode("ascii", "ignore"), digest_size=16).hexdigest()
+            cached_path = _RESUME_FILES.get(digest)
+            if cached_path and os.path.exists(cached_path):
+                self.temp_resume_path = cached_path
+                return self.temp_resume_path
             
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=".pdf",
-                delete=False,
-                prefix="resume_"
-            )
-            temp_file.write(resume_bytes)
-            temp_file.close()
+            fd, path = tempfile.mkstemp(suffix=".pdf", prefix="resume_", dir=_RESUME_DIR)
+            try:
+                os.write(fd, base64.b64decode(resume_base64))
+            finally:
+                os.close(fd)
             
-            self.temp_resume_path = temp_file.name
+            _RESUME_FILES[digest] = path
+            self.temp_resume_path = path
             return self.temp_resume_path
         except Exception as e:
             logger.error(f"Failed to create temp resume: {e}")
@@ -199,7 +764,7 @@ class EasyApplyAutomation:
         - https://www.linkedin.com/jobs/view/4235967640 -> stays unchanged
         """
         try:
-            match = re.search(r"currentJobId=(\d+)", job_url)
+            match = _CURRENT_JOB_ID_RE.search(job_url)
             if match:
                 job_id = match.group(1)
                 return f"https://www.linkedin.com/jobs/search/?currentJobId={job_id}"
@@ -218,42 +783,28 @@ class EasyApplyAutomation:
 
             self.driver.get(target_url)
             
-            # Wait for initial page load
-            time.sleep(3)
-            
-            # Refresh the page to ensure fresh content and cookies
-            logger.info("Refreshing page to get latest content...")
-            self.driver.refresh()
-            time.sleep(3)
+            # Wait for the job details card; refresh only if it never shows up
+            # (stale content / cookies)
+            if self._wait_for(self.JOB_CARD_SELECTOR, timeout=10):
+                logger.info("Job details card loaded successfully")
+            else:
+                logger.info("Job details card not loaded, refreshing page...")
+                self.driver.refresh()
+                if self._wait_for(self.JOB_CARD_SELECTOR, timeout=10):
+                    logger.info("Job details card loaded successfully after refresh")
+                else:
+                    logger.warning("Job details card did not load within timeout")
             
             current_url = self.driver.current_url
-            logger.info(f"Current URL after navigation and refresh: {current_url}")
-            
-            # Wait for page elements to load
-            try:
-                wait = WebDriverWait(self.driver, 10)
-                wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, ".jobs-unified-top-card, .job-details-jobs-unified-top-card")
-                    )
-                )
-                logger.info("Job details card loaded successfully")
-            except TimeoutException:
-                logger.warning("Job details card did not load within timeout")
+            logger.info(f"Current URL after navigation: {current_url}")
             
             # Check for error pages but allow if Easy Apply button exists
-            page_source = self.driver.page_source.lower()
-            if "no matching jobs found" in page_source or "problem loading" in page_source:
-                try:
-                    easy_apply_elements = self.driver.find_elements(
-                        By.XPATH, 
-                        "//a[contains(., 'Easy Apply')] | //button[contains(., 'Easy Apply')]"
-                    )
-                    if easy_apply_elements:
-                        logger.warning("Error text detected but Easy Apply elements present; continuing")
-                        return True
-                except Exception:
-                    pass
+            # (checked in-browser: only two booleans come back)
+            status = self.driver.execute_script(_PAGE_STATUS_JS) or {}
+            if status.get("has_error"):
+                if status.get("has_easy_apply"):
+                    logger.warning("Error text detected but Easy Apply elements present; continuing")
+                    return True
                 logger.warning(f"LinkedIn reported error page; continuing anyway: {current_url}")
                 return True
             
@@ -262,15 +813,66 @@ class EasyApplyAutomation:
             logger.error(f"Failed to navigate to job: {e}")
             return False
     
+    def _find_easy_apply_js(self):
+        """
+        Find the first visible Easy Apply anchor/button with one browser-side query.
+        
+        Returns:
+            WebElement, or None if not (yet) on the page
+        """
+        return self.driver.execute_script(_FIND_EASY_APPLY_JS)
+    
+    def _click_element(self, element, label: str) -> bool:
+        """
+        Click an element, trying a JS click first (no viewport or animation
+        dependency), then a regular click, then ActionChains.
+        """
+        try:
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element
+            )
+            logger.info(f"Clicked {label} with JS click")
+            return True
+        except Exception as e:
+            logger.debug(f"JS click failed: {e}")
+        
+        try:
+            element.click()
+            logger.info(f"Clicked {label} with regular click")
+            return True
+        except Exception as e:
+            logger.debug(f"Regular click failed: {e}")
+        
+        try:
+            self._human_click(element)
+            logger.info(f"Clicked {label} with ActionChains")
+            return True
+        except Exception as e:
+            logger.debug(f"ActionChains click failed: {e}")
+        
+        return False
+    
     def click_easy_apply(self) -> bool:
         """Find and click the Easy Apply button/anchor"""
         if not self.driver:
             return False
         
-        # First, wait for page to fully load
-        time.sleep(3)
+        # Fast path: poll one browser-side query for all known Easy Apply controls
+        try:
+            element = WebDriverWait(self.driver, 15).until(lambda d: self._find_easy_apply_js())
+            logger.info(f"Found Easy Apply {element.tag_name} via browser-side lookup")
+            if self._click_element(element, "Easy Apply") and self._wait_for_modal():
+                logger.info("✓ Easy Apply modal appeared after click")
+                return True
+            logger.warning("Modal did not appear after browser-side lookup click, trying selectors...")
+        except TimeoutException:
+            logger.info("Browser-side lookup found no Easy Apply control, trying selectors...")
+        except Exception as e:
+            logger.debug(f"Browser-side Easy Apply lookup failed: {e}")
         
-        wait = WebDriverWait(self.driver, 15)
+        # Fallback ladder - the page has had the fast path's wait to render,
+        # so each selector only gets a short wait
+        wait = WebDriverWait(self.driver, 3)
         
         # LinkedIn uses ANCHOR TAGS for Easy Apply
         anchor_selectors = [
@@ -281,69 +883,6 @@ class EasyApplyAutomation:
             "//a[@data-job-id]//span[contains(text(), 'Easy Apply')]/ancestor::a",
         ]
         
-        for selector in anchor_selectors:
-            try:
-                anchor = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                logger.info(f"Found Easy Apply anchor with: {selector}")
-                
-                # Scroll into view
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", anchor)
-                time.sleep(1.5)
-                
-                # Try multiple click methods
-                clicked = False
-                
-                # Method 1: Regular click
-                try:
-                    anchor.click()
-                    clicked = True
-                    logger.info("Clicked anchor with regular click")
-                except Exception as e:
-                    logger.debug(f"Regular click failed: {e}")
-                
-                # Method 2: JS click if regular failed
-                if not clicked:
-                    try:
-                        self.driver.execute_script("arguments[0].click();", anchor)
-                        clicked = True
-                        logger.info("Clicked anchor with JS click")
-                    except Exception as e:
-                        logger.debug(f"JS click failed: {e}")
-                
-                # Method 3: ActionChains click
-                if not clicked:
-                    try:
-                        self._human_click(anchor)
-                        clicked = True
-                        logger.info("Clicked anchor with ActionChains")
-                    except Exception as e:
-                        logger.debug(f"ActionChains click failed: {e}")
-                
-                if clicked:
-                    # Wait longer for modal to appear after first click
-                    logger.info("Waiting for Easy Apply modal to load...")
-                    time.sleep(5)
-                    try:
-                        modal_wait = WebDriverWait(self.driver, 10)
-                        modal_wait.until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "[role='dialog'], .artdeco-modal, .jobs-easy-apply-modal")
-                            )
-                        )
-                        logger.info("✓ Easy Apply modal appeared after click")
-                        # Additional wait to ensure modal is fully rendered
-                        time.sleep(2)
-                        return True
-                    except TimeoutException:
-                        logger.warning("Modal did not appear after anchor click, continuing to buttons...")
-                        continue
-                        
-            except TimeoutException:
-                continue
-            except Exception as e:
-                logger.debug(f"Anchor selector {selector} failed: {e}")
-                continue
-        
         # Fallback to button selectors
         button_selectors = [
             "//button[contains(@class, 'jobs-apply-button')]",
@@ -355,105 +894,41 @@ class EasyApplyAutomation:
             "//button[@data-control-name='jobdetails_topcard_inapply']",
         ]
         
-        for selector in button_selectors:
-            try:
-                button = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                logger.info(f"Found Easy Apply button with: {selector}")
-                
-                # Scroll into view
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                time.sleep(1.5)
-                
-                # Try multiple click methods
-                clicked = False
-                
-                # Method 1: Regular click
+        for kind, selectors in (("anchor", anchor_selectors), ("button", button_selectors)):
+            for selector in selectors:
                 try:
-                    button.click()
-                    clicked = True
-                    logger.info("Clicked button with regular click")
-                except Exception as e:
-                    logger.debug(f"Regular click failed: {e}")
-                
-                # Method 2: JS click if regular failed
-                if not clicked:
-                    try:
-                        self.driver.execute_script("arguments[0].click();", button)
-                        clicked = True
-                        logger.info("Clicked button with JS click")
-                    except Exception as e:
-                        logger.debug(f"JS click failed: {e}")
-                
-                # Method 3: ActionChains click
-                if not clicked:
-                    try:
-                        self._human_click(button)
-                        clicked = True
-                        logger.info("Clicked button with ActionChains")
-                    except Exception as e:
-                        logger.debug(f"ActionChains click failed: {e}")
-                
-                if clicked:
-                    # Wait longer for modal to appear after first click
-                    logger.info("Waiting for Easy Apply modal to load...")
-                    time.sleep(5)
-                    try:
-                        modal_wait = WebDriverWait(self.driver, 10)
-                        modal_wait.until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "[role='dialog'], .artdeco-modal, .jobs-easy-apply-modal")
-                            )
-                        )
-                        logger.info("✓ Easy Apply modal appeared after click")
-                        # Additional wait to ensure modal is fully rendered
-                        time.sleep(2)
-                        return True
-                    except TimeoutException:
-                        logger.warning("Modal did not appear after button click, continuing...")
-                        continue
+                    element = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
+                    logger.info(f"Found Easy Apply {kind} with: {selector}")
+                    
+                    if self._click_element(element, kind):
+                        # Visibility implies the modal has rendered
+                        if self._wait_for_modal():
+                            logger.info("✓ Easy Apply modal appeared after click")
+                            return True
+                        logger.warning(f"Modal did not appear after {kind} click, continuing...")
                         
-            except TimeoutException:
-                continue
-            except Exception as e:
-                logger.debug(f"Button selector {selector} failed: {e}")
-                continue
+                except TimeoutException:
+                    continue
+                except Exception as e:
+                    logger.debug(f"{kind.capitalize()} selector {selector} failed: {e}")
+                    continue
         
         # Last resort: text search with verification
         try:
             logger.info("Trying text search as last resort...")
-            elements = self.driver.find_elements(By.CSS_SELECTOR, "a, button")
+            elements = self.driver.execute_script(_EASY_APPLY_TEXT_SEARCH_JS) or []
             for elem in elements:
                 try:
-                    elem_text = elem.text.lower()
-                    if "easy apply" in elem_text and elem.is_displayed() and elem.is_enabled():
-                        logger.info(f"Found Easy Apply via text search: {elem.tag_name} - '{elem.text}'")
-                        
-                        # Scroll and click
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", elem)
-                        time.sleep(1.5)
-                        
-                        try:
-                            elem.click()
-                        except Exception:
-                            self.driver.execute_script("arguments[0].click();", elem)
-                        
-                        # Wait longer for modal
-                        logger.info("Waiting for Easy Apply modal to load...")
-                        time.sleep(5)
-                        try:
-                            modal_wait = WebDriverWait(self.driver, 10)
-                            modal_wait.until(
-                                EC.presence_of_element_located(
-                                    (By.CSS_SELECTOR, "[role='dialog'], .artdeco-modal, .jobs-easy-apply-modal")
-                                )
-                            )
-                            logger.info("✓ Easy Apply modal appeared after text search click")
-                            # Additional wait to ensure modal is fully rendered
-                            time.sleep(2)
-                            return True
-                        except TimeoutException:
-                            logger.debug("Modal did not appear, trying next element...")
-                            continue
+                    logger.info("Found Easy Apply via text search")
+                    
+                    if not self._click_element(elem, "text search match"):
+                        continue
+                    
+                    if self._wait_for_modal():
+                        logger.info("✓ Easy Apply modal appeared after text search click")
+                        return True
+                    logger.debug("Modal did not appear, trying next element...")
+                    continue
                             
                 except StaleElementReferenceException:
                     continue
@@ -504,11 +979,9 @@ class EasyApplyAutomation:
             
             if modal:
                 self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", modal)
-                time.sleep(0.5)
             
             # Also scroll page as fallback
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.3)
         except Exception as e:
             logger.debug(f"Scroll modal failed: {e}")
     
@@ -517,15 +990,8 @@ class EasyApplyAutomation:
         try:
             if not text:
                 return ""
-            import re
             # Remove non-printable and emoji characters
-            cleaned = re.sub(r"[\u200B-\u200D\uFEFF]", "", text)
-            cleaned = re.sub(r"[\ud800-\udfff]", "", cleaned)
-            cleaned = re.sub(r"[^\n\r\t\x20-\x7E]", "", cleaned)
-            cleaned = cleaned.strip()
-            if len(cleaned) > max_len:
-                cleaned = cleaned[:max_len]
-            return cleaned
+            return _sanitize_cached(text, max_len)
         except Exception:
             return str(text)[:max_len] if text else ""
 
@@ -575,14 +1041,28 @@ class EasyApplyAutomation:
         """Fill a form field with the given value."""
         try:
             if field_type in ["text", "textarea"]:
-                field_element.clear()
-                # Type like a human
-                for char in str(value):
-                    field_element.send_keys(char)
-                    time.sleep(random.uniform(0.02, 0.08))
+                # Set the whole value in one round-trip (instead of one
+                # send_keys per character), then fire the events the form
+                # framework listens for
+                try:
+                    self.driver.execute_script(_SET_FIELD_VALUE_JS, field_element, str(value))
+                except Exception as e:
+                    logger.debug(f"JS value set failed, falling back to send_keys: {e}")
+                    field_element.clear()
+                    field_element.send_keys(str(value))
+                # One short pause per field (not per character) keeps a
+                # human-looking focus -> value -> move-on rhythm
+                time.sleep(random.uniform(*self.FIELD_PAUSE_RANGE))
                 return True
             
             elif field_type == "dropdown":
+                # Match and select in-browser: one round-trip instead of one
+                # .text read per option
+                try:
+                    self.driver.execute_script(_SELECT_OPTION_JS, field_element, str(value))
+                    return True
+                except Exception as e:
+                    logger.debug(f"JS option select failed, falling back to Select: {e}")
                 select = Select(field_element)
                 # Try to find matching option
                 for option in select.options:
@@ -621,21 +1101,46 @@ class EasyApplyAutomation:
         if not self.driver:
             return False
         
+        try:
+            try:
+                fields = self._inventory_form_fields()
+            except Exception as e:
+                logger.debug(f"JS field inventory failed, using per-group walk: {e}")
+                return self._process_form_groups(user_data, job_data, context)
+            
+            fills: List[Tuple[str, str, str]] = []
+            for field in fields:
+                question = field["question"]
+                input_type = field["type"]
+                field_type = detect_field_type(question)
+                value = (
+                    self._get_field_value(field_type, user_data, job_data, context, question)
+                    or _FIELD_FALLBACKS.get(field_type, "")
+                )
+                if input_type == "file" and not value and self.temp_resume_path:
+                    value = self.temp_resume_path
+                if input_type == "radio":
+                    fills.append((field["key"], input_type, value or "Yes"))
+                elif value:
+                    fills.append((field["key"], input_type, value))
+            
+            self._apply_field_values(fills)
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error processing form page: {e}")
+            return False
+    
+    def _process_form_groups(
+        self,
+        user_data: Dict[str, Any],
+        job_data: Dict[str, Any],
+        context: Any = None
+    ) -> bool:
+        """Fallback: walk form groups one find_element ladder at a time."""
         try:
             # Find all form groups
-            form_groups = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ", ".join([
-                    ".jobs-easy-apply-form-section__grouping",
-                    ".fb-form-element",
-                    "[data-test-form-builder-text-input-form-component]",
-                    "[data-test-form-builder-text-area-form-component]",
-                    "[data-test-form-builder-dropdown-form-component]",
-                    "[data-test-form-builder-radio-button-form-component]",
-                    "[data-test-form-builder-checkbox-form-component]",
-                    "[data-test-form-builder-file-upload-form-component]",
-                ])
-            )
+            form_groups = self.driver.find_elements(By.CSS_SELECTOR, self.FORM_GROUP_SELECTOR)
             
             for group in form_groups:
                 try:
@@ -650,189 +1155,239 @@ class EasyApplyAutomation:
             logger.error(f"Error processing form page: {e}")
             return False
     
+    def _question_key(self, question: str, options: Optional[List[str]] = None) -> str:
+        """
+        Normalized question text (plus its sorted options) used as the answered_questions key.
+        
+        Including the options keeps an answer written for one choice set from
+        being reused against a different one.
+        """
+        key = self._sanitize_text(question).lower()
+        if options:
+            key += " | " + " / ".join(sorted(self._sanitize_text(o).lower() for o in options))
+        return key
+    
+    def _load_answer_cache(self, user_data: Dict[str, Any]) -> None:
+        """Load this user's persisted LLM answers into answered_questions (once per instance)."""
+        if self._answer_cache_path:
+            return
+        owner = user_data.get("email") or user_data.get("full_name") or "anonymous"
+        digest = hashlib.blake2b(owner.encode("utf-8"), digest_size=16).hexdigest()
+        self._answer_cache_path = os.path.join(self.ANSWER_CACHE_DIR, f"{digest}.json")
+        try:
+            with open(self._answer_cache_path, "r", encoding="utf-8") as f:
+                self.answered_questions.update(json.load(f))
+            logger.debug(f"Loaded {len(self.answered_questions)} cached form answers")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Could not load cached form answers: {e}")
+    
+    def _save_answer_cache(self) -> None:
+        """Persist answered_questions atomically so answers survive restarts."""
+        if not self._answer_cache_path:
+            return
+        try:
+            os.makedirs(self.ANSWER_CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(self.ANSWER_CACHE_DIR, 0o700)
+            tmp_path = f"{self._answer_cache_path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.answered_questions, f)
+            os.replace(tmp_path, self._answer_cache_path)
+        except Exception as e:
+            logger.debug(f"Could not save cached form answers: {e}")
+    
+    def _inventory_form_fields(self) -> List[Dict[str, str]]:
+        """Collect every answerable field on the page in one execute_script call."""
+        payload = self.driver.execute_script(_FORM_INVENTORY_JS, self.FORM_GROUP_SELECTOR)
+        return _json_loads(payload) if payload else []
+    
+    def _fields_by_keys(self, fills: List[Tuple[str, str, str]]) -> List[Any]:
+        """
+        Re-locate tagged controls for (key, input_type, value) fills in one round-trip.
+        
+        Radio fills resolve to their group (tagged data-autopass-group), everything
+        else to the control itself; missing ones come back as None.
+        """
+        return self.driver.execute_script(_RESOLVE_FIELDS_JS, [[key, input_type == "radio"] for key, input_type, _ in fills]) or []
+    
+    def _apply_field_values(self, fills: List[Tuple[str, str, str]]) -> None:
+        """
+        Push (key, input_type, value) answers into the page.
+        
+        Everything except file uploads is set in a single execute_script call;
+        file inputs and any field the script could not handle go through Selenium.
+        """
+        fallback = [fill for fill in fills if fill[1] == "file"]
+        scripted = [list(fill) for fill in fills if fill[1] != "file"]
+        
+        if scripted:
+            try:
+                result = self.driver.execute_script(_FILL_FIELDS_JS, scripted) or {}
+                failed = set(result.get("failed") or [])
+                for key in result.get("unmatched") or []:
+                    # Leave it empty so the form flags it, rather than guessing an answer
+                    logger.warning(f"No option matches the answer for required field {key}, leaving it unset")
+            except Exception as e:
+                logger.debug(f"Batch field fill failed, falling back to Selenium: {e}")
+                failed = {fill[0] for fill in scripted}
+            fallback.extend(fill for fill in fills if fill[0] in failed)
+        
+        if not fallback:
+            return
+        
+        try:
+            elements = self._fields_by_keys(fallback)
+        except Exception as e:
+            logger.warning(f"Could not re-locate {len(fallback)} fields for Selenium fill: {e}")
+            return
+        for (key, input_type, value), element in zip(fallback, elements):
+            if element is None:
+                logger.debug(f"Field {key} disappeared before it could be filled, skipping")
+                continue
+            try:
+                if input_type == "radio":
+                    self._select_radio_option(element.find_elements(By.CSS_SELECTOR, "input[type='radio']"), value)
+                else:
+                    self.fill_form_field(element, value, input_type)
+            except (NoSuchElementException, StaleElementReferenceException):
+                logger.debug(f"Field {key} disappeared before it could be filled, skipping")
+    
+    @staticmethod
+    def _build_resume_context(user_data: Dict[str, Any]) -> str:
+        """Compact resume text sent with batched LLM questions."""
+        parts = [user_data.get("resume_summary", "")] + [
+            f"Skills: {', '.join(user_data.get('skills', [])[:10])}" if user_data.get("skills") else "",
+        ]
+        return "\n".join(p for p in parts if p)
+    
     async def process_form_page_async(
         self,
         user_data: Dict[str, Any],
-        job_data: Dict[str, Any]
+        job_data: Dict[str, Any],
+        resume_context: Optional[str] = None
     ) -> bool:
-        """Async version: Process form page with LLM answers for unknown questions."""
+        """
+        Async version: Process form page with LLM answers for unknown questions.
+        
+        The field inventory and the fill are one execute_script call each,
+        instead of a find_element ladder per form group. Optional fields
+        are filled only from known or cached values and never sent to the LLM.
+        
+        Args:
+            user_data: User profile data dictionary
+            job_data: Job listing data dictionary
+            resume_context: Prebuilt _build_resume_context() text, reused across pages
+        """
         if not self.driver:
             return False
         
         try:
-            # Find all form groups
-            form_groups = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ", ".join([
-                    ".jobs-easy-apply-form-section__grouping",
-                    ".fb-form-element",
-                    "[data-test-form-builder-text-input-form-component]",
-                    "[data-test-form-builder-text-area-form-component]",
-                    "[data-test-form-builder-dropdown-form-component]",
-                    "[data-test-form-builder-radio-button-form-component]",
-                    "[data-test-form-builder-checkbox-form-component]",
-                    "[data-test-form-builder-file-upload-form-component]",
-                ])
-            )
+            try:
+                fields = await asyncio.to_thread(self._inventory_form_fields)
+            except Exception as e:
+                # The per-group walk has no LLM step: unknown questions stay unanswered
+                logger.warning(f"JS field inventory failed, filling known fields only: {e}")
+                return await asyncio.to_thread(self._process_form_groups, user_data, job_data)
+
+            self._load_answer_cache(user_data)
 
+            # (key, input_type, value) answers, pushed to the page in one pass
+            fills: List[Tuple[str, str, str]] = []
             # Collect unanswered questions for batch LLM answering
             pending_questions = []
-            from .form_answer_generator import detect_field_type, FormAnswerContext
 
-            for group in form_groups:
-                try:
-                    # Extract question/label
-                    question = ""
-                    try:
-                        label_elem = group.find_element(By.CSS_SELECTOR, "label, legend, span.t-bold")
-                        question = (label_elem.text or "").strip()
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        pass
-                    
-                    if not question:
-                        continue
+            # Phase 1: map every field to a known/cached value or the LLM batch
+            for field in fields:
+                question = field["question"]
+                input_type = field["type"]
+                field_type = detect_field_type(question)
 
-                    field_type = detect_field_type(question)
+                # Try standard value mapping first
+                value = self._get_field_value(field_type, user_data, job_data, None, question)
 
-                    # Identify input element
-                    input_elem = None
-                    input_type = "text"
-                    radio_elements = []
+                # Optional fields only take values we already have - never an LLM call
+                needs_llm = not value and field.get("required", True)
 
-                    try:
-                        input_elem = group.find_element(By.CSS_SELECTOR, 
-                            "input[type='text'], input[type='email'], input[type='tel'], input[type='number'], input[type='url']")
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        pass
+                # Headline/summary/cover letter go into the same batch with a style hint
+                if needs_llm and self.form_generator and field_type in self.form_generator.ANSWER_HINTS:
+                    pending_questions.append({**field, "hint": field_type})
+                    continue
 
-                    if not input_elem:
-                        try:
-                            input_elem = group.find_element(By.CSS_SELECTOR, "textarea")
-                            input_type = "textarea"
-                        except (NoSuchElementException, StaleElementReferenceException):
-                            pass
-
-                    if not input_elem:
-                        try:
-                            input_elem = group.find_element(By.CSS_SELECTOR, "select")
-                            input_type = "dropdown"
-                        except (NoSuchElementException, StaleElementReferenceException):
-                            pass
-
-                    if not input_elem:
-                        try:
-                            input_elem = group.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-                            input_type = "checkbox"
-                        except (NoSuchElementException, StaleElementReferenceException):
-                            pass
-
-                    if not input_elem:
-                        try:
-                            input_elem = group.find_element(By.CSS_SELECTOR, "input[type='file']")
-                            input_type = "file"
-                        except (NoSuchElementException, StaleElementReferenceException):
-                            pass
-
-                    if not input_elem:
-                        try:
-                            radio_elements = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                            if radio_elements:
-                                input_type = "radio"
-                        except (NoSuchElementException, StaleElementReferenceException):
-                            pass
-
-                    if not input_elem and not radio_elements:
-                        continue
+                # File inputs: auto attach resume
+                if input_type == "file" and not value and self.temp_resume_path:
+                    value = self.temp_resume_path
 
-                    # Try standard value mapping first
-                    value = self._get_field_value(field_type, user_data, job_data, None, question)
-
-                    # Specialized generation for headline/summary/cover letter
-                    if not value and self.form_generator and field_type in ["headline", "summary", "cover_letter"]:
-                        try:
-                            context = FormAnswerContext(
-                                job_title=job_data.get("title", ""),
-                                company=job_data.get("company", ""),
-                                job_description=job_data.get("description", ""),
-                                user_name=user_data.get("full_name", ""),
-                                user_email=user_data.get("email", ""),
-                                resume_summary=user_data.get("resume_summary", ""),
-                                skills=user_data.get("skills", []),
-                                experience=user_data.get("experience", []),
-                                education=user_data.get("education", [])
-                            )
-                            if field_type == "headline":
-                                value = await self.form_generator.generate_headline(context)
-                            elif field_type == "summary":
-                                value = await self.form_generator.generate_summary(context)
-                            elif field_type == "cover_letter":
-                                value = await self.form_generator.generate_cover_letter(context)
-                        except Exception as e:
-                            logger.warning(f"Failed specialized generation for {field_type}: {e}")
-                            value = ""
-
-                    # File inputs: auto attach resume
-                    if input_type == "file" and not value and self.temp_resume_path:
-                        value = self.temp_resume_path
-
-                    # If we have a value, fill now; else collect for batch
-                    if value:
-                        value = self._sanitize_text(value, 1000 if field_type == "cover_letter" else 300)
-                        if input_type == "radio":
-                            self._select_radio_option(radio_elements, value or "Yes")
-                        else:
-                            self.fill_form_field(input_elem, value, input_type)
-                    else:
-                        pending_questions.append({
-                            "question": question,
-                            "input_type": input_type,
-                            "elem": input_elem,
-                            "radio_elems": radio_elements,
-                            "field_type": field_type
-                        })
-                except StaleElementReferenceException:
-                    logger.debug("Stale element in async processing, skipping")
-                    continue
+                # Reuse an earlier LLM answer to the same profile question and options
+                if not value and field_type in self.CACHEABLE_ANSWER_TYPES:
+                    value = self.answered_questions.get(self._question_key(question, field.get("options")), "")
 
-            # Batch answer remaining questions
+                # If we have a value, queue it; else collect for batch
+                if value:
+                    value = self._sanitize_text(value, 1000 if field_type == "cover_letter" else 300)
+                    fills.append((field["key"], input_type, value))
+                elif needs_llm:
+                    pending_questions.append(field)
+
+            # Phase 2: one batched LLM call answers every pending field
             if pending_questions and self.form_generator:
                 try:
-                    # Build resume context
-                    parts = [user_data.get("resume_summary", "")] + [
-                        f"Skills: {', '.join(user_data.get('skills', [])[:10])}" if user_data.get("skills") else "",
-                    ]
-                    resume_context = "\n".join(p for p in parts if p)
-
-                    questions = [pq["question"] for pq in pending_questions]
-                    answers_map = await self.form_generator.batch_answer_questions(
-                        questions=questions,
-                        resume_context=resume_context,
-                        job_title=job_data.get("title", ""),
-                        job_company=job_data.get("company", "")
-                    )
+                    if resume_context is None:
+                        resume_context = self._build_resume_context(user_data)
+                    answers = await self._answer_pending_questions(pending_questions, resume_context, job_data)
 
-                    # Fill using answers
-                    for idx, pq in enumerate(pending_questions, start=1):
-                        try:
-                            ans = answers_map.get(str(idx), "")
-                            ans = self._sanitize_text(ans, 300)
-                            if pq["input_type"] == "radio":
-                                self._select_radio_option(pq["radio_elems"], ans or "Yes")
-                            else:
-                                if pq["elem"]:
-                                    self.fill_form_field(pq["elem"], ans, pq["input_type"])
-                        except StaleElementReferenceException:
-                            logger.debug("Stale element when filling batch answer, skipping")
-                            continue
+                    for pq, ans in zip(pending_questions, answers):
+                        hint = pq.get("hint")
+                        ans = self._sanitize_text(ans, 1000 if hint == "cover_letter" else 300)
+                        if hint:
+                            # Job-specific long-form text: never cached
+                            if not ans:
+                                logger.warning(f"Failed specialized generation for {hint}")
+                                continue
+                        elif ans and detect_field_type(pq["question"]) in self.CACHEABLE_ANSWER_TYPES:
+                            # Profile answers only - job-specific ones are never reused
+                            self.answered_questions[self._question_key(pq["question"], pq.get("options"))] = ans
+                        if pq["type"] == "radio":
+                            ans = ans or "Yes"
+                        fills.append((pq["key"], pq["type"], ans))
+                    self._save_answer_cache()
                 except Exception as e:
                     logger.warning(f"Batch answering failed: {e}")
 
+            # Phase 3: push every answer to the page in one pass
+            await asyncio.to_thread(self._apply_field_values, fills)
             return True
 
         except Exception as e:
             logger.error(f"Error processing form page: {e}")
             return False
     
+    async def _answer_pending_questions(
+        self,
+        pending_questions: List[Dict[str, str]],
+        resume_context: str,
+        job_data: Dict[str, Any]
+    ) -> List[str]:
+        """Answer all pending questions with a single batched LLM prompt."""
+        if not pending_questions:
+            return []
+        
+        # Show the LLM the choices for dropdowns/radios so it answers with one of them
+        questions = [
+            f"{pq['question']} (Options: {' / '.join(pq['options'])})" if pq.get("options") else pq["question"]
+            for pq in pending_questions
+        ]
+        
+        return await self.form_generator.batch_answer_questions(
+            questions=questions,
+            resume_context=resume_context,
+            job_title=job_data.get("title", ""),
+            job_company=job_data.get("company", ""),
+            hints=[pq.get("hint") for pq in pending_questions],
+            job_description=job_data.get("description", "")
+        )
+    
     def _process_form_group(
         self,
         group,
@@ -856,62 +1411,32 @@ class EasyApplyAutomation:
             logger.debug(f"Processing field: {label}")
             
             # Detect field type from label
-            from .form_answer_generator import detect_field_type
             field_type = detect_field_type(label)
             
-            # Find input element
-            input_elem = None
-            input_type = "text"
+            # Find input element: one find_elements call, classified in Python
+            controls: Dict[str, Any] = {}
             radio_elements = []
+            for elem in group.find_elements(By.CSS_SELECTOR, "input, textarea, select"):
+                tag = elem.tag_name.lower()
+                control_type = (elem.get_attribute("type") or "text").lower() if tag == "input" else tag
+                input_type = self.CONTROL_INPUT_TYPES.get(control_type)
+                if input_type == "radio":
+                    radio_elements.append(elem)
+                elif input_type:
+                    controls.setdefault(input_type, elem)
+            if radio_elements:
+                controls.setdefault("radio", radio_elements[0])
             
-            try:
-                input_elem = group.find_element(By.CSS_SELECTOR, 
-                    "input[type='text'], input[type='email'], input[type='tel'], input[type='number'], input[type='url']")
-            except (NoSuchElementException, StaleElementReferenceException):
-                pass
-            
-            if not input_elem:
-                try:
-                    input_elem = group.find_element(By.CSS_SELECTOR, "textarea")
-                    input_type = "textarea"
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-            
-            if not input_elem:
-                try:
-                    input_elem = group.find_element(By.CSS_SELECTOR, "select")
-                    input_type = "dropdown"
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-            
-            if not input_elem:
-                try:
-                    input_elem = group.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-                    input_type = "checkbox"
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-            
-            if not input_elem:
-                try:
-                    input_elem = group.find_element(By.CSS_SELECTOR, "input[type='file']")
-                    input_type = "file"
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-
-            if not input_elem:
-                try:
-                    radio_elements = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    if radio_elements:
-                        input_elem = radio_elements[0]
-                        input_type = "radio"
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-            
-            if not input_elem:
+            input_type = next((t for t in self.CONTROL_PRIORITY if t in controls), None)
+            if not input_type:
                 return
+            input_elem = controls[input_type]
             
             # Get value based on field type
-            value = self._get_field_value(field_type, user_data, job_data, context, label)
+            value = (
+                self._get_field_value(field_type, user_data, job_data, context, label)
+                or _FIELD_FALLBACKS.get(field_type, "")
+            )
             if input_type == "file" and not value and self.temp_resume_path:
                 value = self.temp_resume_path
             
@@ -936,56 +1461,15 @@ class EasyApplyAutomation:
         label: str
     ) -> str:
         """Get appropriate value for a field"""
+        if field_type == "years_experience":
+            # Summed once per application instead of once per field
+            if self._experience_years is None:
+                self._experience_years = _total_experience_years(user_data)
+            return self._experience_years
         
-        # Direct mappings
-        if field_type == "name":
-            return user_data.get("full_name", "")
-        elif field_type == "email":
-            return user_data.get("email", "")
-        elif field_type == "phone":
-            return user_data.get("phone", user_data.get("resume_parsed_data", {}).get("contact", {}).get("phone", ""))
-        elif field_type == "linkedin":
-            return user_data.get("linkedin_url", "")
-        elif field_type == "years_experience":
-            total = sum([
-                user_data.get("exp_years_internship", 0) or 0,
-                user_data.get("exp_years_entry_level", 0) or 0,
-                user_data.get("exp_years_associate", 0) or 0,
-                user_data.get("exp_years_mid_senior_level", 0) or 0,
-                user_data.get("exp_years_director", 0) or 0,
-                user_data.get("exp_years_executive", 0) or 0,
-            ])
-            return str(max(total, 2))
-        elif field_type == "current_title":
-            resume = user_data.get("resume_parsed_data", {})
-            exp = resume.get("experience", [])
-            return exp[0].get("title", "") if exp else user_data.get("target_job_title", "")
-        elif field_type == "current_company":
-            resume = user_data.get("resume_parsed_data", {})
-            exp = resume.get("experience", [])
-            return exp[0].get("company", "") if exp else ""
-        elif field_type == "salary":
-            return "Open to discussion based on total compensation"
-        elif field_type == "sponsorship":
-            return "Yes"  # Authorized to work
-        elif field_type == "start_date":
-            return "Available within 2 weeks"
-        elif field_type == "relocation":
-            return "Yes"
-        
-        # AI-generated fields
-        elif field_type in ["cover_letter", "summary", "why_interested", "headline"]:
-            if field_type == "cover_letter" and context:
-                return user_data.get("generated_cover_letter", "I am excited to apply for this position...")
-            elif field_type == "summary":
-                return user_data.get("resume_summary", "Experienced professional seeking new opportunities...")
-            elif field_type == "headline":
-                return user_data.get("generated_headline", "Experienced Professional")
-            else:
-                return "I am interested in this opportunity because it aligns with my skills and career goals."
-        
+        handler = _FIELD_HANDLERS.get(field_type)
         # Unknown field - return empty
-        return ""
+        return handler(user_data, job_data, context) if handler else ""
     
     def click_next_or_submit(self) -> Tuple[str, bool]:
         """
@@ -1005,133 +1489,22 @@ class EasyApplyAutomation:
             # Scroll to bottom of modal/page to reveal footer buttons
             self._scroll_modal_to_bottom()
             
-            # ============ PRIORITY 1: Find SUBMIT button (final submission) ============
-            submit_selectors = [
-                "//button[contains(@aria-label, 'Submit application')]",
-                "//button[contains(@aria-label, 'Submit your application')]",
-                "//button[contains(., 'Submit application')]",
-                "//button[contains(., 'Submit') and not(contains(., 'Cancel'))]",
-                "//button[@type='submit' and not(contains(., 'Cancel'))]",
-                "//div[contains(@class,'artdeco-modal')]//footer//button[contains(@class,'artdeco-button--primary')]",
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    buttons = self.driver.find_elements(By.XPATH, selector)
-                    for button in buttons:
-                        try:
-                            if button.is_displayed() and button.is_enabled():
-                                logger.info(f"Found SUBMIT button: '{button.text}'")
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                time.sleep(1)
-                                self._human_click(button)
-                                time.sleep(2)
-                                logger.info("✓ Clicked SUBMIT button")
-                                return ("submit", True)
-                        except ElementClickInterceptedException:
-                            try:
-                                self.driver.execute_script("arguments[0].click();", button)
-                                time.sleep(2)
-                                logger.info("✓ Clicked SUBMIT button (JS)")
-                                return ("submit", True)
-                            except Exception:
-                                continue
-                        except Exception as e:
-                            logger.debug(f"Could not click submit: {e}")
-                            continue
-                except Exception as e:
-                    logger.debug(f"Error finding submit: {e}")
+            # Submit candidates come first, then Next/Continue, all in one call
+            for candidate in self._footer_candidates():
+                action = candidate["action"]
+                button_text = candidate["text"].lower()
+                # Skip invalid buttons
+                if action == "next" and any(skip in button_text for skip in ('cancel', 'back', 'skip', 'close')):
                     continue
-            
-            # ============ PRIORITY 2: Find NEXT/CONTINUE button (go to next page) ============
-            next_selectors = [
-                "//button[contains(@aria-label, 'Continue')]",
-                "//button[contains(@aria-label, 'Next')]",
-                "//button[contains(., 'Next') and not(contains(., 'Cancel'))]",
-                "//button[contains(., 'Continue') and not(contains(., 'Cancel'))]",
-                "//button[contains(., 'Review')]",
-                "//button[@type='submit']",
-                "//div[@role='dialog']//button[@type='button' and not(contains(., 'Cancel')) and contains(@class, 'artdeco-button')]",
-                "//div[contains(@class,'artdeco-modal')]//footer//button[contains(@class,'artdeco-button--primary') and not(contains(., 'Cancel'))]",
-            ]
-            
-            for selector in next_selectors:
+                
                 try:
-                    buttons = self.driver.find_elements(By.XPATH, selector)
-                    for button in buttons:
-                        try:
-                            button_text = (button.text or "").lower()
-                            # Skip invalid buttons
-                            if any(skip in button_text for skip in ['cancel', 'back', 'skip', 'close']):
-                                continue
-                            
-                            if button.is_displayed() and button.is_enabled():
-                                logger.info(f"Found NEXT button: '{button.text}'")
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                time.sleep(1)
-                                try:
-                                    self._human_click(button)
-                                    time.sleep(2)
-                                    logger.info("✓ Clicked NEXT button")
-                                    return ("next", True)
-                                except Exception as click_err:
-                                    logger.debug(f"Human click failed, attempting JS click: {click_err}")
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", button)
-                                        time.sleep(2)
-                                        logger.info("✓ Clicked NEXT button (JS)")
-                                        return ("next", True)
-                                    except Exception as js_err:
-                                        logger.debug(f"JS click also failed: {js_err}")
-                                        continue
-                        except ElementClickInterceptedException:
-                            try:
-                                self.driver.execute_script("arguments[0].click();", button)
-                                time.sleep(2)
-                                logger.info("✓ Clicked NEXT button (JS)")
-                                return ("next", True)
-                            except Exception:
-                                continue
-                        except Exception as e:
-                            logger.debug(f"Could not click next: {e}")
-                            continue
+                    logger.info(f"Found {action.upper()} button: '{candidate['text']}'")
+                    if self._click_footer_button(
+                        candidate["element"], action.upper(), button_text if action == "next" else None
+                    ):
+                        return (action, True)
                 except Exception as e:
-                    logger.debug(f"Error finding next: {e}")
-                    continue
-
-            # Retry once more after forcing another scroll
-            self._scroll_modal_to_bottom()
-            time.sleep(0.5)
-            for selector in next_selectors:
-                try:
-                    buttons = self.driver.find_elements(By.XPATH, selector)
-                    for button in buttons:
-                        try:
-                            button_text = (button.text or "").lower()
-                            if any(skip in button_text for skip in ['cancel', 'back', 'skip', 'close']):
-                                continue
-                            if button.is_displayed() and button.is_enabled():
-                                logger.info(f"Retry: Found NEXT button: '{button.text}'")
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                time.sleep(0.5)
-                                try:
-                                    self._human_click(button)
-                                    time.sleep(2)
-                                    logger.info("✓ Clicked NEXT button on retry")
-                                    return ("next", True)
-                                except Exception:
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", button)
-                                        time.sleep(2)
-                                        logger.info("✓ Clicked NEXT button (JS) on retry")
-                                        return ("next", True)
-                                    except Exception:
-                                        continue
-                        except Exception as e:
-                            logger.debug(f"Retry could not click next: {e}")
-                            continue
-                except Exception:
-                    continue
+                    logger.debug(f"Could not click {action}: {e}")
             
             logger.warning("Could not find any clickable Submit or Next buttons")
             return ("error", False)
@@ -1140,6 +1513,58 @@ class EasyApplyAutomation:
             logger.error(f"Error in click_next_or_submit: {e}")
             return ("error", False)
     
+    def _footer_candidates(self) -> List[Dict[str, Any]]:
+        """Visible, enabled Submit then Next buttons as [{element, text, action}] in one round-trip."""
+        return self.driver.execute_script(_FOOTER_CANDIDATES_JS, self.FOOTER_SELECTORS) or []
+    
+    def _click_footer_button(self, button, label: str, button_text: Optional[str] = None) -> bool:
+        """
+        Click a modal footer button and wait for the form to react.
+        
+        Waits for the button to become clickable before the click, and for it
+        to go stale or change its label (next page rendered) afterwards,
+        instead of fixed sleeps on both sides.
+        
+        Args:
+            button: Footer button element
+            label: Name used in log messages ("NEXT", "SUBMIT")
+            button_text: Lowercased text already read from the button
+            
+        Returns:
+            True if a click was dispatched
+        """
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+        try:
+            WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(button))
+        except TimeoutException:
+            logger.debug(f"{label} button not reported clickable, clicking anyway")
+        
+        try:
+            self._human_click(button)
+            logger.info(f"✓ Clicked {label} button")
+        except Exception as click_err:
+            logger.debug(f"Human click failed, attempting JS click: {click_err}")
+            try:
+                self.driver.execute_script("arguments[0].click();", button)
+                logger.info(f"✓ Clicked {label} button (JS)")
+            except Exception as js_err:
+                logger.debug(f"JS click also failed: {js_err}")
+                return False
+        
+        def advanced(driver) -> bool:
+            if EC.staleness_of(button)(driver):
+                return True
+            try:
+                return button_text is not None and (button.text or "").lower() != button_text
+            except StaleElementReferenceException:
+                return True
+        
+        try:
+            WebDriverWait(self.driver, 10 if button_text is None else 5).until(advanced)
+        except TimeoutException:
+            logger.debug(f"No re-render observed after {label} click")
+        return True
+    
     def verify_application_submitted(self) -> bool:
         """
         Verify that application was submitted successfully.
@@ -1154,68 +1579,48 @@ class EasyApplyAutomation:
             return False
         
         try:
-            # Give the page time to fully process submission
-            time.sleep(3)
+            # Wait for the Easy Apply form to go away instead of a blanket sleep
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-content"))
+                )
+            except TimeoutException:
+                logger.debug("Easy Apply form still visible after submit, checking indicators anyway")
             
-            # Get current state
-            page_text = self.driver.page_source.lower()
             current_url = self.driver.current_url.lower()
             
             logger.info(f"Verifying submission - URL: {current_url}")
             
-            # ============ CHECK 1: Look for explicit success messages ============
-            success_indicators = [
-                "application submitted",
-                "your application was sent",
-                "application sent",
-                "successfully applied",
-                "application complete",
-                "application received",
-                "you've been added",
-                "thank you for applying",
-                "submitted an application",
-                "sent you an application",
-            ]
+            # Get current state (text scan and element checks run in-browser)
+            state = self.driver.execute_script(_SUBMISSION_STATE_JS, self.SUCCESS_RE.pattern) or {}
             
-            for indicator in success_indicators:
-                if indicator in page_text:
-                    logger.info(f"✓ Found success indicator: '{indicator}'")
-                    return True
+            # ============ CHECK 1: Look for explicit success messages ============
+            if state.get("indicator"):
+                logger.info(f"✓ Found success indicator: '{state['indicator']}'")
+                return True
             
             # ============ CHECK 2: Is the modal/dialog still open? ============
-            try:
-                modal = self.driver.find_element(By.CSS_SELECTOR, "[role='dialog'], .artdeco-modal")
-                modal_visible = modal.is_displayed()
-                
-                if not modal_visible:
-                    logger.info("✓ Modal closed after submission")
-                    return True
-            except NoSuchElementException:
+            if state.get("modal") == "none":
                 logger.info("✓ Modal not found - likely closed/submitted")
                 return True
+            if state.get("modal") == "hidden":
+                logger.info("✓ Modal closed after submission")
+                return True
             
             # ============ CHECK 3: Easy Apply button state ============
-            try:
-                easy_apply_button = self.driver.find_element(
-                    By.XPATH, 
-                    "//button[contains(@class, 'jobs-apply-button')] | //button[contains(., 'Easy Apply')]"
-                )
-                
-                if not easy_apply_button.is_displayed():
-                    logger.info("✓ Easy Apply button hidden - application likely submitted")
-                    return True
-                
-                aria_disabled = easy_apply_button.get_attribute("aria-disabled")
-                if aria_disabled == "true":
-                    logger.info("✓ Easy Apply button disabled - application likely submitted")
-                    return True
-                
-                logger.warning("✗ Easy Apply button still visible and enabled")
-                return False
-                
-            except NoSuchElementException:
+            button_state = state.get("button")
+            if button_state == "none":
                 logger.info("✓ Easy Apply button not found - likely submitted")
                 return True
+            if button_state == "hidden":
+                logger.info("✓ Easy Apply button hidden - application likely submitted")
+                return True
+            if button_state == "disabled":
+                logger.info("✓ Easy Apply button disabled - application likely submitted")
+                return True
+            
+            logger.warning("✗ Easy Apply button still visible and enabled")
+            return False
             
         except Exception as e:
             logger.error(f"Error verifying submission: {e}")
@@ -1241,6 +1646,7 @@ class EasyApplyAutomation:
             ApplicationResult with success status and message
         """
         job_id = job_data.get("external_id", "unknown")
+        self._experience_years = None
         
         try:
             # Navigate to job
@@ -1274,25 +1680,26 @@ class EasyApplyAutomation:
             except TimeoutException:
                 logger.debug("Easy Apply modal did not appear within timeout; continuing anyway")
             
+            # Built once per application, shared by every form page
+            resume_context = self._build_resume_context(user_data)
+            
             # Process form pages
             for page in range(max_pages):
                 logger.info(f"Processing form page {page + 1}")
                 
                 # Fill current page with on-the-spot LLM answers for unknown questions
-                await self.process_form_page_async(user_data, job_data)
+                await self.process_form_page_async(user_data, job_data, resume_context=resume_context)
                 
-                # Give form time to process
-                time.sleep(1)
-                
-                # Click next or submit
-                action, success = self.click_next_or_submit()
+                # Click next or submit. The click waits for the next page to
+                # render, so run it off the event loop; the next iteration scans
+                # the new page as soon as it returns
+                action, success = await asyncio.to_thread(self.click_next_or_submit)
                 
                 if not success:
                     # If on last page, verify submission before failing
                     if page >= max_pages - 1:
                         logger.info("On last page and button click failed, attempting verification...")
-                        time.sleep(2)
-                        if self.verify_application_submitted():
+                        if await asyncio.to_thread(self.verify_application_submitted):
                             logger.info("Application was submitted despite button click failure")
                             return ApplicationResult(
                                 success=True,
@@ -1311,7 +1718,7 @@ class EasyApplyAutomation:
                     break
             
             # Verify submission
-            if self.verify_application_submitted():
+            if await asyncio.to_thread(self.verify_application_submitted):
                 return ApplicationResult(
                     success=True,
                     job_id=job_id,
@@ -1337,18 +1744,13 @@ class EasyApplyAutomation:
     def cleanup(self) -> None:
         """Cleanup resources"""
         if self.driver:
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
+            # Keep the browser warm for the next run; quit only if it can't be pooled
+            if not release_driver(self.driver, self._headless):
+                _quit_quietly(self.driver)
             self.driver = None
         
-        if self.temp_resume_path and os.path.exists(self.temp_resume_path):
-            try:
-                os.remove(self.temp_resume_path)
-            except Exception:
-                pass
-            self.temp_resume_path = None
+        # The resume file is shared through _RESUME_FILES and removed at exit
+        self.temp_resume_path = None
     
     def get_fresh_cookies(self) -> List[dict]:
         """Extract current browser cookies"""
@@ -1359,23 +1761,23 @@ class EasyApplyAutomation:
             raw_cookies = self.driver.get_cookies()
             min_expiry = int(time.time()) + 172800
             
-            whitelist = ["name", "value", "domain", "path", "expiry", "secure", "httpOnly"]
             normalized = []
-            
             for cookie in raw_cookies:
-                normalized_cookie = {}
-                for field in whitelist:
-                    if field == "domain":
-                        normalized_cookie["domain"] = ".linkedin.com"
-                    elif field == "expiry":
-                        expiry = cookie.get("expiry")
-                        normalized_cookie["expiry"] = expiry if expiry and expiry > min_expiry else min_expiry
-                    else:
-                        if field in cookie:
-                            normalized_cookie[field] = cookie[field]
+                if not cookie.get("name") or not cookie.get("value"):
+                    continue
                 
-                if normalized_cookie.get("name") and normalized_cookie.get("value"):
-                    normalized.append(normalized_cookie)
+                expiry = cookie.get("expiry")
+                normalized_cookie = {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "domain": ".linkedin.com",
+                    "expiry": expiry if expiry and expiry > min_expiry else min_expiry,
+                }
+                # Optional attributes are only carried over when the browser reported them
+                for field in ("path", "secure", "httpOnly"):
+                    if field in cookie:
+                        normalized_cookie[field] = cookie[field]
+                normalized.append(normalized_cookie)
             
             return normalized
         except Exception as e:
@@ -2,12 +2,25 @@
 Form Answer Generator
 AI-powered answer generation for LinkedIn Easy Apply forms
 """
-from typing import Optional, Dict, Any
+import asyncio
+import importlib.util
+import json
+import random
+import re
+import threading
+import weakref
+from functools import lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 from dataclasses import dataclass
 import httpx
 from loguru import logger
 
 from core.config import settings
+from .llm_response_cache import LLMResponseCache, get_llm_cache
+
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 @dataclass
@@ -32,21 +45,161 @@ class FormAnswerGenerator:
     - Cover letters
     - Headlines
     - Custom question responses
+    
+    All instances share one pooled HTTP client (HTTP/2 when h2 is installed),
+    sized by LLM_HTTP_MAX_CONNECTIONS / LLM_HTTP_MAX_KEEPALIVE, so fanning out
+    dozens of batch_answer_questions calls with asyncio is safe.
     """
     
     OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
     MODEL = "gpt-4o-mini"
     
+    # Transient provider failures worth retrying (rate limit / overload)
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_ATTEMPTS = 4
+    RETRY_MIN_WAIT = 1.0
+    RETRY_MAX_WAIT = 30.0
+    
+    # max_tokens per call, sized to the requested length (~1.3 tokens/word)
+    # instead of the worst case - latency grows with the output budget
+    TOKEN_BUDGETS = {
+        "cover_letter": 320,    # 150-250 words
+        "headline": 32,         # under 120 characters
+        "summary": 120,         # 2-3 sentences
+        "custom_question": 150, # 1-3 sentences
+        "package": 520,         # cover letter + headline + summary + JSON keys
+        "batch_answer": 45,     # short answer per batched question
+        "batch_overhead": 20,   # JSON braces and keys
+        "batch_max": 1200,
+    }
+    
+    # Style notes and token budgets for batch questions that need long-form answers
+    ANSWER_HINTS = {
+        "headline": ("LinkedIn-style headline, under 120 characters", TOKEN_BUDGETS["headline"]),
+        "summary": ("first-person professional summary, 2-3 sentences", TOKEN_BUDGETS["summary"]),
+        "cover_letter": ("cover letter for this job, 150-250 words", TOKEN_BUDGETS["cover_letter"]),
+    }
+    DEFAULT_ANSWER_TOKENS = TOKEN_BUDGETS["batch_answer"]
+    
+    # One shared client per event loop, so OpenRouter connections stay alive
+    # between calls; entries vanish with their loop
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    _clients_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize form answer generator"""
         self.api_key = getattr(settings, 'OPENROUTER_API_KEY', None)
         if not self.api_key:
             logger.warning("OPENROUTER_API_KEY not set - AI form generation will fail")
+        # (context, task) for the last generate_application_package call
+        self._package: Optional[Tuple[FormAnswerContext, "asyncio.Future[Dict[str, str]]"]] = None
+    
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Shared keep-alive client for the running event loop, created lazily.
+        
+        httpx clients are bound to the event loop they were first used on, so
+        callers running their own loop (worker threads) get their own client
+        that lives as long as that loop.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._clients_lock:
+            client = cls._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=30.0,
+                    limits=httpx.Limits(
+                        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+                    ),
+                    http2=HTTP2_AVAILABLE,
+                )
+                cls._clients[loop] = client
+            return client
+    
+    @classmethod
+    async def warmup(cls) -> None:
+        """Open a keep-alive connection to OpenRouter so the first generation skips the handshake"""
+        try:
+            await cls.get_client().head(cls.OPENROUTER_API_URL, timeout=5.0)
+            logger.debug("🔥 OpenRouter connection pre-warmed")
+        except Exception as e:
+            logger.debug(f"OpenRouter warmup failed: {e}")
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close every shared client (application shutdown).
+        
+        The current loop's client is awaited; clients of other running loops
+        are closed on their own loop.
+        """
+        with cls._clients_lock:
+            clients = list(cls._clients.items())
+            cls._clients.clear()
+        
+        current = asyncio.get_running_loop()
+        for loop, client in clients:
+            if client.is_closed:
+                continue
+            try:
+                if loop is current:
+                    await client.aclose()
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            except Exception as e:
+                logger.debug(f"Failed to close OpenRouter client: {e}")
+    
+    def _retry_wait(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt number"""
+        ceiling = min(self.RETRY_MAX_WAIT, self.RETRY_MIN_WAIT * (2 ** attempt))
+        return max(self.RETRY_MIN_WAIT, random.uniform(0, ceiling))
+    
+    def _headers(self) -> Dict[str, str]:
+        """OpenRouter request headers"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _request_body(
+        self,
+        prompt: str,
+        max_tokens: int,
+        stream: bool = False,
+        stop: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Chat completion payload shared by the plain and streaming calls"""
+        body = {
+            "model": self.MODEL,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional career assistant helping with job applications. Be concise, professional, and positive."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+        if stream:
+            body["stream"] = True
+        if stop:
+            body["stop"] = stop
+        return body
     
     async def _call_llm(self, prompt: str, max_tokens: int = 500) -> str:
         """
         Call OpenRouter LLM API
         
+        Transient failures (429/5xx, connection errors, timeouts) are retried
+        with jittered exponential backoff before giving up. Non-empty
+        responses are cached by (model, max_tokens, prompt).
+        
         Args:
             prompt: The prompt to send
             max_tokens: Maximum tokens in response
@@ -58,54 +211,151 @@ class FormAnswerGenerator:
             logger.error("Cannot call LLM - API key not configured")
             return ""
         
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+        cache = get_llm_cache()
+        cache_key = LLMResponseCache.make_key(self.MODEL, max_tokens, prompt)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                response = await self.get_client().post(
                     self.OPENROUTER_API_URL,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.MODEL,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a professional career assistant helping with job applications. Be concise, professional, and positive."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.7,
-                        "max_tokens": max_tokens
-                    },
+                    headers=self._headers(),
+                    json=self._request_body(prompt, max_tokens),
                     timeout=30.0
                 )
+                
+                if response.status_code in self.RETRY_STATUS_CODES and attempt < self.MAX_ATTEMPTS:
+                    wait = self._retry_wait(attempt)
+                    logger.warning(
+                        f"OpenRouter returned {response.status_code}, "
+                        f"retrying in {wait:.1f}s (attempt {attempt}/{self.MAX_ATTEMPTS})"
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                
                 response.raise_for_status()
                 
                 data = response.json()
-                return data["choices"][0]["message"]["content"].strip()
+                content = data["choices"][0]["message"]["content"].strip()
+                if content:
+                    cache.put(cache_key, content)
+                return content
+        
+            except httpx.TransportError as e:
+                if attempt < self.MAX_ATTEMPTS:
+                    wait = self._retry_wait(attempt)
+                    logger.warning(
+                        f"OpenRouter connection error ({e}), "
+                        f"retrying in {wait:.1f}s (attempt {attempt}/{self.MAX_ATTEMPTS})"
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                logger.error(f"Error calling OpenRouter LLM: {e}")
+                return ""
+            
+            except Exception as e:
+                logger.error(f"Error calling OpenRouter LLM: {e}")
+                return ""
+        
+        return ""
+    
+    async def _call_llm_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        stop: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Call OpenRouter LLM API in streaming mode, yielding text as it arrives.
+        
+        Not retried - a stream that has started cannot be replayed. A complete
+        response is stored in the same cache as _call_llm, and a cache hit is
+        yielded as a single chunk.
+        
+        Args:
+            prompt: The prompt to send
+            max_tokens: Maximum tokens in response
+            stop: Optional stop sequences
+            
+        Yields:
+            Text deltas from the model
+        """
+        if not self.api_key:
+            logger.error("Cannot call LLM - API key not configured")
+            return
         
+        cache = get_llm_cache()
+        cache_key = LLMResponseCache.make_key(self.MODEL, max_tokens, prompt, stop)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts: List[str] = []
+        try:
+            async with self.get_client().stream(
+                "POST",
+                self.OPENROUTER_API_URL,
+                headers=self._headers(),
+                json=self._request_body(prompt, max_tokens, stream=True, stop=stop),
+                timeout=30.0
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # SSE: "data: {...}" lines, ": comment" keep-alives, "data: [DONE]" at the end
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        delta = json.loads(data)["choices"][0]["delta"].get("content")
+                    except (json.JSONDecodeError, KeyError, IndexError):
+                        continue
+                    if delta:
+                        parts.append(delta)
+                        yield delta
         except Exception as e:
-            logger.error(f"Error calling OpenRouter LLM: {e}")
-            return ""
+            logger.error(f"Error streaming from OpenRouter LLM: {e}")
+            return
+        
+        content = "".join(parts).strip()
+        if content:
+            cache.put(cache_key, content)
     
-    async def generate_cover_letter(
+    async def generate_application_package(
         self,
         context: FormAnswerContext
-    ) -> str:
+    ) -> Dict[str, str]:
         """
-        Generate a tailored cover letter for a specific job.
+        Generate cover letter, headline and summary in a single LLM call.
+        
+        The result for the most recent context is kept, so the
+        generate_cover_letter/headline/summary wrappers called for the
+        same context share one request.
         
         Args:
             context: Form answer context with job and user details
             
         Returns:
-            Generated cover letter (150-250 words)
+            Dict with "cover_letter", "headline" and "summary" keys
         """
-        prompt = f"""Write a professional cover letter for this job application:
+        cached = self._package
+        if (
+            cached is None
+            or cached[0] is not context
+            or cached[1].get_loop() is not asyncio.get_running_loop()
+            or (cached[1].done() and cached[1].cancelled())
+        ):
+            cached = (context, asyncio.ensure_future(self._generate_package(context)))
+            self._package = cached
+        return dict(await asyncio.shield(cached[1]))
+    
+    async def _generate_package(self, context: FormAnswerContext) -> Dict[str, str]:
+        """Single prompt for the three long-form answers, with per-field fallbacks"""
+        prompt = f"""Write three pieces of text for this job application:
 
 Job: {context.job_title} at {context.company}
 Job Description: {context.job_description[:800]}
@@ -114,18 +364,67 @@ Candidate:
 - Name: {context.user_name}
 - Skills: {', '.join(context.skills[:10])}
 - Summary: {context.resume_summary}
-- Recent Experience: {context.experience[0] if context.experience else 'Not specified'}
+- Recent Experience: {', '.join(str(e) for e in context.experience[:2]) or 'Not specified'}
 
-Requirements:
+1. cover_letter:
 - 150-250 words maximum
 - Professional but personable tone
 - Highlight 2-3 relevant skills/experiences
 - Show enthusiasm for the role
 - Do NOT include [brackets] or placeholders
 - Start with "Dear Hiring Manager," and end with the candidate's name
-"""
-        result = await self._call_llm(prompt, max_tokens=400)
-        return result if result else self._default_cover_letter(context)
+
+2. headline (LinkedIn-style):
+- Maximum 120 characters
+- Format: "[Title] | [Years] Experience | [Top 2-3 Skills]"
+- Professional and impactful
+- No quotes or special formatting
+
+3. summary:
+- 2-3 sentences only
+- MUST be written in first person (use "I", "my", "me")
+- Highlight key strengths
+- Sound like the actual applicant wrote this, not a third party
+
+Return JSON only: {{"cover_letter": "...", "headline": "...", "summary": "..."}}
+No explanations, just the JSON object."""
+
+        result = await self._call_llm(prompt, max_tokens=self.TOKEN_BUDGETS["package"])
+        
+        package: Dict[str, Any] = {}
+        if result:
+            try:
+                json_match = re.search(r'\{[\s\S]*\}', result)
+                if json_match:
+                    package = json.loads(json_match.group())
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse application package: {e}")
+        
+        def field(key: str) -> str:
+            value = package.get(key)
+            return value.strip() if isinstance(value, str) else ""
+        
+        default_headline = f"{context.skills[0]} Professional" if context.skills else "Experienced Professional"
+        return {
+            "cover_letter": field("cover_letter") or self._default_cover_letter(context),
+            "headline": field("headline") or default_headline,
+            "summary": field("summary") or context.resume_summary,
+        }
+    
+    async def generate_cover_letter(
+        self,
+        context: FormAnswerContext
+    ) -> str:
+        """
+        Generate a tailored cover letter for a specific job.
+        
+        Args:
+            context: Form answer context with job and user details
+            
+        Returns:
+            Generated cover letter (150-250 words)
+        """
+        return (await self.generate_application_package(context))["cover_letter"]
     
     async def generate_headline(
         self,
@@ -140,20 +439,7 @@ Requirements:
         Returns:
             Professional headline (e.g., "Senior Python Developer | 5+ Years | FastAPI & AWS")
         """
-        prompt = f"""Create a professional LinkedIn-style headline for a job applicant:
-
-Skills: {', '.join(context.skills[:8])}
-Summary: {context.resume_summary}
-Experience: {context.experience[0] if context.experience else 'Entry-level professional'}
-
-Requirements:
-- Maximum 120 characters
-- Format: "[Title] | [Years] Experience | [Top 2-3 Skills]"
-- Professional and impactful
-- No quotes or special formatting
-"""
-        result = await self._call_llm(prompt, max_tokens=50)
-        return result if result else f"{context.skills[0]} Professional" if context.skills else "Experienced Professional"
+        return (await self.generate_application_package(context))["headline"]
     
     async def generate_summary(
         self,
@@ -168,22 +454,7 @@ Requirements:
         Returns:
             Professional summary written by the applicant
         """
-        prompt = f"""Write a brief professional summary FOR the job applicant (in first person, as if they are writing it).
-
-Skills: {', '.join(context.skills[:10])}
-Summary: {context.resume_summary}
-Experience: {', '.join(str(e) for e in context.experience[:2])}
-
-Requirements:
-- 2-3 sentences only
-- MUST be written in first person (use "I", "my", "me")
-- Highlight key strengths
-- Professional and personable tone
-- Sound like the actual applicant wrote this, not a third party
-- Be authentic and direct
-"""
-        result = await self._call_llm(prompt, max_tokens=150)
-        return result if result else context.resume_summary
+        return (await self.generate_application_package(context))["summary"]
     
     async def answer_custom_question(
         self,
@@ -217,7 +488,7 @@ Requirements:
 - If question is about availability, say "Available to start within 2 weeks"
 - If question asks Yes/No about qualifications, answer "Yes" unless clearly unqualified
 """
-        result = await self._call_llm(prompt, max_tokens=200)
+        result = await self._call_llm(prompt, max_tokens=self.TOKEN_BUDGETS["custom_question"])
         return result if result else self._default_question_answer(question)
     
     async def answer_experience_years(
@@ -280,8 +551,10 @@ Best regards,
         resume_context: str,
         job_title: str,
         job_company: str,
-        user_preferences: Optional[Dict[str, Any]] = None
-    ) -> dict:
+        user_preferences: Optional[Dict[str, Any]] = None,
+        hints: Optional[List[Optional[str]]] = None,
+        job_description: str = ""
+    ) -> List[str]:
         """
         Answer ALL questions in ONE LLM call - 80% cost reduction.
         
@@ -291,17 +564,35 @@ Best regards,
             job_title: Job title being applied for
             job_company: Company name
             user_preferences: User preferences dict with current_salary, desired_salary, etc.
+            hints: Optional ANSWER_HINTS key per question ("headline", "summary",
+                "cover_letter") for answers that need a specific style/length
+            job_description: Job description, included when a cover letter is requested
             
         Returns:
-            Dict mapping question index to answer
+            List of answers aligned with questions ("" where the LLM gave none)
         """
         if not questions:
-            return {}
+            return []
         
         user_preferences = user_preferences or {}
+        hints = hints or [None] * len(questions)
+        
+        # Format questions with numbers (plus a style note for long-form answers)
+        questions_text = "\n".join(
+            f"{i+1}. {q} [{self.ANSWER_HINTS[hint][0]}]" if hint in self.ANSWER_HINTS else f"{i+1}. {q}"
+            for i, (q, hint) in enumerate(zip(questions, hints))
+        )
+        max_tokens = min(
+            sum(
+                self.ANSWER_HINTS[hint][1] if hint in self.ANSWER_HINTS else self.DEFAULT_ANSWER_TOKENS
+                for hint in hints
+            ) + self.TOKEN_BUDGETS["batch_overhead"],
+            self.TOKEN_BUDGETS["batch_max"]
+        )
         
-        # Format questions with numbers
-        questions_text = "\n".join(f"{i+1}. {q}" for i, q in enumerate(questions))
+        job_context = ""
+        if job_description and "cover_letter" in hints:
+            job_context = f"\n\nJOB DESCRIPTION:\n{job_description[:1500]}"
         
         # Build salary context from preferences
         salary_context = ""
@@ -316,7 +607,7 @@ Best regards,
         
         prompt = f"""You are filling out a job application form.
 
-JOB: {job_title} at {job_company}
+JOB: {job_title} at {job_company}{job_context}
 
 QUESTIONS TO ANSWER:
 {questions_text}
@@ -326,7 +617,7 @@ RESUME CONTEXT:
 
 INSTRUCTIONS:
 - Answer each question based on the resume context and user preferences
-- Keep answers SHORT (1-2 sentences max)
+- Keep answers SHORT (1-2 sentences max), unless the question has a [style note]; then follow it
 - For salary questions: Use the provided salary values if available
   * If current salary asked: Use "Current Salary: $X" or "$X"
   * If desired/expected salary asked: Use "Desired Salary: $X" or "$X"
@@ -340,67 +631,131 @@ INSTRUCTIONS:
 Return JSON only: {{"1": "answer1", "2": "answer2", ...}}
 No explanations, just the JSON object."""
 
-        result = await self._call_llm(prompt, max_tokens=len(questions) * 60)
+        result = await self._call_llm(prompt, max_tokens=max_tokens)
         
         if not result:
             # Fallback to individual default answers
-            return {str(i+1): self._default_question_answer(q) for i, q in enumerate(questions)}
+            return [self._default_question_answer(q) for q in questions]
         
         try:
-            import json
-            import re
-            
             # Extract JSON from response
             json_match = re.search(r'\{[\s\S]*\}', result)
             if json_match:
                 answers = json.loads(json_match.group())
-                logger.info(f"Batch answered {len(answers)}/{len(questions)} questions")
-                return answers
-        except (json.JSONDecodeError, Exception) as e:
+                logger.info("Batch answered {}/{} questions", len(answers), len(questions))
+                # Keys are 1-based positions - convert once to a positional list
+                return [answers.get(str(i), "") for i in range(1, len(questions) + 1)]
+        except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse batch answers: {e}")
         
         # Fallback
-        return {str(i+1): self._default_question_answer(q) for i, q in enumerate(questions)}
+        return [self._default_question_answer(q) for q in questions]
 
+    async def batch_answer_questions_stream(
+        self,
+        questions: list,
+        resume_context: str,
+        job_title: str,
+        job_company: str,
+        user_preferences: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 4
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Answer questions in small concurrent batches, yielding as each completes.
+        
+        Splits the questions into chunks that are answered in parallel so the
+        first answers are available after one small LLM call instead of after
+        the whole form has been generated.
+        
+        Args:
+            questions: List of question strings
+            resume_context: Compressed resume context
+            job_title: Job title being applied for
+            job_company: Company name
+            user_preferences: User preferences dict (salary, gender, location)
+            chunk_size: Number of questions per LLM call
+            
+        Yields:
+            (question index, answer) tuples in completion order
+        """
+        if not questions:
+            return
+        
+        async def answer_chunk(start: int) -> Tuple[int, List[str]]:
+            chunk = questions[start:start + chunk_size]
+            answers = await self.batch_answer_questions(
+                questions=chunk,
+                resume_context=resume_context,
+                job_title=job_title,
+                job_company=job_company,
+                user_preferences=user_preferences
+            )
+            return start, answers
+        
+        tasks = [
+            asyncio.create_task(answer_chunk(start))
+            for start in range(0, len(questions), chunk_size)
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                start, answers = await next_done
+                for offset, answer in enumerate(answers):
+                    yield start + offset, answer
+        finally:
+            # Consumer stopped early - don't leave LLM calls running
+            for task in tasks:
+                task.cancel()
 
-# Field pattern detection for form filling
+
+# Field pattern detection for form filling (immutable - compiled into _FIELD_TYPE_MATCHERS)
 FIELD_PATTERNS = {
     # Contact
-    "name": ["name", "full name", "your name", "candidate name"],
-    "email": ["email", "e-mail", "email address", "your email"],
-    "phone": ["phone", "mobile", "contact number", "telephone"],
-    "linkedin": ["linkedin", "profile url", "linkedin url"],
+    "name": ("name", "full name", "your name", "candidate name"),
+    "email": ("email", "e-mail", "email address", "your email"),
+    "phone": ("phone", "mobile", "contact number", "telephone"),
+    "linkedin": ("linkedin", "profile url", "linkedin url"),
     
     # Experience
-    "years_experience": ["years of experience", "how many years", "experience in", "years experience"],
-    "current_title": ["current title", "job title", "current role", "current position"],
-    "current_company": ["current company", "employer", "current employer", "organization"],
+    "years_experience": ("years of experience", "how many years", "experience in", "years experience"),
+    "current_title": ("current title", "job title", "current role", "current position"),
+    "current_company": ("current company", "employer", "current employer", "organization"),
     
     # Education
-    "degree": ["degree", "education level", "highest education", "qualification"],
-    "school": ["school", "university", "college", "institution"],
-    "gpa": ["gpa", "grade point", "academic score"],
+    "degree": ("degree", "education level", "highest education", "qualification"),
+    "school": ("school", "university", "college", "institution"),
+    "gpa": ("gpa", "grade point", "academic score"),
     
     # Work preferences
-    "salary": ["salary", "compensation", "pay", "expected salary", "salary expectation"],
-    "start_date": ["start date", "availability", "when can you start", "earliest start"],
-    "relocation": ["relocate", "relocation", "willing to move", "open to relocation"],
-    "remote": ["remote", "work from home", "hybrid", "remote work"],
-    "sponsorship": ["visa", "sponsorship", "work authorization", "legally authorized", "authorized to work"],
+    "salary": ("salary", "compensation", "pay", "expected salary", "salary expectation"),
+    "start_date": ("start date", "availability", "when can you start", "earliest start"),
+    "relocation": ("relocate", "relocation", "willing to move", "open to relocation"),
+    "remote": ("remote", "work from home", "hybrid", "remote work"),
+    "sponsorship": ("visa", "sponsorship", "work authorization", "legally authorized", "authorized to work"),
     
     # Long-form
-    "cover_letter": ["cover letter", "letter of interest", "introduction letter"],
-    "headline": ["headline", "professional headline", "tagline"],
-    "summary": ["summary", "about yourself", "tell us about", "describe yourself", "professional summary"],
-    "why_interested": ["why are you interested", "why this role", "why apply", "interest in this position"],
-    "strengths": ["strengths", "what makes you", "why should we hire", "unique qualifications"],
+    "cover_letter": ("cover letter", "letter of interest", "introduction letter"),
+    "headline": ("headline", "professional headline", "tagline"),
+    "summary": ("summary", "about yourself", "tell us about", "describe yourself", "professional summary"),
+    "why_interested": ("why are you interested", "why this role", "why apply", "interest in this position"),
+    "strengths": ("strengths", "what makes you", "why should we hire", "unique qualifications"),
 }
 
+# One compiled alternation per field type, built once at import; checked in
+# FIELD_PATTERNS order so the first matching type still wins
+_FIELD_TYPE_MATCHERS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (field_type, re.compile("|".join(map(re.escape, patterns))))
+    for field_type, patterns in FIELD_PATTERNS.items()
+)
+
 
+@lru_cache(maxsize=4096)
 def detect_field_type(label: str) -> Optional[str]:
     """
     Detect the field type from a form label.
     
+    Memoized: the same labels recur on almost every application form.
+    
     Args:
         label: The form field label text
         
@@ -409,9 +764,8 @@ def detect_field_type(label: str) -> Optional[str]:
     """
     label_lower = label.lower().strip()
     
-    for field_type, patterns in FIELD_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in label_lower:
-                return field_type
+    for field_type, matcher in _FIELD_TYPE_MATCHERS:
+        if matcher.search(label_lower):
+            return field_type
     
     return None
@@ -3,6 +3,7 @@ Form Schema Cache
 Cache form schemas by page hash - avoid re-extraction.
 Button location cache per domain.
 """
+from collections import OrderedDict
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -70,7 +71,8 @@ class FormSchemaCache:
         Args:
             max_cache_size: Max number of schemas to cache
         """
-        self._schema_cache: Dict[str, CachedSchema] = {}
+        # Insertion/access order doubles as LRU order
+        self._schema_cache: "OrderedDict[str, CachedSchema]" = OrderedDict()
         self._button_cache: Dict[str, ButtonLocations] = {}
         self._max_size = max_cache_size
         
@@ -92,6 +94,7 @@ class FormSchemaCache:
                 self._misses += 1
                 return None
             
+            self._schema_cache.move_to_end(page_hash)
             cached.hit_count += 1
             self._hits += 1
             logger.debug(f"Cache HIT for hash {page_hash[:8]}... (hits: {cached.hit_count})")
@@ -118,10 +121,6 @@ class FormSchemaCache:
             has_submit: Whether page has submit button
             source: Where fields came from ("dom" or "vision")
         """
-        # Evict oldest if at capacity
-        if len(self._schema_cache) >= self._max_size:
-            self._evict_oldest()
-        
         self._schema_cache[page_hash] = CachedSchema(
             page_hash=page_hash,
             fields=fields,
@@ -129,19 +128,13 @@ class FormSchemaCache:
             has_submit=has_submit,
             source=source
         )
+        self._schema_cache.move_to_end(page_hash)
         
-        logger.debug(f"Cached schema {page_hash[:8]}... ({len(fields)} fields, source={source})")
-    
-    def _evict_oldest(self) -> None:
-        """Evict oldest cache entry"""
-        if not self._schema_cache:
-            return
+        # Evict least recently used if over capacity
+        if len(self._schema_cache) > self._max_size:
+            self._schema_cache.popitem(last=False)
         
-        oldest_hash = min(
-            self._schema_cache.keys(),
-            key=lambda h: self._schema_cache[h].created_at
-        )
-        del self._schema_cache[oldest_hash]
+        logger.debug(f"Cached schema {page_hash[:8]}... ({len(fields)} fields, source={source})")
     
     def get_button_locations(self, domain: str = "linkedin.com") -> ButtonLocations:
         """
@@ -0,0 +1,119 @@
+"""
+LLM Response Cache
+Cache LLM completions by (model, max_tokens, stop, prompt) hash - avoid repeat calls.
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from loguru import logger
+import hashlib
+import json
+
+
+@dataclass
+class CachedResponse:
+    """Cached LLM completion with metadata"""
+    key: str
+    response: str
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    hit_count: int = 0
+
+    def is_expired(self, max_age_hours: int = 24) -> bool:
+        """Check if cache entry is expired"""
+        age = datetime.utcnow() - self.created_at
+        return age > timedelta(hours=max_age_hours)
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache for LLM responses (LRU with TTL).
+
+    Benefits:
+    - Same prompt for the same job/candidate = cache hit
+    - Zero network round-trips and zero tokens on repeats
+    """
+
+    def __init__(self, max_cache_size: int = 1000, max_age_hours: int = 24):
+        """
+        Initialize cache.
+
+        Args:
+            max_cache_size: Max number of responses to cache
+            max_age_hours: Age after which an entry is treated as a miss
+        """
+        self._cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._max_size = max_cache_size
+        self._max_age_hours = max_age_hours
+
+        # Stats
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, prompt: str, stop: Optional[Sequence[str]] = None) -> str:
+        """Hash the request parameters that determine the response"""
+        stop_part = json.dumps(list(stop)) if stop else ""
+        return hashlib.sha256(f"{model}|{max_tokens}|{stop_part}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached response by key.
+
+        Returns None if not found or expired.
+        """
+        cached = self._cache.get(key)
+
+        if cached:
+            if cached.is_expired(self._max_age_hours):
+                del self._cache[key]
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            cached.hit_count += 1
+            self._hits += 1
+            logger.debug(f"LLM cache HIT for key {key[:8]}... (hits: {cached.hit_count})")
+            return cached.response
+
+        self._misses += 1
+        return None
+
+    def put(self, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entry at capacity"""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_size:
+            self._cache.popitem(last=False)
+
+        self._cache[key] = CachedResponse(key=key, response=response)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self._hits + self._misses
+        return {
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / max(total, 1),
+        }
+
+    def clear(self) -> None:
+        """Clear the cache"""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# Global cache instance (singleton pattern)
+_global_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get global LLM response cache"""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = LLMResponseCache()
+    return _global_cache
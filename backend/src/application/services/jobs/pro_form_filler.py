@@ -297,7 +297,7 @@ class ProFormFiller:
             
             # Log batch cost (estimate)
             input_tokens = len(context.split()) + sum(len(q.split()) for q in question_labels)
-            output_tokens = sum(len(str(a).split()) for a in batch_answers.values())
+            output_tokens = sum(len(str(a).split()) for a in batch_answers)
             self.cost_tracker.log_call(
                 model="gpt-4o-mini",
                 input_tokens=input_tokens * 2,  # Rough token estimate
@@ -306,8 +306,7 @@ class ProFormFiller:
             )
             
             # Map answers back to fields
-            for i, (label, field) in enumerate(questions_for_llm):
-                answer_text = batch_answers.get(str(i + 1), "")
+            for (label, field), answer_text in zip(questions_for_llm, batch_answers):
                 if answer_text:
                     answers[label] = FieldAnswer(
                         question=label,
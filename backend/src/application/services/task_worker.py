@@ -348,7 +348,8 @@ class TaskWorker:
             await queue_repo.update_progress(task_id, "Checking for existing jobs")
             await session.commit()
             
-            existing_ids = await job_repo.get_all_external_ids_by_platform("linkedin")
+            # Mutable copy - newly saved IDs are added below
+            existing_ids = set(await job_repo.get_all_external_ids_by_platform("linkedin"))
             logger.info(f"📊 Found {len(existing_ids)} existing jobs in database")
             
             # Prepare AI match service
@@ -460,10 +461,11 @@ class TaskWorker:
                             match_score = None
                             if ai_match_service and resume_text:
                                 try:
-                                    match_score = await ai_match_service.calculate_match_score(
-                                        job_description=job_data.get("description", ""),
-                                        resume_text=resume_text
-                                    )
+                                    # Score the entity returned by create() - no re-fetch needed
+                                    match_score = (await ai_match_service.calculate_match_score(
+                                        resume_text,
+                                        saved_job
+                                    )).value
                                     logger.debug(f"Match score for {job_entity.title}: {match_score}")
                                 except Exception as e:
                                     logger.warning(f"Failed to calculate match score: {e}")
@@ -35,6 +35,7 @@ class JobListingModel(Base):
     # Description
     description = Column(Text, nullable=True)
     description_html = Column(Text, nullable=True)  # HTML version of description
+    description_sha1 = Column(String(40), nullable=True, index=True)  # SHA-1 hex of description (content dedup)
     
     # LinkedIn-specific fields
     apply_link = Column(String(1000), nullable=True)  # Direct apply link
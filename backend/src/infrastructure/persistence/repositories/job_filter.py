@@ -5,7 +5,7 @@ Handles database operations for filter audit trail
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
@@ -98,6 +98,50 @@ class JobFilterRepository:
         logger.info(f"Created {len(records)} filter audit records for user {user_id}")
         return records
     
+    async def insert_bulk(
+        self,
+        user_id: UUID,
+        filters: List[dict],
+        task_id: Optional[UUID] = None,
+        search_url: Optional[str] = None,
+        job_title: Optional[str] = None
+    ) -> int:
+        """
+        Insert multiple filter audit records with a single INSERT statement.
+        
+        Unlike create_bulk, no ORM instances are built or returned - use this
+        for write-only audit trails.
+        
+        Args:
+            user_id: User UUID
+            filters: List of dicts with 'filter_name', 'filter_value', 'verified' keys
+            task_id: Optional task ID
+            search_url: Optional search URL
+            job_title: Optional job title
+            
+        Returns:
+            Number of records inserted
+        """
+        if not filters:
+            return 0
+        
+        await self.session.execute(
+            insert(JobFilterModel).values([
+                {
+                    "user_id": user_id,
+                    "filter_name": filter_data.get("filter_name"),
+                    "filter_value": filter_data.get("filter_value"),
+                    "task_id": task_id,
+                    "search_url": search_url,
+                    "job_title": job_title,
+                    "verified": filter_data.get("verified", "pending"),
+                }
+                for filter_data in filters
+            ])
+        )
+        logger.info(f"Inserted {len(filters)} filter audit records for user {user_id}")
+        return len(filters)
+    
     async def update_verification_status(
         self,
         filter_id: UUID,
@@ -1,15 +1,21 @@
 """
 JobListing Repository Implementation
 """
-from typing import Optional, List, Any
+import hashlib
+from typing import Optional, List, Any, FrozenSet
 from uuid import UUID
-from sqlalchemy import select, or_, and_
+from sqlalchemy import select, or_, and_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.logging_config import logger
 from infrastructure.persistence.models.job_listing import JobListingModel
 from domain.entities.job_listing import JobListing
 from datetime import datetime
 
+def hash_description(description: Optional[str]) -> str:
+    """SHA-1 hex digest of a job description, stored in description_sha1 for content dedup"""
+    return hashlib.sha1((description or "").encode("utf-8", "ignore")).hexdigest()
+
+
 class JobListingRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -141,17 +147,75 @@ class JobListingRepository:
         )
         return result.scalar_one_or_none() is not None
     
+    async def check_duplicate(
+        self,
+        external_id: str,
+        url: Optional[str] = None,
+        title: Optional[str] = None,
+        company: Optional[str] = None,
+        description_hash: Optional[str] = None,
+        platform: str = "linkedin"
+    ) -> bool:
+        """
+        Check external_id, URL and content duplicates in a single round-trip.
+        
+        Combines exists_by_external_id, exists_by_url and find_duplicate_by_content
+        into one SELECT EXISTS(... OR ...) query.
+        
+        Args:
+            external_id: LinkedIn job ID
+            url: Normalized job URL (query parameters removed)
+            title: Job title (case-insensitive match)
+            company: Company name (case-insensitive match)
+            description_hash: hash_description() of the job description
+            platform: Job platform (default: "linkedin")
+            
+        Returns:
+            True if any duplicate exists, False otherwise
+        """
+        conditions = [JobListingModel.external_id == external_id]
+        if url:
+            conditions.append(JobListingModel.url == url)
+        if title and company:
+            conditions.append(
+                and_(
+                    JobListingModel.description_sha1 == (description_hash or hash_description("")),
+                    JobListingModel.title.ilike(title.strip()),
+                    JobListingModel.company.ilike(company.strip())
+                )
+            )
+        
+        result = await self.session.execute(
+            select(
+                exists().where(
+                    and_(
+                        JobListingModel.platform == platform,
+                        or_(*conditions)
+                    )
+                )
+            )
+        )
+        return bool(result.scalar())
+    
     async def find_duplicate_by_content(self, title: str, company: str, description: str, platform: str = "linkedin") -> Optional[JobListing]:
         """
         Find duplicate job by matching title, company, and description.
         
+        Thin wrapper around find_duplicate_by_hash that hashes the description.
+        """
+        return await self.find_duplicate_by_hash(title, company, hash_description(description), platform)
+    
+    async def find_duplicate_by_hash(self, title: str, company: str, description_hash: str, platform: str = "linkedin") -> Optional[JobListing]:
+        """
+        Find duplicate job by matching title, company, and description.
+        
         This prevents semantic duplicates where the same job appears with different external_ids.
         Useful for catching jobs that are reposted or have multiple IDs.
         
         Args:
             title: Job title (exact match, case-insensitive)
             company: Company name (exact match, case-insensitive)
-            description: Job description (exact match)
+            description_hash: hash_description() of the job description (indexed)
             platform: Job platform (default: "linkedin")
             
         Returns:
@@ -169,9 +233,9 @@ class JobListingRepository:
                 select(JobListingModel).where(
                     and_(
                         JobListingModel.platform == platform,
+                        JobListingModel.description_sha1 == description_hash,
                         JobListingModel.title.ilike(title),
-                        JobListingModel.company.ilike(company),
-                        JobListingModel.description == description
+                        JobListingModel.company.ilike(company)
                     )
                 ).order_by(JobListingModel.created_at.desc())
             )
@@ -181,18 +245,23 @@ class JobListingRepository:
             logger.warning(f"Error checking for content duplicate: {e}")
             return None
     
-    async def get_all_external_ids_by_platform(self, platform: str) -> set:
-        """Get all external IDs for a platform (for efficient duplicate detection)."""
+    async def get_all_external_ids_by_platform(self, platform: str) -> FrozenSet[str]:
+        """
+        Get all external IDs for a platform (for efficient duplicate detection).
+        
+        Rows are streamed through a server-side cursor and added to the set as
+        they arrive, so the full result is never materialized as a list first.
+        """
         try:
-            result = await self.session.execute(
-                select(JobListingModel.external_id).where(
-                    JobListingModel.platform == platform
-                )
+            result = await self.session.stream(
+                select(JobListingModel.external_id)
+                .where(JobListingModel.platform == platform)
+                .execution_options(yield_per=10_000)
             )
-            return {row[0] for row in result.fetchall() if row[0]}
+            return frozenset([external_id async for external_id in result.scalars() if external_id])
         except Exception as e:
             logger.warning(f"Failed to get existing external IDs: {e}")
-            return set()
+            return frozenset()
 
     async def update_last_seen(self, job_id: UUID) -> None:
         result = await self.session.execute(
@@ -233,6 +302,7 @@ class JobListingRepository:
             company=entity.company,
             location=entity.location,
             description=entity.description,
+            description_sha1=hash_description(entity.description),
             url=entity.url,
             salary_min=entity.salary_range.min_salary if entity.salary_range else getattr(entity, "salary_min", None),
             salary_max=entity.salary_range.max_salary if entity.salary_range else getattr(entity, "salary_max", None),
@@ -2,7 +2,8 @@
 AIMatchService Implementation
 Calculates AI-powered job match scores using sentence embeddings
 """
-from typing import List, Dict
+import asyncio
+from typing import List, Dict, Optional
 from uuid import UUID
 import numpy as np
 from sentence_transformers import SentenceTransformer
@@ -81,7 +82,8 @@ class AIMatchService(IAIMatchService):
     async def batch_calculate_scores(
         self,
         resume_text: str,
-        jobs: List[JobListing]
+        jobs: List[JobListing],
+        user_id: Optional[UUID] = None
     ) -> Dict[UUID, MatchScore]:
         """
         Calculate match scores for multiple jobs (optimized)
@@ -89,6 +91,7 @@ class AIMatchService(IAIMatchService):
         Args:
             resume_text: Parsed resume text
             jobs: List of Job entities
+            user_id: Optional user ID - reuses the embedding from cache_resume_embedding
             
         Returns:
             Dict mapping job_id to MatchScore
@@ -97,12 +100,17 @@ class AIMatchService(IAIMatchService):
             if not jobs:
                 return {}
             
-            # Generate resume embedding once
-            resume_embedding = self.model.encode(resume_text, convert_to_numpy=True)
+            # Generate resume embedding once (or reuse the cached one)
+            resume_embedding = self.get_cached_resume_embedding(user_id) if user_id else None
+            if resume_embedding is None:
+                resume_embedding = self.model.encode(resume_text, convert_to_numpy=True)
             
-            # Generate job texts and embeddings in batch
+            # Generate job texts and embeddings in batch (off the event loop, so
+            # callers can overlap scoring with their own I/O)
             job_texts = [self._create_job_text(job) for job in jobs]
-            job_embeddings = self.model.encode(job_texts, convert_to_numpy=True, show_progress_bar=False)
+            job_embeddings = await asyncio.to_thread(
+                self.model.encode, job_texts, convert_to_numpy=True, show_progress_bar=False
+            )
             
             # Calculate cosine similarities
             similarities = cosine_similarity(
@@ -4,12 +4,25 @@ Manages real-time job discovery streaming via Server-Sent Events (SSE)
 Handles broadcasting newly discovered jobs to connected clients
 """
 import asyncio
-from typing import Dict, Set, Callable, Optional, Union
-from dataclasses import dataclass
+import json
+from typing import Dict, List, Set, Callable, Optional, Union
+from dataclasses import dataclass, field
 from loguru import logger
 
 
-@dataclass
+# Completion marker sent when the stream ends
+_SSE_COMPLETED = b"data: {'status': 'completed'}\n\n"
+
+
+def _encode_sse(data: str, event: Optional[str] = None) -> bytes:
+    """Frame SSE data (with an optional event name) as UTF-8 bytes ready to write to the socket"""
+    frame = b"data: " + data.encode("utf-8") + b"\n\n"
+    if event:
+        frame = b"event: " + event.encode("utf-8") + b"\n" + frame
+    return frame
+
+
+@dataclass(slots=True)
 class JobDiscoveryEvent:
     """A newly discovered job event to be streamed to clients"""
     job_id: str
@@ -22,11 +35,12 @@ class JobDiscoveryEvent:
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
     match_score: Optional[float] = None
+    # Serialized SSE frame, built once on first send
+    _sse_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_sse_data(self) -> str:
-        """Convert to SSE data format"""
-        import json
-        data = {
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict"""
+        return {
             "job_id": self.job_id,
             "title": self.title,
             "company": self.company,
@@ -38,19 +52,50 @@ class JobDiscoveryEvent:
             "salary_max": self.salary_max,
             "match_score": self.match_score,
         }
-        return json.dumps(data)
+    
+    def to_sse_data(self) -> str:
+        """Convert to SSE data format"""
+        return json.dumps(self.to_dict())
+    
+    def to_sse_bytes(self) -> bytes:
+        """Framed SSE bytes, serialized once and reused for every send"""
+        if self._sse_bytes is None:
+            self._sse_bytes = _encode_sse(self.to_sse_data())
+        return self._sse_bytes
 
 
-@dataclass
+@dataclass(slots=True)
+class JobBatchEvent:
+    """
+    Several newly discovered jobs sent as one SSE event.
+    
+    Framed as a named `event: jobs` whose data is a JSON array of job objects,
+    so clients can tell it apart from unnamed single-job/status messages.
+    """
+    jobs: List[JobDiscoveryEvent]
+    _sse_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_sse_data(self) -> str:
+        """Convert to SSE data format"""
+        return json.dumps([job.to_dict() for job in self.jobs])
+    
+    def to_sse_bytes(self) -> bytes:
+        """Framed SSE bytes, serialized once and reused for every send"""
+        if self._sse_bytes is None:
+            self._sse_bytes = _encode_sse(self.to_sse_data(), event="jobs")
+        return self._sse_bytes
+
+
+@dataclass(slots=True)
 class StreamStatusEvent:
     """Status or notification event (errors, warnings, no jobs found, etc.)"""
     type: str  # 'error', 'warning', 'no_jobs', 'info'
     message: str
     data: Optional[dict] = None
+    _sse_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def to_sse_data(self) -> str:
         """Convert to SSE data format"""
-        import json
         event_data = {
             "type": self.type,
             "message": self.message,
@@ -58,6 +103,12 @@ class StreamStatusEvent:
         if self.data:
             event_data["data"] = self.data
         return json.dumps(event_data)
+    
+    def to_sse_bytes(self) -> bytes:
+        """Framed SSE bytes, serialized once and reused for every send"""
+        if self._sse_bytes is None:
+            self._sse_bytes = _encode_sse(self.to_sse_data())
+        return self._sse_bytes
 
 
 class JobStreamManager:
@@ -79,9 +130,15 @@ class JobStreamManager:
         await manager.complete_stream(session_id)
     """
     
+    # Per-session queue bound - slow clients lose the oldest events instead
+    # of growing memory without limit
+    MAX_QUEUE_SIZE = 500
+    
     def __init__(self):
         # Maps session_id -> queue of events waiting to be sent
         self._queues: Dict[str, asyncio.Queue] = {}
+        # Maps session_id -> number of events dropped because the queue was full
+        self._dropped: Dict[str, int] = {}
         # Maps session_id -> stream completion flag
         self._completed: Dict[str, bool] = {}
         # Maps session_id -> active flag (client still connected)
@@ -90,16 +147,16 @@ class JobStreamManager:
     async def subscribe(self, session_id: str):
         """
         Subscribe to job discovery events for a session.
-        Yields SSE-formatted data for each new job discovered.
+        Yields framed SSE bytes for each new job discovered.
         Closes when complete_stream() is called.
         
         Usage in FastAPI endpoint:
             async def stream_jobs(session_id: str):
-                async for event_data in manager.subscribe(session_id):
-                    yield f"data: {event_data}\n\n"
+                async for frame in manager.subscribe(session_id):
+                    yield frame
         """
         # Initialize queue for this session
-        self._queues[session_id] = asyncio.Queue()
+        self._queues[session_id] = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
         self._completed[session_id] = False
         self._active[session_id] = True
         
@@ -111,19 +168,18 @@ class JobStreamManager:
                 if self._completed[session_id]:
                     logger.info(f"✅ Job stream completed for session: {session_id}")
                     # Send completion marker
-                    yield f"data: {{'status': 'completed'}}\n\n"
+                    yield _SSE_COMPLETED
                     break
                 
                 # Wait for next event with timeout to check completion status
                 try:
-                    event: Union[JobDiscoveryEvent, StreamStatusEvent] = await asyncio.wait_for(
+                    event: Union[JobDiscoveryEvent, JobBatchEvent, StreamStatusEvent] = await asyncio.wait_for(
                         self._queues[session_id].get(),
                         timeout=30.0  # 30 second timeout
                     )
                     
-                    # Yield the event data in SSE format
-                    event_data = event.to_sse_data()
-                    yield f"data: {event_data}\n\n"
+                    # Yield the pre-framed SSE bytes (serialized once per event)
+                    yield event.to_sse_bytes()
                     
                 except asyncio.TimeoutError:
                     # Check if still active
@@ -141,31 +197,60 @@ class JobStreamManager:
         Publish a newly discovered job to the stream.
         Non-blocking - queues the event for the client to receive.
         """
-        if session_id not in self._queues:
-            logger.warning(f"⚠️  Session {session_id} not subscribed, creating queue")
-            self._queues[session_id] = asyncio.Queue()
-            self._completed[session_id] = False
-            self._active[session_id] = True
+        self._ensure_session(session_id)
         
         if self._active[session_id]:
-            await self._queues[session_id].put(job)
+            self._enqueue(session_id, job)
             logger.debug(f"📤 Published job to session {session_id}: {job.title}")
     
+    async def publish_jobs(self, session_id: str, jobs: List[JobDiscoveryEvent]):
+        """
+        Publish several newly discovered jobs as a single SSE event.
+        The client receives an `event: jobs` frame whose `data:` line holds a
+        JSON array of jobs (EventSource clients need addEventListener("jobs")).
+        """
+        if not jobs:
+            return
+        
+        self._ensure_session(session_id)
+        
+        if self._active[session_id]:
+            self._enqueue(session_id, JobBatchEvent(jobs=jobs))
+            logger.debug(f"📤 Published {len(jobs)} jobs to session {session_id}")
+    
     async def send_event(self, session_id: str, event: StreamStatusEvent):
         """
         Send a status/notification event to the stream.
         Used for errors, warnings, no jobs found, etc.
         Non-blocking - queues the event for the client to receive.
         """
+        self._ensure_session(session_id)
+        
+        if self._active[session_id]:
+            self._enqueue(session_id, event)
+            logger.debug(f"📤 Sent {event.type} event to session {session_id}: {event.message}")
+    
+    def _ensure_session(self, session_id: str):
+        """Create queue and flags for a session that has no subscriber yet"""
         if session_id not in self._queues:
             logger.warning(f"⚠️  Session {session_id} not subscribed, creating queue")
-            self._queues[session_id] = asyncio.Queue()
+            self._queues[session_id] = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
             self._completed[session_id] = False
             self._active[session_id] = True
-        
-        if self._active[session_id]:
-            await self._queues[session_id].put(event)
-            logger.debug(f"📤 Sent {event.type} event to session {session_id}: {event.message}")
+    
+    def _enqueue(self, session_id: str, event):
+        """Queue an event, dropping the oldest one if the client is too slow"""
+        queue = self._queues[session_id]
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(event)
+            self._dropped[session_id] = self._dropped.get(session_id, 0) + 1
+    
+    def get_dropped_count(self, session_id: str) -> int:
+        """Number of events dropped for a session because its queue was full"""
+        return self._dropped.get(session_id, 0)
     
     async def complete_stream(self, session_id: str):
         """
@@ -190,6 +275,8 @@ class JobStreamManager:
             del self._completed[session_id]
         if session_id in self._active:
             del self._active[session_id]
+        if session_id in self._dropped:
+            del self._dropped[session_id]
         logger.info(f"🧹 Cleaned up job stream session: {session_id}")
 
 
@@ -11,6 +11,7 @@ Run locally for development with:
 Keep application logic in `presentation`, `core`, and
 `infrastructure` to preserve a clean architecture.
 """
+import asyncio
 import sys
 from contextlib import asynccontextmanager
 
@@ -58,12 +59,22 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("✅ Database initialized")
     
+    # Pre-warm the OpenRouter connection in the background - never delays startup
+    from application.services.jobs.form_answer_generator import FormAnswerGenerator
+    warmup_task = asyncio.create_task(FormAnswerGenerator.warmup())
+    
     yield
     
     # Shutdown
     logger.info("👋 Shutting down gracefully...")
     await close_db()
     logger.info("✅ Database connections closed")
+    
+    from application.services.jobs.easy_apply_automation import close_driver_pool
+    close_driver_pool()
+    
+    warmup_task.cancel()
+    await FormAnswerGenerator.aclose()
 
 
 # Initialize FastAPI app
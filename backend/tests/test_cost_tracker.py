@@ -0,0 +1,60 @@
+"""
+Tests for API cost tracking
+"""
+from datetime import timedelta
+
+import pytest
+
+from application.services.jobs.cost_tracker import CostTracker
+
+
+class TestCostTracker:
+    """Test running cost aggregates and daily spend rollover"""
+
+    @pytest.fixture
+    def tracker(self):
+        return CostTracker(budget_per_job=1.0, daily_budget=5.0)
+
+    def test_calculate_cost_uses_model_rates(self, tracker):
+        """Known models use their rates, unknown ones the default"""
+        assert tracker.log_call("gpt-4o-mini", 1000, 1000) == pytest.approx(0.00075)
+        assert tracker.log_call("unknown-model", 1000, 1000) == pytest.approx(0.003)
+
+    def test_get_stats_aggregates(self, tracker):
+        """Stats reflect every logged call and finished job"""
+        tracker.start_job("job-1", "Engineer", "Acme")
+        tracker.log_call("gpt-4o-mini", 1000, 0, purpose="vision")
+        tracker.log_call("gpt-4o-mini", 0, 1000, purpose="batch")
+        report = tracker.finish_job(success=True)
+
+        tracker.start_job("job-2")
+        tracker.log_call("gpt-4o", 1000, 0)
+        tracker.finish_job(success=False)
+
+        assert report.api_calls == 2
+        assert report.vision_calls == 1
+        assert report.total_cost == pytest.approx(0.00075)
+
+        stats = tracker.get_stats()
+        assert stats["session"]["jobs_attempted"] == 2
+        assert stats["session"]["jobs_successful"] == 1
+        assert stats["session"]["jobs_failed"] == 1
+        assert stats["session"]["api_calls"] == 3
+        assert stats["session"]["total_cost"] == pytest.approx(0.00575)
+        assert stats["costs"]["avg_cost_per_job"] == pytest.approx(0.00575 / 2)
+        assert stats["costs"]["avg_cost_per_success"] == pytest.approx(0.00075)
+        assert stats["costs"]["budget_remaining"] == pytest.approx(5.0 - 0.00575)
+        assert stats["efficiency"]["vision_calls"] == 1
+        assert stats["efficiency"]["batch_calls"] == 1
+        assert stats["efficiency"]["avg_tokens_per_call"] == pytest.approx(1000)
+
+    def test_daily_spend_resets_on_new_day(self, tracker):
+        """A call on a new day starts the daily spend over"""
+        tracker.log_call("gpt-4o", 1000, 0)
+        # Pretend the previous calls were logged yesterday
+        tracker._today -= timedelta(days=1)
+        assert tracker.daily_spend == 0.0
+
+        cost = tracker.log_call("gpt-4o-mini", 1000, 0)
+        assert tracker.daily_spend == pytest.approx(cost)
+        assert tracker.session_cost == pytest.approx(0.005 + cost)
@@ -0,0 +1,51 @@
+"""
+Tests for form field type detection
+"""
+import random
+
+import pytest
+
+from application.services.jobs.form_answer_generator import FIELD_PATTERNS, detect_field_type
+
+
+def reference_detect_field_type(label):
+    """Original nested-loop implementation: first type in FIELD_PATTERNS order wins"""
+    label_lower = label.lower().strip()
+    for field_type, patterns in FIELD_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in label_lower:
+                return field_type
+    return None
+
+
+class TestDetectFieldType:
+    """Test detect_field_type against the original first-match semantics"""
+
+    @pytest.mark.parametrize("label, expected", [
+        ("Your Name", "name"),
+        ("Email address", "email"),
+        ("Mobile phone number", "phone"),
+        ("How many years of experience do you have with Python?", "years_experience"),
+        ("Current company name", "name"),
+        ("Are you legally authorized to work in the US?", "sponsorship"),
+        ("Cover letter", "cover_letter"),
+        ("Favourite colour", None),
+        ("", None),
+    ])
+    def test_known_labels(self, label, expected):
+        """Common labels map to the expected type"""
+        assert detect_field_type(label) == expected
+
+    def test_multiline_label(self):
+        """Keywords after a newline are still found"""
+        assert detect_field_type("Tell us more\nabout your expected salary") == "salary"
+
+    def test_first_match_parity_with_original_loop(self):
+        """Random keyword mixes resolve to the same type as the original loop"""
+        rng = random.Random(1234)
+        words = [p for patterns in FIELD_PATTERNS.values() for p in patterns]
+        words += ["what", "is", "your", "please", "the", "\n", "?"]
+
+        for _ in range(5000):
+            label = " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+            assert detect_field_type(label) == reference_detect_field_type(label), label
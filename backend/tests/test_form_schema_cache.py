@@ -0,0 +1,58 @@
+"""
+Tests for the form schema cache
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from application.services.jobs.form_schema_cache import FormSchemaCache
+
+
+class TestFormSchemaCache:
+    """Test schema cache LRU order and expiry"""
+
+    @pytest.fixture
+    def cache(self):
+        return FormSchemaCache(max_cache_size=2)
+
+    def _cache(self, cache, page_hash):
+        cache.cache_schema(page_hash, fields=[], has_next=True, has_submit=False)
+
+    def test_hit_and_miss(self, cache):
+        """Cached schemas are returned with their hit count"""
+        assert cache.get_schema("page-a") is None
+        self._cache(cache, "page-a")
+
+        schema = cache.get_schema("page-a")
+        assert schema is not None
+        assert schema.hit_count == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        """A read refreshes an entry, so the untouched one is evicted"""
+        self._cache(cache, "page-a")
+        self._cache(cache, "page-b")
+        cache.get_schema("page-a")
+        self._cache(cache, "page-c")
+
+        assert cache.get_schema("page-b") is None
+        assert cache.get_schema("page-a") is not None
+        assert cache.get_schema("page-c") is not None
+
+    def test_recaching_existing_hash_does_not_evict(self, cache):
+        """Re-caching a hash at capacity replaces it in place"""
+        self._cache(cache, "page-a")
+        self._cache(cache, "page-b")
+        self._cache(cache, "page-a")
+
+        assert cache.stats["size"] == 2
+        assert cache.get_schema("page-b") is not None
+
+    def test_expired_schema_is_a_miss(self, cache):
+        """Schemas older than 24 hours are dropped on read"""
+        self._cache(cache, "page-a")
+        cache._schema_cache["page-a"].created_at = datetime.utcnow() - timedelta(hours=25)
+
+        assert cache.get_schema("page-a") is None
+        assert cache.stats["size"] == 0
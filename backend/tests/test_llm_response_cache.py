@@ -0,0 +1,73 @@
+"""
+Tests for the LLM response cache
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from application.services.jobs.llm_response_cache import LLMResponseCache
+
+
+class TestLLMResponseCache:
+    """Test LLM response cache hit/miss, TTL and LRU eviction"""
+
+    @pytest.fixture
+    def cache(self):
+        return LLMResponseCache(max_cache_size=2, max_age_hours=1)
+
+    def test_make_key_depends_on_all_parameters(self):
+        """Model, max_tokens, prompt and stop sequences each change the key"""
+        key = LLMResponseCache.make_key("gpt-4o-mini", 100, "prompt")
+        assert key == LLMResponseCache.make_key("gpt-4o-mini", 100, "prompt")
+        assert key != LLMResponseCache.make_key("gpt-4o", 100, "prompt")
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", 200, "prompt")
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", 100, "other prompt")
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", 100, "prompt", stop=["\n\n\n"])
+
+    def test_hit_and_miss(self, cache):
+        """Stored responses are returned and counted as hits"""
+        assert cache.get("a") is None
+        cache.put("a", "answer")
+        assert cache.get("a") == "answer"
+
+        stats = cache.stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_expired_entry_is_a_miss(self, cache):
+        """Entries older than max_age_hours are dropped on read"""
+        cache.put("a", "answer")
+        cache._cache["a"].created_at = datetime.utcnow() - timedelta(hours=2)
+
+        assert cache.get("a") is None
+        assert cache.stats["size"] == 0
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        """A read refreshes an entry, so the untouched one is evicted"""
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_replacing_a_key_does_not_evict(self, cache):
+        """Re-putting an existing key at capacity keeps the other entry"""
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.put("a", "updated")
+
+        assert cache.get("a") == "updated"
+        assert cache.get("b") == "2"
+
+    def test_clear(self, cache):
+        """clear() empties the cache and resets stats"""
+        cache.put("a", "1")
+        cache.get("a")
+        cache.clear()
+
+        assert cache.stats == {"size": 0, "max_size": 2, "hits": 0, "misses": 0, "hit_rate": 0.0}